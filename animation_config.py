@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Hashable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KenBurnsProfile:
     mode: str
     padding_seconds: float
@@ -56,6 +57,24 @@ _MODE_DEFAULTS: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# (KenBurnsProfile field, config key) pairs resolved by type.
+_FLOAT_FIELDS = (
+    ("padding_seconds", "padding_seconds"),
+    ("zoom", "ken_burns_zoom"),
+    ("offset", "ken_burns_offset"),
+    ("margin", "ken_burns_margin"),
+    ("motion_scale", "ken_burns_motion_scale"),
+    ("max_margin", "ken_burns_max_margin"),
+    ("pan_extent", "ken_burns_pan_extent"),
+    ("intro_relief", "ken_burns_intro_relief"),
+    ("intro_seconds", "ken_burns_intro_seconds"),
+)
+_BOOL_FIELDS = (("full_travel", "ken_burns_full_travel"),)
+
+_MERGED_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    mode: {**_COMMON_DEFAULTS, **mode_defaults} for mode, mode_defaults in _MODE_DEFAULTS.items()
+}
+
 
 def _to_float(value: Any, default: float) -> float:
     try:
@@ -64,48 +83,96 @@ def _to_float(value: Any, default: float) -> float:
         return default
 
 
+_BOOL_MAP: Dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+
+
 def _to_bool(value: Any, default: bool) -> bool:
-    if isinstance(value, bool):
+    # Identity checks first: bool is an int subclass and True/False are the common case.
+    if value is True or value is False:
         return value
     if isinstance(value, str):
-        lower = value.strip().lower()
-        if lower in {"true", "1", "yes", "on"}:
-            return True
-        if lower in {"false", "0", "no", "off"}:
-            return False
+        return _BOOL_MAP.get(value.strip().lower(), default)
     if isinstance(value, (int, float)):
         return bool(value)
     return default
 
 
+def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Merge ``source`` into ``target`` recursively, skipping ``None`` values.
+
+    Nested dicts in ``target`` are copied before being merged into so shared
+    defaults are never mutated.
+    """
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            nested = dict(current)
+            _deep_merge(nested, value)
+            target[key] = nested
+        elif value is not None:
+            target[key] = value
+
+
+class _FrozenDict(tuple):
+    """Hashable snapshot of a config mapping, used as an ``lru_cache`` key."""
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, _FrozenDict):
+        return {key: _thaw(item) for key, item in value}
+    return value
+
+
 def resolve_ken_burns_profile(animation_cfg: Dict[str, Any] | None) -> KenBurnsProfile:
+    """Resolve the Ken Burns profile; identical configs share one cached result."""
     cfg = animation_cfg if isinstance(animation_cfg, dict) else {}
+    try:
+        return _resolve_cached(_freeze(cfg))
+    except TypeError:
+        # Unhashable leaf values (e.g. sets) cannot be cache keys.
+        return _resolve(cfg)
+
+
+@lru_cache(maxsize=32)
+def _resolve_cached(frozen_cfg: Hashable) -> KenBurnsProfile:
+    return _resolve(_thaw(frozen_cfg))
+
+
+def _resolve(cfg: Dict[str, Any]) -> KenBurnsProfile:
     mode_value = cfg.get("mode", cfg.get("ken_burns_mode", "pan_only"))
     mode = str(mode_value).lower() if isinstance(mode_value, (str, bytes)) else "pan_only"
     if mode not in _MODE_DEFAULTS:
         mode = "pan_only"
 
-    merged: Dict[str, Any] = dict(_COMMON_DEFAULTS)
-    merged.update(_MODE_DEFAULTS.get(mode, {}))
+    defaults = _MERGED_DEFAULTS[mode]
+    merged: Dict[str, Any] = dict(defaults)
 
     nested_mode_cfg = cfg.get(mode)
     if isinstance(nested_mode_cfg, dict):
-        merged.update({k: v for k, v in nested_mode_cfg.items() if v is not None})
+        _deep_merge(merged, nested_mode_cfg)
 
     for key in _COMMON_DEFAULTS.keys():
         if key in cfg and cfg[key] is not None:
             merged[key] = cfg[key]
 
-    return KenBurnsProfile(
-        mode=mode,
-        padding_seconds=_to_float(merged.get("padding_seconds"), _COMMON_DEFAULTS["padding_seconds"]),
-        zoom=_to_float(merged.get("ken_burns_zoom"), _COMMON_DEFAULTS["ken_burns_zoom"]),
-        offset=_to_float(merged.get("ken_burns_offset"), _COMMON_DEFAULTS["ken_burns_offset"]),
-        margin=_to_float(merged.get("ken_burns_margin"), _COMMON_DEFAULTS["ken_burns_margin"]),
-        motion_scale=_to_float(merged.get("ken_burns_motion_scale"), _COMMON_DEFAULTS["ken_burns_motion_scale"]),
-        full_travel=_to_bool(merged.get("ken_burns_full_travel"), _COMMON_DEFAULTS["ken_burns_full_travel"]),
-        max_margin=_to_float(merged.get("ken_burns_max_margin"), _COMMON_DEFAULTS["ken_burns_max_margin"]),
-        pan_extent=_to_float(merged.get("ken_burns_pan_extent"), _COMMON_DEFAULTS["ken_burns_pan_extent"]),
-        intro_relief=_to_float(merged.get("ken_burns_intro_relief"), _COMMON_DEFAULTS["ken_burns_intro_relief"]),
-        intro_seconds=_to_float(merged.get("ken_burns_intro_seconds"), _COMMON_DEFAULTS["ken_burns_intro_seconds"]),
-    )
+    values: Dict[str, Any] = {field: _to_float(merged[key], defaults[key]) for field, key in _FLOAT_FIELDS}
+    for field, key in _BOOL_FIELDS:
+        values[field] = _to_bool(merged[key], defaults[key])
+    return KenBurnsProfile(mode=mode, **values)
@@ -1,12 +1,26 @@
 """Asset generation for long-form pipeline."""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import queue
+import string
+import struct
+import sys
+import threading
 import wave
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from types import TracebackType
+from typing import BinaryIO, Dict, List, Mapping, Optional, Tuple, Type
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from logging_utils import get_logger
 from PIL import Image
@@ -18,8 +32,62 @@ from timeline_builder import Scene, SceneChunk, SceneType
 from voicevox_client import VoicevoxClient
 from speech_sanitizer import sanitize_for_voicevox
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+_WAV_COPY_BLOCK_BYTES = 1 << 20
+_USE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+
+def _build_http_session() -> requests.Session:
+    session = requests.Session()
+    # Clients keep their own retry loops, so the adapter only pools connections.
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _encode_json(payload: object) -> bytes:
+    """Encode ``payload`` as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _dump_json(path: Path, payload: object) -> None:
+    data = _encode_json(payload)
+    with path.open("wb") as fh:
+        fh.write(data)
+
+
+def _write_metadata_loop(meta_queue: "queue.Queue[Optional[Tuple[Path, bytes]]]") -> None:
+    # Takes the queue rather than the pipeline so the thread does not keep it alive.
+    while True:
+        item = meta_queue.get()
+        if item is None:
+            return
+        path, data = item
+        try:
+            with path.open("wb") as fh:
+                fh.write(data)
+        except OSError as exc:
+            logger.error("Failed to write metadata %s: %s", path, exc)
+
+
+def _stop_metadata_writer(meta_queue: "queue.Queue[Optional[Tuple[Path, bytes]]]", thread: threading.Thread) -> None:
+    meta_queue.put(None)
+    thread.join()
+
+
+def _utc_timestamp() -> str:
+    """UTC ISO-8601 timestamp with millisecond precision, e.g. ``2024-01-01T00:00:00.000Z``."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
 
 @dataclass
 class NarrationSegment:
@@ -49,7 +117,7 @@ class PromptBuildResult:
     subject_original: Optional[str]
     subject_translated: Optional[str]
     template: Optional[str]
-    constants: Dict[str, str] = field(default_factory=dict)
+    constants: Mapping[str, str] = field(default_factory=dict)
 
 
 class AssetPipeline:
@@ -63,9 +131,12 @@ class AssetPipeline:
     ) -> None:
         self.run_dir = run_dir
         self.config = config
-        self.voice_client = VoicevoxClient(config)
-        self.image_client = make_image_client(config)
+        # One keep-alive pool shared by the VOICEVOX and image provider clients.
+        self._http_session = _build_http_session()
+        self.voice_client = VoicevoxClient(config, session=self._http_session)
+        self.image_client = make_image_client(config, session=self._http_session)
         self.translator = PromptTranslator(config)
+        self.voice_concurrency = self._resolve_voice_concurrency(config)
 
         logger.info("Image provider client initialised: %s", type(self.image_client).__name__)
 
@@ -86,6 +157,8 @@ class AssetPipeline:
             self.prompt_template = template_text if template_text else None
         else:
             self.prompt_template = None
+        self._prompt_formatter = string.Formatter()
+        self._prompt_parts = self._parse_prompt_template(self.prompt_template)
 
         if isinstance(constants_raw, dict):
             self.prompt_constants = {
@@ -95,6 +168,8 @@ class AssetPipeline:
             }
         else:
             self.prompt_constants = {}
+        # Read-only view handed to every PromptBuildResult instead of a fresh copy.
+        self._prompt_constants_view: Mapping[str, str] = MappingProxyType(self.prompt_constants)
 
         self.audio_dir = run_dir / "audio"
         self.image_dir = run_dir / "images"
@@ -104,34 +179,72 @@ class AssetPipeline:
         self.image_dir.mkdir(parents=True, exist_ok=True)
         self.chunk_dir.mkdir(parents=True, exist_ok=True)
 
+        self._translation_cache: Dict[str, str] = {}
         self._image_cache: Dict[str, Path] = {}
+        self._image_prompt_keys: Dict[str, str] = {}
         self._failed_image_targets: Dict[str, Path] = {}
         self._successful_images: List[Path] = []
+        self._image_cache_path = self.image_dir / "_image_cache.json"
+        self._load_image_cache_index()
+
+        # Metadata JSON is only read after the run, so a writer thread keeps disk I/O
+        # off the scene-preparation path. close() drains it; the finalizer also runs
+        # at interpreter exit or garbage collection if close() is never reached.
+        self._meta_queue: "queue.Queue[Optional[Tuple[Path, bytes]]]" = queue.Queue()
+        self._meta_thread = threading.Thread(
+            target=_write_metadata_loop,
+            args=(self._meta_queue,),
+            name="asset-metadata-writer",
+            daemon=True,
+        )
+        self._meta_thread.start()
+        self._meta_finalizer = weakref.finalize(self, _stop_metadata_writer, self._meta_queue, self._meta_thread)
+
+    def warm_translation_cache(self, scenes: List[Scene]) -> None:
+        """Translate every content scene's focus text up front in batched requests."""
+        # Insertion-ordered set: the dict keeps the batch order, membership stays O(1).
+        pending: Dict[str, None] = {}
+        for scene in scenes:
+            if scene.scene_type is not SceneType.CONTENT:
+                continue
+            original = (scene.primary_prompt or scene.image_prompt or "").strip()
+            if original and original not in self._translation_cache:
+                pending[original] = None
+        if not pending:
+            return
+        originals = list(pending)
+
+        translations = self.translator.translate_many(originals)
+        for original, translated in zip(originals, translations):
+            self._translation_cache[original] = translated.strip()
+        logger.info("Prepared prompt translations for %d scene subject(s)", len(originals))
 
     def prepare_scene_assets(self, scene: Scene) -> GeneratedAssets:
+        """Synthesize narration and fetch the image for one scene.
+
+        The returned metadata/prompt JSON paths are written in the background and
+        exist once close() has returned.
+        """
         narration_path = self.audio_dir / f"{scene.scene_id}.wav"
-        segments = self._synthesize_scene_audio(scene, narration_path)
+        generated_at = _utc_timestamp()
 
         image_path: Optional[Path] = None
         prompt_path: Optional[Path] = None
         prompt_text: Optional[str] = None
-        prompt_result: Optional[PromptBuildResult] = None
         if scene.scene_type is SceneType.CONTENT:
-            prompt_source = scene.primary_prompt or scene.image_prompt
-            prompt_result = self._compose_prompt(prompt_source)
-            if prompt_result:
-                prompt_text = prompt_result.prompt
-                image_path = self._get_or_create_image(scene.scene_id, prompt_text)
-                prompt_path = self._write_prompt_metadata(
-                    scene.scene_id,
-                    prompt_result,
-                    scene.image_prompt,
-                )
+            # Narration and image generation hit independent services; overlap them.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                audio_future = executor.submit(self._synthesize_scene_audio, scene, narration_path)
+                image_future = executor.submit(self._prepare_image, scene, generated_at)
+                segments = audio_future.result()
+                image_path, prompt_path, prompt_text = image_future.result()
+        else:
+            segments = self._synthesize_scene_audio(scene, narration_path)
 
         total_duration = segments[-1].start_offset + segments[-1].duration if segments else 0.0
         narration_metadata = {
             "scene_id": scene.scene_id,
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": generated_at,
             "total_duration_seconds": total_duration,
             "segments": [
                 {
@@ -144,7 +257,7 @@ class AssetPipeline:
             ],
         }
         metadata_path = self.audio_dir / f"{scene.scene_id}.json"
-        metadata_path.write_text(json.dumps(narration_metadata, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._queue_json(metadata_path, narration_metadata)
 
         return GeneratedAssets(
             narration_path=narration_path,
@@ -157,14 +270,37 @@ class AssetPipeline:
             scene_id=scene.scene_id,
         )
 
+    def close(self) -> None:
+        """Flush pending metadata writes and release HTTP connections."""
+        if not self._meta_finalizer.alive:
+            return
+        self._meta_finalizer()
+        self._http_session.close()
+
+    def __enter__(self) -> "AssetPipeline":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Metadata helpers
+    # ------------------------------------------------------------------
+
+    def _queue_json(self, path: Path, payload: object) -> None:
+        self._meta_queue.put((path, _encode_json(payload)))
+
     # ------------------------------------------------------------------
     # Audio helpers
     # ------------------------------------------------------------------
 
     def _synthesize_scene_audio(self, scene: Scene, output_path: Path) -> List[NarrationSegment]:
-        chunk_files: List[Path] = []
-        chunk_durations: List[float] = []
-
+        tasks: List[Tuple[int, str, Path]] = []
         for idx, chunk in enumerate(scene.chunks, start=1):
             text = sanitize_for_voicevox(chunk.text)
             if text != chunk.text:
@@ -174,26 +310,25 @@ class AssetPipeline:
                     text[:60],
                 )
             chunk_path = self.chunk_dir / f"{scene.scene_id}_{idx:02d}.wav"
-            audio_path, duration = self.voice_client.synthesize(text, chunk_path)
-            chunk_files.append(audio_path)
-            chunk_durations.append(duration)
+            tasks.append((idx, text, chunk_path))
+
+        # VOICEVOX round-trips are network bound, so keep several chunks in flight.
+        if len(tasks) > 1 and self.voice_concurrency > 1:
+            workers = min(self.voice_concurrency, len(tasks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._synthesize_chunk, tasks))
+        else:
+            results = [self._synthesize_chunk(task) for task in tasks]
+        results.sort(key=lambda item: item[0])
+
+        chunk_files: List[Path] = [audio_path for _, audio_path, _ in results]
+        chunk_durations: List[float] = [duration for _, _, duration in results]
 
         if not chunk_files:
             output_path.write_bytes(b"")
             return []
 
-        with wave.open(str(chunk_files[0]), "rb") as first_wave:
-            params = first_wave.getparams()
-            frames = [first_wave.readframes(first_wave.getnframes())]
-
-        for chunk_file in chunk_files[1:]:
-            with wave.open(str(chunk_file), "rb") as wav_file:
-                frames.append(wav_file.readframes(wav_file.getnframes()))
-
-        with wave.open(str(output_path), "wb") as out_wave:
-            out_wave.setparams(params)
-            for frame in frames:
-                out_wave.writeframes(frame)
+        _concat_wav_files(chunk_files, output_path)
 
         segments: List[NarrationSegment] = []
         current_offset = 0.0
@@ -210,24 +345,62 @@ class AssetPipeline:
 
         return segments
 
+    def _synthesize_chunk(self, task: Tuple[int, str, Path]) -> Tuple[int, Path, float]:
+        idx, text, chunk_path = task
+        audio_path, duration = self.voice_client.synthesize(text, chunk_path)
+        return idx, audio_path, duration
+
+    @staticmethod
+    def _resolve_voice_concurrency(config: Dict) -> int:
+        apis = config.get("apis", {}) if isinstance(config, dict) else {}
+        voice_cfg = apis.get("voicevox", {}) if isinstance(apis, dict) else {}
+        raw_value = voice_cfg.get("concurrency", 4) if isinstance(voice_cfg, dict) else 4
+        try:
+            return max(1, int(raw_value))
+        except (TypeError, ValueError):
+            logger.warning("Invalid VOICEVOX concurrency=%s; falling back to 4", raw_value)
+            return 4
+
     # ------------------------------------------------------------------
     # Image helpers
     # ------------------------------------------------------------------
 
+    def _prepare_image(
+        self,
+        scene: Scene,
+        generated_at: str,
+    ) -> Tuple[Optional[Path], Optional[Path], Optional[str]]:
+        prompt_source = scene.primary_prompt or scene.image_prompt
+        prompt_result = self._compose_prompt(prompt_source)
+        if not prompt_result:
+            return None, None, None
+
+        image_path = self._get_or_create_image(scene.scene_id, prompt_result.prompt)
+        prompt_path = self._write_prompt_metadata(
+            scene.scene_id,
+            prompt_result,
+            scene.image_prompt,
+            generated_at,
+        )
+        return image_path, prompt_path, prompt_result.prompt
+
     def _compose_prompt(self, focus_text: Optional[str]) -> Optional[PromptBuildResult]:
         original = (focus_text or "").strip()
 
         translated = ""
         if original:
-            translated = self.translator.translate(original).strip()
+            translated = self._translation_cache.get(original)
+            if translated is None:
+                translated = self.translator.translate(original).strip()
+                self._translation_cache[original] = translated
 
         normalized_subject = self._normalize_subject(translated) if translated else ""
 
         if self.prompt_template:
-            template_data: Dict[str, str] = dict(self.prompt_constants)
-            template_data.setdefault("subject", normalized_subject or self.base_prompt)
+            # A "subject" constant, when configured, takes precedence over the scene subject.
+            template_data: Dict[str, str] = {"subject": normalized_subject or self.base_prompt, **self.prompt_constants}
             try:
-                prompt_text = self.prompt_template.format(**template_data)
+                prompt_text = self._render_prompt(template_data)
             except KeyError as exc:
                 logger.error("Prompt template missing key %s; falling back to base prompt", exc)
                 prompt_text = self.base_prompt
@@ -236,7 +409,7 @@ class AssetPipeline:
                 subject_original=original or None,
                 subject_translated=normalized_subject or None,
                 template=self.prompt_template,
-                constants=dict(self.prompt_constants),
+                constants=self._prompt_constants_view,
             )
 
         if normalized_subject:
@@ -249,30 +422,168 @@ class AssetPipeline:
             subject_original=original or None,
             subject_translated=normalized_subject or None,
             template=None,
-            constants=dict(self.prompt_constants),
+            constants=self._prompt_constants_view,
         )
 
+    def _parse_prompt_template(
+        self,
+        template: Optional[str],
+    ) -> Optional[List[Tuple[str, Optional[str], Optional[str], Optional[str]]]]:
+        """Pre-parse the prompt template so each scene only joins strings."""
+        if not template:
+            return None
+        try:
+            parts = list(self._prompt_formatter.parse(template))
+        except ValueError as exc:
+            logger.warning("Prompt template could not be pre-parsed (%s); using str.format per scene", exc)
+            return None
+        # Nested replacement fields inside a format spec need full str.format handling.
+        if any(spec and "{" in spec for _, _, spec, _ in parts):
+            return None
+        return parts
+
+    def _render_prompt(self, mapping: Mapping[str, str]) -> str:
+        if self._prompt_parts is None:
+            return (self.prompt_template or "").format(**mapping)
+
+        formatter = self._prompt_formatter
+        pieces: List[str] = []
+        for literal, field_name, format_spec, conversion in self._prompt_parts:
+            if literal:
+                pieces.append(literal)
+            if field_name is None:
+                continue
+            value, _ = formatter.get_field(field_name, (), mapping)
+            if conversion:
+                value = formatter.convert_field(value, conversion)
+            pieces.append(format(value, format_spec or ""))
+        return "".join(pieces)
+
     @staticmethod
     def _normalize_subject(text: str) -> str:
         fragments = [part.strip() for part in text.splitlines()]
         return " ".join(fragment for fragment in fragments if fragment)
 
+    def prefetch_images(self, scenes: List[Scene]) -> None:
+        """Fetch all content-scene images in one concurrent batch when the provider supports it.
+
+        Scenes whose fetch fails here are retried individually by prepare_scene_assets.
+        """
+        fetch_many = getattr(self.image_client, "fetch_many", None)
+        if fetch_many is None:
+            return
+
+        pending: List[Tuple[str, str, Path]] = []
+        for scene in scenes:
+            if scene.scene_type is not SceneType.CONTENT:
+                continue
+            prompt_result = self._compose_prompt(scene.primary_prompt or scene.image_prompt)
+            if not prompt_result:
+                continue
+            prompt_key = self._prompt_cache_key(prompt_result.prompt)
+            if self._lookup_cached_image(scene.scene_id, prompt_key) is None:
+                pending.append((scene.scene_id, prompt_result.prompt, self.image_dir / f"{scene.scene_id}.jpg"))
+        if not pending:
+            return
+
+        results = fetch_many([(prompt, output_path) for _, prompt, output_path in pending])
+        fetched = 0
+        for (scene_id, prompt, _), image_path in zip(pending, results):
+            if image_path:
+                self._remember_image(scene_id, image_path)
+                self._image_prompt_keys[scene_id] = self._prompt_cache_key(prompt)
+                fetched += 1
+        if fetched:
+            self._save_image_cache_index()
+        logger.info("Prefetched %d/%d scene image(s)", fetched, len(pending))
+
+    def _lookup_cached_image(self, scene_id: str, prompt_key: str) -> Optional[Path]:
+        cached = self._image_cache.get(scene_id)
+        if cached is not None and self._image_prompt_keys.get(scene_id, prompt_key) == prompt_key and cached.exists():
+            return cached
+
+        output_path = self.image_dir / f"{scene_id}.jpg"
+        recorded_key = self._image_prompt_keys.get(scene_id)
+        if output_path.exists():
+            if recorded_key is not None and recorded_key != prompt_key:
+                logger.info("Image prompt changed for %s; discarding cached %s", scene_id, output_path.name)
+                output_path.unlink()
+            elif output_path.stat().st_size > 0:
+                logger.info("Reusing existing image for %s: %s", scene_id, output_path.name)
+                self._remember_image(scene_id, output_path)
+                if recorded_key is None:
+                    # Adopt the untracked file under the current prompt so a later
+                    # prompt edit still invalidates it.
+                    self._image_prompt_keys[scene_id] = prompt_key
+                    self._save_image_cache_index()
+                return output_path
+        return None
+
     def _get_or_create_image(self, scene_id: str, prompt: str) -> Optional[Path]:
-        if scene_id in self._image_cache:
-            return self._image_cache[scene_id]
+        prompt_key = self._prompt_cache_key(prompt)
+        cached = self._lookup_cached_image(scene_id, prompt_key)
+        if cached is not None:
+            return cached
 
         output_path = self.image_dir / f"{scene_id}.jpg"
         existing = self.image_client.fetch(prompt, output_path)
         if existing:
-            self._image_cache[scene_id] = existing
-            if existing not in self._successful_images:
-                self._successful_images.append(existing)
+            self._remember_image(scene_id, existing)
+            self._image_prompt_keys[scene_id] = prompt_key
+            self._save_image_cache_index()
             return existing
 
         self._failed_image_targets[scene_id] = output_path
         logger.warning("Pollinations image missing for %s; deferring fallback", scene_id)
         return None
 
+    def _remember_image(self, scene_id: str, image_path: Path) -> None:
+        self._image_cache[scene_id] = image_path
+        if image_path not in self._successful_images:
+            self._successful_images.append(image_path)
+
+    @staticmethod
+    def _prompt_cache_key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _load_image_cache_index(self) -> None:
+        """Restore images fetched by a previous run in the same run directory."""
+        if not self._image_cache_path.exists():
+            return
+        try:
+            entries = json.loads(self._image_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable image cache index %s: %s", self._image_cache_path, exc)
+            return
+        if not isinstance(entries, dict):
+            return
+
+        for scene_id, entry in entries.items():
+            if not isinstance(entry, dict):
+                continue
+            file_name = entry.get("file")
+            prompt_key = entry.get("prompt_key")
+            if not file_name or not prompt_key:
+                continue
+            image_path = self.image_dir / str(file_name)
+            if image_path.exists() and image_path.stat().st_size > 0:
+                self._remember_image(str(scene_id), image_path)
+                self._image_prompt_keys[str(scene_id)] = str(prompt_key)
+        logger.info("Loaded %d cached image(s) from %s", len(self._image_prompt_keys), self._image_cache_path.name)
+
+    def _save_image_cache_index(self) -> None:
+        entries = {
+            scene_id: {"file": self._image_cache[scene_id].name, "prompt_key": prompt_key}
+            for scene_id, prompt_key in self._image_prompt_keys.items()
+            if scene_id in self._image_cache
+        }
+        tmp_path = self._image_cache_path.with_suffix(".json.tmp")
+        try:
+            _dump_json(tmp_path, entries)
+            os.replace(tmp_path, self._image_cache_path)
+        except OSError as exc:
+            logger.warning("Failed to update image cache index %s: %s", self._image_cache_path, exc)
+
     def finalize_images(self, assets: List[GeneratedAssets]) -> None:
         if not self._failed_image_targets:
             return
@@ -354,6 +665,7 @@ class AssetPipeline:
         scene_id: str,
         prompt_result: PromptBuildResult,
         original_focus: Optional[str],
+        generated_at: str,
     ) -> Path:
         payload = {
             "scene_id": scene_id,
@@ -361,10 +673,127 @@ class AssetPipeline:
             "subject_original": prompt_result.subject_original,
             "subject_translated": prompt_result.subject_translated,
             "template": prompt_result.template,
-            "constants": prompt_result.constants,
+            "constants": dict(prompt_result.constants),
             "original_focus_text": original_focus,
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": generated_at,
         }
         prompt_path = self.prompt_dir / f"{scene_id}_prompt.json"
-        prompt_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._queue_json(prompt_path, payload)
         return prompt_path
+
+
+# ----------------------------------------------------------------------
+# WAV concatenation
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _WavLayout:
+    fmt_chunk: bytes
+    data_offset: int
+    data_size: int
+
+
+def _read_wav_layout(path: Path) -> Optional[_WavLayout]:
+    """Locate the fmt/data chunks of a RIFF/WAVE file without decoding PCM."""
+    file_size = path.stat().st_size
+    with path.open("rb") as fh:
+        riff = fh.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+        fmt_chunk: Optional[bytes] = None
+        while True:
+            header = fh.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, chunk_size = header[:4], struct.unpack("<I", header[4:])[0]
+            if chunk_id == b"fmt ":
+                fmt_chunk = fh.read(chunk_size)
+                if chunk_size % 2:
+                    fh.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt_chunk is None:
+                    return None
+                data_offset = fh.tell()
+                # Streaming writers may leave a placeholder size; trust the file length instead.
+                data_size = min(chunk_size, file_size - data_offset)
+                return _WavLayout(fmt_chunk=fmt_chunk, data_offset=data_offset, data_size=data_size)
+            else:
+                fh.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+
+
+def _copy_file_range(src: BinaryIO, dst: BinaryIO, offset: int, length: int) -> None:
+    if _USE_SENDFILE:
+        out_fd, in_fd = dst.fileno(), src.fileno()
+        while length > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, length)
+            if sent == 0:
+                break
+            offset += sent
+            length -= sent
+        return
+
+    src.seek(offset)
+    while length > 0:
+        block = src.read(min(_WAV_COPY_BLOCK_BYTES, length))
+        if not block:
+            break
+        dst.write(block)
+        length -= len(block)
+
+
+def _concat_wav_files(chunk_files: List[Path], output_path: Path) -> None:
+    """Concatenate WAVs sharing one format by splicing their PCM payloads.
+
+    VOICEVOX chunks of a scene always share sample format, so the output header is
+    written once with final sizes and each payload is copied byte-for-byte (via
+    ``os.sendfile`` on Linux). Inputs that cannot be parsed or whose formats differ
+    go through the ``wave`` module instead.
+    """
+    parsed = [_read_wav_layout(path) for path in chunk_files]
+    layouts = [layout for layout in parsed if layout is not None]
+    if len(layouts) != len(parsed) or any(layout.fmt_chunk != layouts[0].fmt_chunk for layout in layouts):
+        logger.warning("WAV chunks are not uniform PCM; concatenating via wave module: %s", output_path.name)
+        _concat_wav_files_with_wave(chunk_files, output_path)
+        return
+
+    total_data = sum(layout.data_size for layout in layouts)
+    pad = total_data % 2
+    fmt_chunk = layouts[0].fmt_chunk
+    fmt_pad = len(fmt_chunk) % 2
+    riff_size = 4 + (8 + len(fmt_chunk) + fmt_pad) + (8 + total_data + pad)
+
+    with open(output_path, "wb", buffering=0) as out:
+        out.write(
+            b"RIFF"
+            + struct.pack("<I", riff_size)
+            + b"WAVE"
+            + b"fmt "
+            + struct.pack("<I", len(fmt_chunk))
+            + fmt_chunk
+            + b"\x00" * fmt_pad
+            + b"data"
+            + struct.pack("<I", total_data)
+        )
+        for path, layout in zip(chunk_files, layouts):
+            with path.open("rb") as src:
+                _copy_file_range(src, out, layout.data_offset, layout.data_size)
+        if pad:
+            out.write(b"\x00")
+
+
+def _concat_wav_files_with_wave(chunk_files: List[Path], output_path: Path) -> None:
+    with wave.open(str(chunk_files[0]), "rb") as first_wave:
+        params = first_wave.getparams()
+
+    # Copy PCM in ~1 MiB blocks so a scene's audio is never held in memory at once.
+    block_frames = max(1, _WAV_COPY_BLOCK_BYTES // (params.sampwidth * params.nchannels))
+    with wave.open(str(output_path), "wb") as out_wave:
+        out_wave.setparams(params)
+        for chunk_file in chunk_files:
+            with wave.open(str(chunk_file), "rb") as wav_file:
+                while True:
+                    block = wav_file.readframes(block_frames)
+                    if not block:
+                        break
+                    out_wave.writeframes(block)
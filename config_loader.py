@@ -1,10 +1,11 @@
 """Configuration loader for the long-form video pipeline."""
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 try:
     import yaml  # type: ignore
@@ -13,6 +14,14 @@ except ModuleNotFoundError as exc:  # pragma: no cover - import guard
         "PyYAML is required. Please install it with `pip install pyyaml`."
     ) from exc
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed parser
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Parsed YAML keyed by (resolved path, mtime_ns); editing the file invalidates it.
+_RAW_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
 
 @dataclass
 class AppConfig:
@@ -54,8 +63,7 @@ def load_config(path: Path | str, project_root: Path | None = None) -> AppConfig
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with config_path.open("r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or {}
+    raw = copy.deepcopy(_load_raw_config(config_path))
 
     root = project_root.resolve() if project_root else config_path.parent
 
@@ -75,3 +83,19 @@ def load_config(path: Path | str, project_root: Path | None = None) -> AppConfig
         log_file=log_file,
         credentials_dir=credentials_dir,
     )
+
+
+def _load_raw_config(config_path: Path) -> Dict[str, Any]:
+    cache_key = (str(config_path), config_path.stat().st_mtime_ns)
+    cached = _RAW_CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    with config_path.open("r", encoding="utf-8") as fh:
+        raw = yaml.load(fh, Loader=_YamlLoader) or {}
+
+    # Drop entries for older revisions of the same file.
+    for stale_key in [key for key in _RAW_CONFIG_CACHE if key[0] == cache_key[0]]:
+        del _RAW_CONFIG_CACHE[stale_key]
+    _RAW_CONFIG_CACHE[cache_key] = raw
+    return raw
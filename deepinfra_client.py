@@ -2,25 +2,69 @@
 from __future__ import annotations
 
 import base64
+import binascii
+import errno
+import hashlib
 import json
 import logging
 import os
 import random
+import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import pybase64 as _b64  # SIMD-accelerated, API-compatible with base64
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    _b64 = base64  # type: ignore[assignment]
+
+# Decoder that takes a buffer as-is; base64.b64decode would copy a memoryview first.
+_b64decode = binascii.a2b_base64 if _b64 is base64 else _b64.b64decode
 
 logger = logging.getLogger(__name__)
 
+# Locates the first image string in a response body without building the JSON tree:
+# either "images": ["<b64>", ...] or "images": [{"b64_json": "<b64>", ...}, ...].
+# Strings containing escapes do not match and take the full json parse instead.
+_FIRST_IMAGE_RE = re.compile(rb'"images"\s*:\s*\[\s*(?:\{[^{}]*?"b64_json"\s*:\s*)?"([^"\\]*)"')
+
+# A data URI header ("data:image/jpeg;base64,") sits within the first few bytes.
+_DATA_URI_SCAN = 256
+_URLSAFE_RE = re.compile(rb"[-_]")
+
+# Upper bound on a server-requested Retry-After delay.
+_MAX_RETRY_AFTER = 60.0
+
+# Connections kept per host by the client's own session; bounds fetch_many workers too.
+_POOL_MAXSIZE = 16
+
+# os.link errors meaning "no hard links here"; anything else (e.g. EEXIST) is a real error.
+_NO_HARDLINK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP})
+
+
+def _temp_sibling(path: Path, suffix: str) -> Path:
+    """Hidden temp name next to ``path``, unique per process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.{suffix}")
+
 
 class DeepInfraClient:
     """Generate images via DeepInfra's StabilityAI SDXL Turbo endpoint."""
 
     BASE_URL = "https://api.deepinfra.com/v1/inference"
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], *, session: Optional[requests.Session] = None) -> None:
+        # Keep-alive session so only the first request pays the TCP/TLS handshake.
+        self._owns_session = session is None
+        self._session = session if session is not None else self._build_session()
         apis_cfg = config.get("apis", {}) if isinstance(config, dict) else {}
         deepinfra_cfg = apis_cfg.get("deepinfra", {}) if isinstance(apis_cfg, dict) else {}
         if not isinstance(deepinfra_cfg, dict):
@@ -67,8 +111,45 @@ class DeepInfraClient:
 
         self.retries = int(_setting("retries", 2) or 2)
         self.retry_backoff_base = float(_setting("retry_backoff_base", 0.75) or 0.75)
+        # Capped exponential schedule indexed by attempt; jitter is applied per retry.
+        self._backoff = [
+            max(0.2, min(self.retry_backoff_base * (2**i), 15.0)) for i in range(max(0, self.retries) + 1)
+        ]
         self.timeout_connect = float(_setting("timeout_connect", 10) or 10)
         self.timeout_read = float(_setting("timeout_read", 60) or 60)
+        # Ask for signed image URLs instead of base64 bodies (only some models support it;
+        # responses that still carry base64 are decoded as usual).
+        self.use_urls = bool(_setting("use_urls", False))
+        # Concurrent requests issued by fetch_many (kept within the connection pool size).
+        self.max_workers = max(1, min(int(_setting("max_workers", 8) or 8), _POOL_MAXSIZE))
+        # Content-addressed image store shared across runs; set cache_dir to "" to disable.
+        cache_dir_value = _setting("cache_dir", None)
+        if cache_dir_value is None:
+            cache_root = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+            self.cache_dir: Optional[Path] = Path(cache_root) / "longvideoai" / "deepinfra"
+        elif str(cache_dir_value).strip():
+            self.cache_dir = Path(str(cache_dir_value)).expanduser()
+        else:
+            self.cache_dir = None
+
+        # Everything except the prompt is fixed per client, so build it once here.
+        self._url = self._build_url()
+        self._static_payload = self._build_static_payload()
+        self._headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if self.api_token:
+            self._headers["Authorization"] = f"Bearer {self.api_token}"
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        session = requests.Session()
+        # fetch() runs its own retry loop, so the adapter must not retry on its own.
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE, max_retries=0))
+        return session
+
+    def close(self) -> None:
+        """Release pooled connections if this client created its own session."""
+        if self._owns_session:
+            self._session.close()
 
     def _build_url(self) -> str:
         return f"{self.BASE_URL}/{self.model}"
@@ -122,9 +203,8 @@ class DeepInfraClient:
 
         return active, resolved_name
 
-    def _build_payload(self, prompt: str) -> Dict[str, Any]:
+    def _build_static_payload(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
-            "prompt": prompt,
             "num_images": self.num_images,
             "guidance_scale": self.guidance_scale,
             "num_inference_steps": self.num_inference_steps,
@@ -132,6 +212,8 @@ class DeepInfraClient:
             "height": self.height,
             "output_format": "jpeg",
         }
+        if self.use_urls:
+            payload["return_urls"] = True
         if self.negative_prompt:
             payload["negative_prompt"] = self.negative_prompt
         if self.scheduler:
@@ -140,6 +222,132 @@ class DeepInfraClient:
             payload["seed"] = self.seed
         return payload
 
+    def _build_payload(self, prompt: str) -> Dict[str, Any]:
+        return {"prompt": prompt, **self._static_payload}
+
+    def _cache_path(self, payload: Dict[str, Any]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        material = f"{self.model}|{json.dumps(payload, sort_keys=True, ensure_ascii=False)}"
+        key = hashlib.sha256(material.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.jpg"
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        """Place ``source`` at ``target`` atomically, hard-linking when the filesystem allows it."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # fetch_many stores from several threads at once; a shared temp name would let
+        # one worker copy through another's hard link.
+        tmp_path = _temp_sibling(target, "tmp")
+        try:
+            try:
+                os.link(source, tmp_path)
+            except OSError as exc:
+                if exc.errno not in _NO_HARDLINK_ERRNOS:
+                    raise
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _extract_image_payload(body: bytes) -> Optional[memoryview]:
+        """Return a view of the first image's base64 (or data URI/URL) in a response body."""
+        match = _FIRST_IMAGE_RE.search(body)
+        if match is not None:
+            start, end = match.span(1)
+            return memoryview(body)[start:end]
+
+        # Escaped strings or an unexpected layout: fall back to a full parse.
+        try:
+            data = json.loads(body)
+        except ValueError as exc:
+            logger.error("DeepInfra response is not valid JSON: %s", exc)
+            return None
+
+        images = data.get("images") if isinstance(data, dict) else None
+        if not images:
+            logger.error("DeepInfra response missing 'images' field: %s", data)
+            return None
+
+        first_image = images[0]
+        if isinstance(first_image, dict):
+            encoded = first_image.get("b64_json") or first_image.get("url")
+        else:
+            encoded = first_image
+
+        if not encoded:
+            logger.error("DeepInfra response missing base64 payload: %s", first_image)
+            return None
+        return memoryview(str(encoded).encode("ascii", errors="ignore"))
+
+    def _download_image(self, image_url: str, output_path: Path) -> None:
+        """Stream an image returned by URL straight to disk (no base64 round-trip)."""
+        tmp_path = _temp_sibling(output_path, "part")
+        with self._session.get(image_url, stream=True, timeout=(self.timeout_connect, self.timeout_read)) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            try:
+                with tmp_path.open("wb") as fh:
+                    shutil.copyfileobj(response.raw, fh, length=1 << 20)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+    @staticmethod
+    def _decode_image_payload(encoded: memoryview) -> bytes:
+        # Work on views of the response body; only the data URI header is inspected
+        # and the payload itself is copied only when it needs padding.
+        view = memoryview(encoded)
+        head = bytes(view[:_DATA_URI_SCAN])
+        if head[:1].isspace() or bytes(view[-1:]).isspace():
+            view = memoryview(bytes(view).strip())
+            head = bytes(view[:_DATA_URI_SCAN])
+        if head.startswith(b"data:"):
+            comma_index = head.find(b",")
+            if comma_index == -1:
+                raise ValueError("Invalid data URI payload")
+            view = view[comma_index + 1 :]
+
+        padding = (-len(view)) % 4
+        data = bytes(view) + b"=" * padding if padding else view
+        # Pick the alphabet once instead of decoding twice.
+        if _URLSAFE_RE.search(data):
+            return _b64.urlsafe_b64decode(bytes(data))
+        return _b64decode(data)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), capped."""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            seconds = (when - datetime.now(timezone.utc)).total_seconds()
+        return max(0.0, min(seconds, _MAX_RETRY_AFTER))
+
+    def fetch_many(
+        self,
+        items: Sequence[Tuple[str, Path]],
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[Path]]:
+        """Fetch several (prompt, output_path) pairs concurrently; results keep input order."""
+        if not items:
+            return []
+        workers = max(1, min(max_workers or self.max_workers, _POOL_MAXSIZE, len(items)))
+        logger.info("DeepInfra batch fetch: %d image(s) with %d worker(s)", len(items), workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.fetch(item[0], item[1]), items))
+
     def fetch(self, prompt: str, output_path: Path) -> Optional[Path]:
         prompt_clean = prompt.strip()
         if not prompt_clean:
@@ -147,89 +355,81 @@ class DeepInfraClient:
             return None
 
         payload = self._build_payload(prompt_clean)
-        headers = {
-            "Content-Type": "application/json",
-        }
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-        else:
+        if not self.api_token:
             logger.warning("DeepInfra API token is not set; request will likely fail with 401.")
 
         if output_path.exists():
             logger.info("DeepInfra cache hit: %s", output_path.name)
             return output_path
 
-        url = self._build_url()
+        cache_path = self._cache_path(payload)
+        if cache_path is not None and cache_path.exists():
+            try:
+                self._link_or_copy(cache_path, output_path)
+                logger.info("DeepInfra prompt cache hit: %s -> %s", cache_path.name[:12], output_path.name)
+                return output_path
+            except OSError as exc:
+                logger.warning("Failed to reuse cached DeepInfra image %s: %s", cache_path, exc)
+
         attempt = 0
         while True:
             attempt += 1
             try:
                 start = time.monotonic()
-                response = requests.post(
-                    url,
+                response = self._session.post(
+                    self._url,
                     json=payload,
                     timeout=(self.timeout_connect, self.timeout_read),
-                    headers=headers,
+                    headers=self._headers,
                 )
                 elapsed = time.monotonic() - start
                 logger.info("DeepInfra response: status=%s elapsed=%.2fs", response.status_code, elapsed)
 
                 if response.status_code in (429,) or 500 <= response.status_code < 600:
-                    raise requests.HTTPError(f"HTTP {response.status_code}")
+                    raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
 
                 response.raise_for_status()
-                data = response.json()
+                body = response.content
                 debug_path = os.getenv("DEEPINFRA_DEBUG_JSON")
                 if debug_path:
                     try:
+                        data = json.loads(body)
                         Path(debug_path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
                     except Exception:
                         logger.debug("Failed to write DeepInfra debug json", exc_info=True)
 
-                images = data.get("images")
-                if not images:
-                    logger.error("DeepInfra response missing 'images' field: %s", data)
+                encoded = self._extract_image_payload(body)
+                if encoded is None:
                     return None
 
-                first_image = images[0]
-                if isinstance(first_image, dict):
-                    encoded = first_image.get("b64_json")
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                if bytes(encoded[:8]).startswith((b"https://", b"http://")):
+                    self._download_image(bytes(encoded).decode("ascii"), output_path)
                 else:
-                    encoded = first_image
-
-                if not encoded:
-                    logger.error("DeepInfra response missing base64 payload: %s", first_image)
-                    return None
-
-                try:
-                    encoded_str = str(encoded).strip()
-                    if encoded_str.startswith("data:"):
-                        comma_index = encoded_str.find(",")
-                        if comma_index == -1:
-                            raise ValueError("Invalid data URI payload")
-                        encoded_str = encoded_str[comma_index + 1 :]
-
-                    padding = (-len(encoded_str)) % 4
-                    if padding:
-                        encoded_str += "=" * padding
                     try:
-                        image_bytes = base64.b64decode(encoded_str)
-                    except Exception:
-                        image_bytes = base64.urlsafe_b64decode(encoded_str)
-                except Exception as exc:
-                    logger.error("Failed to decode DeepInfra image payload: %s", exc)
-                    return None
-
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(image_bytes)
+                        image_bytes = self._decode_image_payload(encoded)
+                    except Exception as exc:
+                        logger.error("Failed to decode DeepInfra image payload: %s", exc)
+                        return None
+                    output_path.write_bytes(image_bytes)
+                if cache_path is not None:
+                    try:
+                        self._link_or_copy(output_path, cache_path)
+                    except OSError as exc:
+                        logger.warning("Failed to store DeepInfra image in cache %s: %s", cache_path, exc)
                 return output_path
             except requests.RequestException as exc:
                 if attempt > max(0, self.retries):
                     logger.error("DeepInfra fetch failed after %d attempts: %s", attempt - 1, exc)
                     return None
-                wait = self.retry_backoff_base * (2 ** (attempt - 1))
-                wait *= random.uniform(0.8, 1.2)
-                wait = max(0.2, min(wait, 15.0))
+                wait = self._backoff[attempt - 1] * random.uniform(0.8, 1.2)
+                # Rate-limited: wait as long as the server asks rather than burning
+                # the remaining attempts on retries it will reject anyway.
+                response = getattr(exc, "response", None)
+                if response is not None and response.status_code == 429:
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        wait = retry_after
                 logger.warning(
                     "DeepInfra request failed (attempt %d/%d): %s; retrying in %.2fs",
                     attempt,
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import requests
 
 from pollinations_client import PollinationsClient
 
@@ -29,8 +31,11 @@ def _resolve_provider(config: Dict[str, Any]) -> str:
     return provider
 
 
-def make_image_client(config: Dict[str, Any]):
-    """Return an image generation client based on configuration."""
+def make_image_client(config: Dict[str, Any], *, session: Optional[requests.Session] = None):
+    """Return an image generation client based on configuration.
+
+    ``session`` lets callers share one HTTP connection pool with other clients.
+    """
 
     provider = _resolve_provider(config)
     if provider not in _SUPPORTED_PROVIDERS:
@@ -44,7 +49,7 @@ def make_image_client(config: Dict[str, Any]):
                 "DeepInfra client module not available. Ensure deepinfra_client.py exists and dependencies are installed."
             )
         logger.debug("Using DeepInfra client for image generation")
-        return DeepInfraClient(config)
+        return DeepInfraClient(config, session=session)
 
     logger.debug("Using Pollinations client for image generation")
-    return PollinationsClient(config)
\ No newline at end of file
+    return PollinationsClient(config, session=session)
\ No newline at end of file
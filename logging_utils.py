@@ -1,20 +1,49 @@
 """Logging setup helpers for the long-form pipeline."""
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
+import queue
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+# Console/file output runs on a listener thread so that logging calls from hot
+# loops (e.g. while draining ffmpeg's progress pipe) never wait on file I/O.
+_listener: Optional[QueueListener] = None
+_configured: Optional[Tuple[int, Path]] = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def configure_logging(level: str, log_file: Path) -> Logger:
     """Configure root logger with console + file handlers."""
-    log_file.parent.mkdir(parents=True, exist_ok=True)
+    global _listener, _configured
 
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    level_value = getattr(logging, level.upper(), logging.INFO)
+    log_file = log_file.resolve()
+
+    # Repeated calls with the same settings keep the running handlers.
+    if _configured == (level_value, log_file) and _listener is not None:
+        logger.setLevel(level_value)
+        return logger
+
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    logger.setLevel(level_value)
 
     # Clear existing handlers to avoid duplicate logs during repeated runs
+    _stop_listener()
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
 
@@ -25,18 +54,23 @@ def configure_logging(level: str, log_file: Path) -> Logger:
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
-    logger.addHandler(console_handler)
+    console_handler.setLevel(level_value)
 
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setFormatter(formatter)
-    file_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
-    logger.addHandler(file_handler)
+    file_handler.setLevel(level_value)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+    _configured = (level_value, log_file)
 
     logger.debug("Logging configured", extra={"level": level, "file": str(log_file)})
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> Logger:
-    """Return a module-level logger."""
+    """Return a module-level logger (memoized; loggers live for the process anyway)."""
     return logging.getLogger(name)
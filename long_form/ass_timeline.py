@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 
 def _fmt_time(sec: float) -> str:
     if sec < 0:
@@ -17,17 +20,133 @@ def _fmt_time(sec: float) -> str:
     return f"{h}:{m:02d}:{s:02d}.{cs:02d}"
 
 
+# "00".."99", so bulk formatting indexes a list instead of running a format spec.
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+
+
+def _fmt_times(secs: np.ndarray) -> List[str]:
+    # Array form of _fmt_time: the centisecond split runs in numpy, leaving only
+    # the string assembly per element.
+    cs_total = np.rint(np.clip(secs, 0.0, None) * 100).astype(np.int64)
+    h, rem = np.divmod(cs_total, 360000)
+    m, rem = np.divmod(rem, 6000)
+    s, cs = np.divmod(rem, 100)
+    two = _TWO_DIGITS
+    return [
+        f"{hh}:{two[mm]}:{two[ss]}.{two[cc]}"
+        for hh, mm, ss, cc in zip(h.tolist(), m.tolist(), s.tolist(), cs.tolist())
+    ]
+
+
+# Single-pass ASS escaping: braces/backslash to full-width, tabs to spaces, CR dropped.
+_ESC_TABLE = str.maketrans({"{": "｛", "}": "｝", "\\": "＼", "\t": "    ", "\r": None})
+
+
 def _esc_text(text: str) -> str:
-    return (
-        text.replace("{", "｛")
-        .replace("}", "｝")
-        .replace("\\", "＼")
-        .replace("\t", "    ")
-        .replace("\r", "")
-        .replace("\n", r"\N")
+    return text.translate(_ESC_TABLE).replace("\n", r"\N")
+
+
+# ASS headers shared by the builders below; filled in with str.format per call.
+# Bottom-aligned style with side/vertical margins (alignment number passed in).
+_ASS_HEADER_TMPL_MARGIN = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "PlayResX: {width}\n"
+    "PlayResY: {height}\n"
+    "ScaledBorderAndShadow: yes\n"
+    "[V4+ Styles]\n"
+    "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
+    "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
+    "Alignment,MarginL,MarginR,MarginV,Encoding\n"
+    "Style: Typing,{fontname},{fontsize},{primary},&H000000FF,{outline},{back},"
+    "0,0,0,0,100,100,0,0,1,{outline_w},{shadow},{align_num},120,120,{margin_v},1\n"
+    "[Events]\n"
+    "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+)
+
+# Alignment=7 (top-left) so that pos(x,y) places top-left corner of the text box
+_ASS_HEADER_TMPL_ALIGN7 = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "PlayResX: {width}\n"
+    "PlayResY: {height}\n"
+    "ScaledBorderAndShadow: yes\n"
+    "[V4+ Styles]\n"
+    "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
+    "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
+    "Alignment,MarginL,MarginR,MarginV,Encoding\n"
+    "Style: Typing,{fontname},{fontsize},{primary},&H000000FF,{outline},{back},"
+    "{bold},0,0,0,100,100,0,0,1,{outline_w},{shadow},7,0,0,0,1\n"
+    "[Events]\n"
+    "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+)
+
+# Alignment=8 (top-center). SecondaryColour is ignored by forcing \2a&HFF& per line.
+_ASS_HEADER_TMPL_ALIGN8 = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "PlayResX: {width}\n"
+    "PlayResY: {height}\n"
+    "ScaledBorderAndShadow: yes\n"
+    "[V4+ Styles]\n"
+    "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
+    "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
+    "Alignment,MarginL,MarginR,MarginV,Encoding\n"
+    "Style: Typing,{fontname},{fontsize},{primary},&H00FFFFFF,{outline},{back},"
+    "{bold},0,0,0,100,100,0,0,1,{outline_w},{shadow},8,0,0,0,1\n"
+    "[Events]\n"
+    "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+)
+
+
+def _write_typing_events(
+    out: io.StringIO, txt: str, *, start: float, end: float, cps: float, tag: str = ""
+) -> None:
+    # One Dialogue per revealed character. Each character ends where the next one
+    # starts, so every boundary is formatted once and shared by two events.
+    n = len(txt)
+    bounds = np.empty(n + 1, dtype=np.float64)
+    bounds[:n] = start + np.arange(n) / cps
+    bounds[n] = end
+    stamps = _fmt_times(bounds)
+    body = f",Typing,,0,0,0,,{tag}"
+    # Build the whole block in one join and hand it to a single write.
+    out.write(
+        "".join(
+            [
+                f"Dialogue: 0,{t0},{t1}{body}{txt[:i]}\n"
+                for i, (t0, t1) in enumerate(zip(stamps, stamps[1:]), 1)
+            ]
+        )
     )
 
 
+def _karaoke_text(txt: str, highlight: float, tag: str = "kf") -> str:
+    # Spread ``highlight`` seconds over the characters as {\kf} (or ``tag``)
+    # centisecond ticks (at least one per character, remainder to the first ones).
+    # An escaped line break (\N) rides along with the next character instead of
+    # taking a tick.
+    units: List[str] = []
+    pending = ""
+    i = 0
+    while i < len(txt):
+        if txt.startswith(r"\N", i):
+            pending += r"\N"
+            i += 2
+            continue
+        units.append(pending + txt[i])
+        pending = ""
+        i += 1
+    if not units:
+        return pending
+    n = len(units)
+    total_ticks = max(int(round(highlight * 100)), n)
+    base = max(total_ticks // n, 1)
+    rem = total_ticks - base * n
+    fragments = [f"{{\\{tag}{base + 1 if k < rem else base}}}{unit}" for k, unit in enumerate(units)]
+    return "".join(fragments) + pending
+
+
 @dataclass
 class Segment:
     start: float
@@ -51,23 +170,22 @@ def build_ass_for_scene(
     effect: str = "static",
     segments: Sequence[Segment] = (),
 ) -> str:
-    header = (
-        "[Script Info]\n"
-        "ScriptType: v4.00+\n"
-        f"PlayResX: {width}\n"
-        f"PlayResY: {height}\n"
-        "ScaledBorderAndShadow: yes\n"
-        "[V4+ Styles]\n"
-        "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
-        "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
-        "Alignment,MarginL,MarginR,MarginV,Encoding\n"
-        f"Style: Typing,{fontname},{fontsize},{primary},&H000000FF,{outline},{back},"
-        f"0,0,0,0,100,100,0,0,1,{outline_w},{shadow},{align_num},120,120,{margin_v},1\n"
-        "[Events]\n"
-        "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+    header = _ASS_HEADER_TMPL_MARGIN.format(
+        width=width,
+        height=height,
+        fontname=fontname,
+        fontsize=fontsize,
+        primary=primary,
+        outline=outline,
+        back=back,
+        outline_w=outline_w,
+        shadow=shadow,
+        align_num=align_num,
+        margin_v=margin_v,
     )
 
-    lines_out: List[str] = []
+    lines_out = io.StringIO()
+    lines_out.write(header)
     is_typing = (effect or "static").lower() == "typing"
 
     for seg in segments:
@@ -80,8 +198,8 @@ def build_ass_for_scene(
         if not is_typing:
             start = seg.start
             end = seg.start + seg.duration
-            lines_out.append(
-                f"Dialogue: 0,{_fmt_time(start)},{_fmt_time(end)},Typing,,0,0,0,,{txt}"
+            lines_out.write(
+                f"Dialogue: 0,{_fmt_time(start)},{_fmt_time(end)},Typing,,0,0,0,,{txt}\n"
             )
             continue
 
@@ -90,17 +208,20 @@ def build_ass_for_scene(
             continue
         # Auto-fit cps to segment duration so the last char lands at the end.
         cps = max(n / max(seg.duration, 0.01), 1.0)
-        for i in range(1, n + 1):
-            t0 = seg.start + (i - 1) / cps
-            t1 = seg.start + i / cps
-            if i == n:
-                t1 = seg.start + seg.duration
-            snippet = txt[:i]
-            lines_out.append(
-                f"Dialogue: 0,{_fmt_time(t0)},{_fmt_time(t1)},Typing,,0,0,0,,{snippet}"
-            )
+        if shadow:
+            # libass draws the shadow of pending syllables; reveal per character instead.
+            _write_typing_events(lines_out, txt, start=seg.start, end=seg.start + seg.duration, cps=cps)
+            continue
+        # One event per segment: {\ko} keeps each character's fill (\2a) and border
+        # hidden until its syllable starts, like the per-character events did.
+        highlight = min(n / cps, max(seg.duration, 0.01))
+        start = _fmt_time(seg.start)
+        end = _fmt_time(seg.start + seg.duration)
+        lines_out.write(
+            f"Dialogue: 0,{start},{end},Typing,,0,0,0,,{{\\2a&HFF&}}{_karaoke_text(txt, highlight, 'ko')}\n"
+        )
 
-    return header + "\n".join(lines_out) + "\n"
+    return lines_out.getvalue()
 
 
 def build_ass_for_content_scene(
@@ -152,28 +273,25 @@ def build_ass_for_content_scene_pos(
     outline_w: int = 3,
     shadow: int = 0,
 ) -> str:
-    header = (
-        "[Script Info]\n"
-        "ScriptType: v4.00+\n"
-        f"PlayResX: {width}\n"
-        f"PlayResY: {height}\n"
-        "ScaledBorderAndShadow: yes\n"
-        "[V4+ Styles]\n"
-        "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
-        "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
-        "Alignment,MarginL,MarginR,MarginV,Encoding\n"
-        # Alignment=7 (top-left) so that pos(x,y) places top-left corner of the text box
-        f"Style: Typing,{fontname},{fontsize},{primary},&H000000FF,{outline},{back},"
-        f"{1 if bold else 0},0,0,0,100,100,0,0,1,{outline_w},{shadow},7,0,0,0,1\n"
-        "[Events]\n"
-        "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+    header = _ASS_HEADER_TMPL_ALIGN7.format(
+        width=width,
+        height=height,
+        fontname=fontname,
+        fontsize=fontsize,
+        primary=primary,
+        outline=outline,
+        back=back,
+        bold=1 if bold else 0,
+        outline_w=outline_w,
+        shadow=shadow,
     )
 
     is_typing = (effect or "static").lower() == "typing"
     speed = float(speed) if isinstance(speed, (int, float)) else 1.0
     if speed <= 0:
         speed = 1.0
-    out_lines: List[str] = []
+    out_lines = io.StringIO()
+    out_lines.write(header)
     for seg in segments:
         if seg.duration <= 0:
             continue
@@ -185,25 +303,29 @@ def build_ass_for_content_scene_pos(
         if not is_typing:
             st = _fmt_time(seg.start)
             en = _fmt_time(seg.start + seg.duration)
-            out_lines.append(
-                f"Dialogue: 0,{st},{en},Typing,,0,0,0,,{pos_tag}{txt}"
+            out_lines.write(
+                f"Dialogue: 0,{st},{en},Typing,,0,0,0,,{pos_tag}{txt}\n"
             )
             continue
 
         n = len(txt)
         cps_base = n / max(seg.duration, 0.01)
         cps = max(cps_base * speed, 1.0)
-        for i in range(1, n + 1):
-            t0 = seg.start + (i - 1) / cps
-            t1 = seg.start + i / cps
-            if i == n:
-                t1 = seg.start + seg.duration
-            snippet = txt[:i]
-            out_lines.append(
-                f"Dialogue: 0,{_fmt_time(t0)},{_fmt_time(t1)},Typing,,0,0,0,,{pos_tag}{snippet}"
+        if shadow:
+            # Same as build_ass_for_scene: pending shadows would show through {\ko}.
+            _write_typing_events(
+                out_lines, txt, start=seg.start, end=seg.start + seg.duration, cps=cps, tag=pos_tag
             )
+            continue
+        highlight = min(n / cps, max(seg.duration, 0.01))
+        st = _fmt_time(seg.start)
+        en = _fmt_time(seg.start + seg.duration)
+        karaoke_tag = f"{{\\pos({seg.pos_x},{seg.pos_y})\\2a&HFF&}}"
+        out_lines.write(
+            f"Dialogue: 0,{st},{en},Typing,,0,0,0,,{karaoke_tag}{_karaoke_text(txt, highlight, 'ko')}\n"
+        )
 
-    return header + "\n".join(out_lines) + "\n"
+    return out_lines.getvalue()
 
 
 # Per-line typing with fixed left edge computed to achieve final centered layout.
@@ -231,40 +353,28 @@ def build_ass_centered_lines_typing(
     outline_w: int = 3,
     shadow: int = 0,
 ) -> str:
-    header = (
-        "[Script Info]\n"
-        "ScriptType: v4.00+\n"
-        f"PlayResX: {width}\n"
-        f"PlayResY: {height}\n"
-        "ScaledBorderAndShadow: yes\n"
-        "[V4+ Styles]\n"
-        "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
-        "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
-        "Alignment,MarginL,MarginR,MarginV,Encoding\n"
-        # Alignment=7 (top-left), coordinates via \pos()
-        f"Style: Typing,{fontname},{fontsize},{primary},&H000000FF,{outline},{back},"
-        f"{1 if bold else 0},0,0,0,100,100,0,0,1,{outline_w},{shadow},7,0,0,0,1\n"
-        "[Events]\n"
-        "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+    header = _ASS_HEADER_TMPL_ALIGN7.format(
+        width=width,
+        height=height,
+        fontname=fontname,
+        fontsize=fontsize,
+        primary=primary,
+        outline=outline,
+        back=back,
+        bold=1 if bold else 0,
+        outline_w=outline_w,
+        shadow=shadow,
     )
-    out: List[str] = []
+    out = io.StringIO()
+    out.write(header)
     for spec in lines:
         txt = _esc_text(spec.text)
         if not txt:
             continue
         pos_tag = f"{{\\pos({spec.pos_x},{spec.pos_y})}}"
-        n = len(txt)
         cps = max(float(spec.cps), 1.0)
-        for i in range(1, n + 1):
-            t0 = spec.t0 + (i - 1) / cps
-            t1 = spec.t0 + i / cps
-            if i == n:
-                t1 = spec.seg_end
-            snippet = txt[:i]
-            out.append(
-                f"Dialogue: 0,{_fmt_time(t0)},{_fmt_time(t1)},Typing,,0,0,0,,{pos_tag}{snippet}"
-            )
-    return header + "\n".join(out) + "\n"
+        _write_typing_events(out, txt, start=spec.t0, end=spec.seg_end, cps=cps, tag=pos_tag)
+    return out.getvalue()
 
 
 # Karaoke-based typing: layout is fixed by libass, reveal left->right within the event
@@ -292,24 +402,21 @@ def build_ass_karaoke_centered(
     outline_w: int = 3,
     shadow: int = 0,
 ) -> str:
-    header = (
-        "[Script Info]\n"
-        "ScriptType: v4.00+\n"
-        f"PlayResX: {width}\n"
-        f"PlayResY: {height}\n"
-        "ScaledBorderAndShadow: yes\n"
-        "[V4+ Styles]\n"
-        "Format: Name,Fontname,Fontsize,PrimaryColour,SecondaryColour,OutlineColour,BackColour,"
-        "Bold,Italic,Underline,StrikeOut,ScaleX,ScaleY,Spacing,Angle,BorderStyle,Outline,Shadow,"
-        "Alignment,MarginL,MarginR,MarginV,Encoding\n"
-        # Alignment=8 (top-center). SecondaryColour is ignored by forcing \2a&HFF& per line.
-        f"Style: Typing,{fontname},{fontsize},{primary},&H00FFFFFF,{outline},{back},"
-        f"{1 if bold else 0},0,0,0,100,100,0,0,1,{outline_w},{shadow},8,0,0,0,1\n"
-        "[Events]\n"
-        "Format: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text\n"
+    header = _ASS_HEADER_TMPL_ALIGN8.format(
+        width=width,
+        height=height,
+        fontname=fontname,
+        fontsize=fontsize,
+        primary=primary,
+        outline=outline,
+        back=back,
+        bold=1 if bold else 0,
+        outline_w=outline_w,
+        shadow=shadow,
     )
 
-    out_lines: List[str] = []
+    out_lines = io.StringIO()
+    out_lines.write(header)
     for spec in lines:
         txt = _esc_text(spec.text)
         if not txt:
@@ -318,26 +425,14 @@ def build_ass_karaoke_centered(
         n = len(txt)
         cps = max(float(spec.cps), 1.0)
         highlight = min((n / cps), max(spec.seg_end - spec.t0, 0.01))
-        total_ticks = max(int(round(highlight * 100)), n)  # at least 1 tick per char
-
-        # Distribute ticks roughly uniformly, adjust last to fit
-        base = max(total_ticks // n, 1)
-        ticks = [base] * n
-        rem = total_ticks - base * n
-        for i in range(rem):
-            ticks[i] += 1
 
         # Build karaoke text
         pos_tag = f"{{\\an8\\pos({spec.pos_cx},{spec.pos_y})\\q2\\2a&HFF&}}"
         # Optional: hide outline until highlighted – \ko0 is sufficient in many renderers
         # Note: some renderers treat \ko differently; keeping minimal here.
-        fragments: List[str] = [pos_tag]
-        for k, ch in zip(ticks, txt):
-            fragments.append(f"{{\\kf{k}}}{ch}")
-
-        line_text = "".join(fragments)
-        out_lines.append(
-            f"Dialogue: 0,{_fmt_time(spec.t0)},{_fmt_time(spec.seg_end)},Typing,,0,0,0,,{line_text}"
+        line_text = pos_tag + _karaoke_text(txt, highlight)
+        out_lines.write(
+            f"Dialogue: 0,{_fmt_time(spec.t0)},{_fmt_time(spec.seg_end)},Typing,,0,0,0,,{line_text}\n"
         )
 
-    return header + "\n".join(out_lines) + "\n"
+    return out_lines.getvalue()
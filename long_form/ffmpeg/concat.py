@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Iterable, List
 
@@ -9,22 +10,23 @@ from .runner import run_ffmpeg
 logger = get_logger(__name__)
 
 
-def concat_mp4_streamcopy(inputs: Iterable[Path], output: Path) -> Path:
-    """Concat identically-encoded MP4 segments using concat demuxer with copy.
-
-    - Validates input files (existence, size>0)
-    - If only one input: fast path with stream copy
-    - Uses ffconcat list with header for robustness
-    """
-    output.parent.mkdir(parents=True, exist_ok=True)
+def _validated_segments(inputs: Iterable[Path]) -> List[Path]:
     files = [Path(p).resolve() for p in inputs]
 
     if not files:
         raise RuntimeError("concat: no input segments provided")
 
-    # Validate inputs
-    missing = [str(p) for p in files if not p.exists()]
-    zero = [str(p) for p in files if p.exists() and p.stat().st_size == 0]
+    # Validate inputs (one stat per segment)
+    missing: List[str] = []
+    zero: List[str] = []
+    for p in files:
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
+            missing.append(str(p))
+            continue
+        if st.st_size == 0:
+            zero.append(str(p))
     if missing or zero:
         logger.error("concat: invalid inputs | missing=%d zero=%d", len(missing), len(zero))
         if missing:
@@ -38,6 +40,36 @@ def concat_mp4_streamcopy(inputs: Iterable[Path], output: Path) -> Path:
             if len(zero) > 10:
                 logger.error("zero-size: ... (%d more)", len(zero) - 10)
         raise RuntimeError("concat: some segments are missing or empty")
+    return files
+
+
+def write_concat_list(inputs: Iterable[Path], list_file: Path) -> Path:
+    """Validate segments and write them to an ffconcat list for the concat demuxer.
+
+    Callers can read the list with `-safe 0 -f concat -i list_file` and stream-copy
+    the joined video straight into their own output, skipping an intermediate MP4.
+    """
+    list_file.parent.mkdir(parents=True, exist_ok=True)
+    return _write_ffconcat(_validated_segments(inputs), list_file)
+
+
+def _write_ffconcat(files: List[Path], list_file: Path) -> Path:
+    # Encode once and hand the whole list to a single write.
+    payload = "ffconcat version 1.0\n" + "".join(f"file '{p}'\n" for p in files)
+    list_file.write_bytes(payload.encode("utf-8"))
+    logger.debug("concat: list file => %s (%d segments)", list_file, len(files))
+    return list_file
+
+
+def concat_mp4_streamcopy(inputs: Iterable[Path], output: Path) -> Path:
+    """Concat identically-encoded MP4 segments using concat demuxer with copy.
+
+    - Validates input files (existence, size>0)
+    - If only one input: fast path with stream copy
+    - Uses ffconcat list with header for robustness
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    files = _validated_segments(inputs)
 
     # Fast path: single input => copy
     if len(files) == 1:
@@ -56,12 +88,7 @@ def concat_mp4_streamcopy(inputs: Iterable[Path], output: Path) -> Path:
         return output
 
     # Write ffconcat list with header for stability
-    list_file = output.with_suffix(".concat.txt")
-    lines = ["ffconcat version 1.0"] + [f"file '{p}'" for p in files]
-    payload = "\n".join(lines) + "\n"
-    list_file.write_text(payload, encoding="utf-8")
-
-    logger.debug("concat: list file => %s (%d segments)", list_file, len(files))
+    list_file = _write_ffconcat(files, output.with_suffix(".concat.txt"))
     # Attempt concat with copy
     args = [
         "-safe",
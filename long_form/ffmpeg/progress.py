@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional, TextIO
+from typing import Callable, Optional, TextIO, Union
 
 
 def format_hms(seconds: float) -> str:
@@ -27,15 +27,20 @@ class ConsoleBar:
     def __post_init__(self) -> None:
         self.start_time = time.time()
         self.last_render = 0.0
+        # Everything that does not change between redraws is built once here.
+        self._total = max(self.total_seconds, 0.001)
+        self._total_hms = format_hms(self._total)
+        self._fill = "█" * self.width
+        self._empty = "·" * self.width
         self._draw(0.0)
 
     def update(self, current_seconds: float) -> None:
-        now = time.time()
         # Rate-limit updates to avoid flicker (10 fps max).
+        now = time.time()
         if now - self.last_render < 0.1:
             return
         self.last_render = now
-        self._draw(current_seconds)
+        self._draw(current_seconds, now)
 
     def finish(self) -> None:
         self._draw(self.total_seconds)
@@ -43,21 +48,20 @@ class ConsoleBar:
         self.stream.flush()
 
     # ------------------------------------------------------------------
-    def _draw(self, current_seconds: float) -> None:
-        total = max(self.total_seconds, 0.001)
+    def _draw(self, current_seconds: float, now: Optional[float] = None) -> None:
+        total = self._total
         cur = min(max(current_seconds, 0.0), total)
         frac = cur / total
         filled = int(round(self.width * frac))
-        bar = "█" * filled + "·" * (self.width - filled)
-        elapsed = time.time() - self.start_time
+        bar = self._fill[:filled] + self._empty[filled:]
+        elapsed = (time.time() if now is None else now) - self.start_time
         # Simple ETA estimate; guard for small frac
         eta = 0.0 if frac <= 0.0001 else elapsed * (1.0 / frac - 1.0)
-        msg = (
-            f"[{bar}] {int(frac*100):3d}% | "
-            f"{format_hms(elapsed)} / {format_hms(total)} | "
+        self.stream.write(
+            f"\r[{bar}] {int(frac*100):3d}% | "
+            f"{format_hms(elapsed)} / {self._total_hms} | "
             f"ETA {format_hms(eta)} | {self.label}"
         )
-        self.stream.write("\r" + msg)
         self.stream.flush()
 
 
@@ -67,15 +71,16 @@ class ProgressParser:
     def __init__(self, on_time: Callable[[float], None]) -> None:
         self.on_time = on_time
 
-    def feed_line(self, line: str) -> None:
-        line = line.strip()
-        if not line or "=" not in line:
+    def feed_line(self, line: Union[bytes, str]) -> None:
+        # Only out_time_ms matters, so test that prefix and skip every other key
+        # without splitting. int() tolerates the trailing newline.
+        if isinstance(line, str):
+            if not line.startswith("out_time_ms="):
+                return
+        elif not line.startswith(b"out_time_ms="):
             return
-        key, value = line.split("=", 1)
-        if key == "out_time_ms":
-            try:
-                ms = int(value)
-                self.on_time(ms / 1000000.0)
-            except ValueError:
-                pass
-
+        try:
+            ms = int(line[12:])
+        except ValueError:
+            return
+        self.on_time(ms / 1000000.0)
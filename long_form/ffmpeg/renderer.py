@@ -1,20 +1,108 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import math
-from dataclasses import dataclass
+import os
+import shutil
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
 
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 
 from logging_utils import get_logger
 from animation_config import resolve_ken_burns_profile
-from .runner import run_ffmpeg, run_ffmpeg_stream
+from .runner import encoder_available, run_ffmpeg, run_ffmpeg_stream
 from .progress import ConsoleBar
-from .concat import concat_mp4_streamcopy
+from .concat import write_concat_list
 
 logger = get_logger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., object])
+
+# Text measurements kept per generator before the cache is reset.
+_MEASURE_CACHE_SIZE = 4096
+
+# Freed Pillow image blocks kept for reuse. Overlays are allocated and dropped in
+# quick succession at a handful of sizes; Pillow frees them eagerly by default.
+_PIL_BLOCKS_MAX = 32
+
+# Bump whenever overlay layout/drawing code changes so cached overlays from older
+# versions are not reused.
+_OVERLAY_CACHE_VERSION = 3
+
+# Default size cap for the shared overlay cache; oldest entries go first.
+_OVERLAY_CACHE_MAX_MB = 512
+
+# Lengths (seconds) of the pre-normalized BGM beds kept in the BGM cache; longer
+# programs round up to a multiple of the last bucket.
+_BGM_BUCKETS = (60, 300, 1800)
+
+# Pillow font objects are not safe to share across threads, and loaded fonts are
+# shared by every generator in the process (see _load_font). Font, layout and
+# drawing work takes this lock; PNG encoding and ffmpeg run outside it.
+_PILLOW_LOCK = threading.RLock()
+
+# Hardware H.264 encoders tried, in order, when video.codec is "auto".
+# VAAPI is left out: it needs hwupload in every filter graph.
+_HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv")
+# video.crf is an x264 value; hardware encoders get it shifted onto their own
+# quality scale so the default crf (20) keeps cq/global_quality 23 and q:v 50.
+_HW_CQ_OFFSET = 3
+
+
+# x264 preset by program length (seconds, upper bound) when video.preset is "auto".
+# Short previews favour turnaround; long uploads spend a little more time on
+# compression, one step less when Ken Burns motion makes every frame costlier.
+_PRESET_TABLE: Tuple[Tuple[float, str, str], ...] = (
+    # (max_duration, static preset, ken burns preset)
+    (120.0, "ultrafast", "ultrafast"),
+    (1200.0, "superfast", "superfast"),
+    (math.inf, "veryfast", "superfast"),
+)
+
+
+def _pick_preset(total_duration: float, has_kb: bool) -> str:
+    for max_duration, static_preset, kb_preset in _PRESET_TABLE:
+        if total_duration <= max_duration:
+            return kb_preset if has_kb else static_preset
+    return "ultrafast"
+
+
+def _enable_pillow_block_cache() -> None:
+    core = Image.core
+    if hasattr(core, "set_blocks_max") and core.get_blocks_max() < _PIL_BLOCKS_MAX:
+        core.set_blocks_max(_PIL_BLOCKS_MAX)
+
+
+def _resolve_codec(codec: str, *, hwaccel: bool = True) -> str:
+    if codec != "auto":
+        return codec
+    if not hwaccel:
+        return "libx264"
+    for name in _HW_ENCODERS:
+        if encoder_available(name):
+            logger.info("Using hardware encoder %s", name)
+            return name
+    return "libx264"
+
+
+def _overlay_locked(method: _F) -> _F:
+    """Serialize Pillow font/overlay work across parallel scene workers."""
+
+    @functools.wraps(method)
+    def wrapper(self: "FFmpegVideoGenerator", *args: object, **kwargs: object) -> object:
+        with self._overlay_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 @dataclass
 class RenderConfig:
@@ -44,6 +132,27 @@ class RenderConfig:
     body_color: Tuple[int, int, int]
     band_color: Tuple[int, int, int, int]
     opening_title_font_size: int
+    # Scenes encoded concurrently, and encoder/filter threads given to each ffmpeg
+    # process; keep workers * threads_per_worker <= cpu_count to avoid oversubscription.
+    workers: int
+    threads_per_worker: int
+    # Encode every scene in one ffmpeg process (one filter graph, one x264 pass).
+    single_pass: bool
+    # Feed overlays to ffmpeg as raw RGBA frames instead of PNG.
+    raw_overlays: bool
+
+
+@dataclass
+class _SceneGraph:
+    """ffmpeg inputs and filter graph for one scene, before any output options."""
+
+    inputs: List[str]
+    filter_graph: str
+    input_count: int
+    video_label: str
+    audio_input: int
+    duration: float
+    label: str
 
 
 class FFmpegVideoGenerator:
@@ -66,13 +175,31 @@ class FFmpegVideoGenerator:
         opening_title_size = 75
         kb_profile = resolve_ken_burns_profile(animation_cfg)
 
+        # Each scene is an independent ffmpeg process; run several at once and split
+        # the cores between them so the total encoder threads stay near cpu_count.
+        cpu_count = os.cpu_count() or 2
+        ff_opts = ffmpeg_cfg if isinstance(ffmpeg_cfg, dict) else {}
+        workers = int(ff_opts.get("workers") or max(1, cpu_count // 2))
+        # LONGVIDEO_FFMPEG_THREADS overrides the config for one-off tuning on a given host.
+        env_threads = os.getenv("LONGVIDEO_FFMPEG_THREADS", "").strip()
+        threads_per_worker = int(env_threads or ff_opts.get("threads_per_worker") or 2)
+        single_pass = bool(ff_opts.get("single_pass", False))
+        raw_overlays = bool(ff_opts.get("raw_overlays", True))
+        # Overlays keyed by content hash, shared across runs; empty/false disables it.
+        cache_dir = ff_opts.get("overlay_cache_dir", _user_cache_dir() / "overlays")
+        self._overlay_cache_root: Optional[Path] = Path(cache_dir).expanduser() if cache_dir else None
+        self._overlay_cache_max_bytes = int(float(ff_opts.get("overlay_cache_max_mb", _OVERLAY_CACHE_MAX_MB)) * 1024 * 1024)
+        bgm_cache_dir = ff_opts.get("bgm_cache_dir", _user_cache_dir() / "bgm")
+        self._bgm_cache_root: Optional[Path] = Path(bgm_cache_dir).expanduser() if bgm_cache_dir else None
+
         self.render_cfg = RenderConfig(
             width=int(video_cfg.get("width", 1280)),
             height=int(video_cfg.get("height", 720)),
             fps=int(video_cfg.get("fps", 30)),
-            codec=str(video_cfg.get("codec", "libx264")),
+            # video.hwaccel: false keeps "auto" on libx264 (e.g. for flaky GPU drivers).
+            codec=_resolve_codec(str(video_cfg.get("codec", "auto")), hwaccel=bool(video_cfg.get("hwaccel", True))),
             bitrate=str(video_cfg.get("bitrate")) if video_cfg.get("bitrate") else None,
-            preset=str(video_cfg.get("preset", "ultrafast")),
+            preset=str(video_cfg.get("preset", "auto")),
             crf=int(video_cfg.get("crf", 20)) if video_cfg.get("crf") else 20,
             audio_codec=str(video_cfg.get("audio_codec", "aac")),
             audio_bitrate=str(video_cfg.get("audio_bitrate")) if video_cfg.get("audio_bitrate") else None,
@@ -94,11 +221,33 @@ class FFmpegVideoGenerator:
             body_color=_hex_to_rgb(colors.get("default", "#FFFFFF")),
             band_color=_hex_to_rgba(colors.get("background_box", "#000000F0")),
             opening_title_font_size=opening_title_size,
+            workers=max(1, workers),
+            threads_per_worker=max(1, threads_per_worker),
+            single_pass=single_pass,
+            raw_overlays=raw_overlays,
         )
 
-        self._font_cache: Dict[Tuple[int, bool], ImageFont.FreeTypeFont] = {}
+        self._auto_preset = self.render_cfg.preset == "auto"
+        _enable_pillow_block_cache()
+        # Font files are resolved here once; _get_font only loads sizes.
+        self._font_files: Dict[bool, str] = {bold: self._resolve_font(bold) for bold in (False, True)}
         self._overlay_cache: Dict[Tuple[str, int, Tuple[str, ...]], Path] = {}
         self._opening_cache: Dict[Tuple[str, Tuple[str, ...]], Path] = {}
+        self._band_cache: Dict[Tuple[str, int, Tuple[str, ...]], Tuple[Path, dict]] = {}
+        self._band_templates: Dict[Tuple[int, int], Image.Image] = {}
+        self._band_scratch: Dict[Tuple[int, int], Image.Image] = {}
+        self._overlay_lock = _PILLOW_LOCK
+        self._measure_cache: Dict[Tuple[int, str], Tuple[int, int]] = {}
+        self._overlay_sizes: Dict[Path, Tuple[int, int]] = {}
+        # Caption overlays are cropped to the band: (x, gap to the frame bottom) per file.
+        self._overlay_offsets: Dict[Path, Tuple[int, int]] = {}
+        # Content digest -> (overlay written in this process, metadata), see _restore_cached_overlay.
+        self._overlays_by_digest: Dict[str, Tuple[Path, dict]] = {}
+        # Directories created by this generator; see _ensure_dir.
+        self._made_dirs: Set[Path] = set()
+        # Bytes in the shared overlay cache, counted on the first store; see _prune_overlay_cache.
+        self._overlay_cache_bytes: Optional[int] = None
+        self._overlay_cache_lock = threading.Lock()
         bgm_cfg = config.get("bgm", {}) if isinstance(config, dict) else {}
         directory = str(bgm_cfg.get("directory", "background_music") or "background_music").strip()
         self._bgm_directory = directory if directory else "background_music"
@@ -106,6 +255,8 @@ class FFmpegVideoGenerator:
         if selected and not selected.lower().endswith(".mp3"):
             selected = f"{selected}.mp3"
         self._bgm_selected = selected
+        # Strict -14 LUFS program loudness (loudnorm) is opt-in; dynaudnorm is much cheaper.
+        self._bgm_loudnorm = bool(bgm_cfg.get("loudnorm", False))
         # Overlay/text effect mode from runtime config (default: static)
         overlay_cfg = config.get("overlay", {}) if isinstance(config, dict) else {}
         try:
@@ -124,43 +275,12 @@ class FFmpegVideoGenerator:
         lower_fp = font_path.lower()
         self.ass_bold = any(key in lower_fp for key in ("bold", "extrabold", "black", "heavy", "demibold", "semibold"))
 
-        # Try to extract PostScript name from font file for stable selection in libass
-        def _ps_name_from_font(path: str) -> str | None:
-            if not path:
-                return None
-            try:
-                from fontTools.ttLib import TTFont  # type: ignore
-            except Exception:
-                # Fallback to filename stem
-                try:
-                    from pathlib import Path as _P
-                    stem = _P(path).stem
-                    return stem if stem else None
-                except Exception:
-                    return None
-            try:
-                font = TTFont(path)
-                name_records = font["name"].names if "name" in font else []
-                for rec in name_records:
-                    if rec.nameID == 6:  # PostScript name
-                        try:
-                            return rec.toStr()
-                        except Exception:
-                            try:
-                                return rec.string.decode(rec.getEncoding(), errors="ignore")
-                            except Exception:
-                                continue
-            except Exception:
-                pass
-            # Last resort: filename stem
-            try:
-                from pathlib import Path as _P
-                stem = _P(path).stem
-                return stem if stem else None
-            except Exception:
-                return None
-
-        self.ass_font_psname = _ps_name_from_font(font_path) or self.ass_font_family
+        # PostScript name from the font file gives libass a stable selection
+        try:
+            font_mtime = os.stat(font_path).st_mtime_ns if font_path else 0
+        except OSError:
+            font_mtime = 0
+        self.ass_font_psname = _ps_name_from_font(font_path, font_mtime) or self.ass_font_family
         # Style override string for subtitles filter
         self.ass_force_style = f"FontName={self.ass_font_psname},Bold={(1 if self.ass_bold else 0)}"
 
@@ -187,23 +307,192 @@ class FFmpegVideoGenerator:
             except Exception:
                 pass
 
-        # Render scenes quietly (no bars), matching MoviePy which shows progress only at final write
-        for scene in scene_list:
-            if getattr(scene, "scene_type", "content") == "opening":
-                path = self._render_opening_scene(run_dir, scene_dir, scene, thumbnail_title)
-            else:
-                path = self._render_content_scene(run_dir, scene_dir, scene)
-            rendered.append(path)
+        if self._auto_preset:
+            has_kb = cfg.ken_burns_mode == "pan_only" or (cfg.ken_burns_zoom or 0.0) > 0
+            preset = _pick_preset(total_duration, has_kb)
+            logger.info("FFmpeg: preset %s for %.0fs program (ken_burns=%s)", preset, total_duration, has_kb)
+            cfg = replace(cfg, preset=preset)
+            self.render_cfg = cfg
 
         concat_path = run_dir / "temp_concat.mp4"
-        concat_mp4_streamcopy(rendered, concat_path)
+        video_source = concat_path
+        with ThreadPoolExecutor(max_workers=cfg.workers) as overlay_pool:
+            # Overlays render in the background; each scene waits only for its own.
+            pending = self._prepare_overlays(run_dir, scene_list, thumbnail_title, executor=overlay_pool)
+            if cfg.single_pass and scene_list:
+                _wait_all(f for scene_futures in pending for f in scene_futures)
+                self._render_single_pass(run_dir, scene_list, thumbnail_title, concat_path, total_duration)
+            else:
+                # Render scenes quietly (no bars), matching MoviePy which shows progress only at final write.
+                # Scenes run in parallel; results are collected in submission order for concat.
+                workers = min(cfg.workers, max(len(scene_list), 1))
+                logger.info("FFmpeg: rendering %d scene(s) with %d worker(s)", len(scene_list), workers)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            self._render_scene_when_ready, scene_futures, run_dir, scene_dir, scene, thumbnail_title
+                        )
+                        for scene, scene_futures in zip(scene_list, pending)
+                    ]
+                    try:
+                        rendered.extend(future.result() for future in futures)
+                    except BaseException:
+                        # One failed scene fails the render; drop queued scenes and overlays.
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        overlay_pool.shutdown(wait=True, cancel_futures=True)
+                        raise
+
+                # The final mux reads the scenes through the concat demuxer directly,
+                # so the joined video is written once instead of via temp_concat.mp4.
+                video_source = write_concat_list(rendered, scene_dir / "scenes.ffconcat")
 
         # Final write: show a single progress bar like MoviePy
         final_path = output_path
-        self._mix_bgm(concat_path, final_path, total_duration=total_duration)
+        self._mix_bgm(video_source, final_path, total_duration=total_duration)
         return final_path
 
     # Scene builders -----------------------------------------------------
+    def _prepare_overlays(
+        self,
+        run_dir: Path,
+        scene_list: Sequence[object],
+        title: str,
+        *,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> List[List["Future[object]"]]:
+        """Create every overlay image up front so scene builders only hit the caches.
+
+        Drawing is serialized by the overlay lock, but PNG/raw encoding and file
+        writes of one overlay overlap with drawing the next. With `executor`, jobs
+        are only submitted and the per-scene futures returned; otherwise this waits.
+        """
+        jobs: List[List[Callable[[], object]]] = []
+        for scene in scene_list:
+            scene_jobs: List[Callable[[], object]] = []
+            jobs.append(scene_jobs)
+            scene_type = getattr(scene, "scene_type", "content")
+            if scene_type == "opening":
+                scene_id = str(getattr(scene, "scene_id", "OPENING"))
+                if self.overlay_mode != "typing":
+                    lines = _opening_lines(scene, title)
+                    scene_jobs.append(functools.partial(self._create_center_text_image, run_dir, scene_id, lines))
+                continue
+            scene_id = str(getattr(scene, "scene_id", "SXXX"))
+            create = self._create_band_overlay if self.overlay_mode == "typing" else self._create_text_overlay
+            for seg in getattr(scene, "text_segments", []) or []:
+                if any(str(s).strip() for s in getattr(seg, "lines", [])):
+                    scene_jobs.append(functools.partial(create, run_dir, scene_id, seg))
+        if executor is not None:
+            return [[executor.submit(job) for job in scene_jobs] for scene_jobs in jobs]
+        total = sum(len(scene_jobs) for scene_jobs in jobs)
+        if not total:
+            return [[] for _ in jobs]
+        with ThreadPoolExecutor(max_workers=min(self.render_cfg.workers, total)) as pool:
+            pending = [[pool.submit(job) for job in scene_jobs] for scene_jobs in jobs]
+            _wait_all(f for scene_futures in pending for f in scene_futures)
+        return pending
+
+    def _render_scene_when_ready(
+        self,
+        overlays: Sequence["Future[object]"],
+        run_dir: Path,
+        scene_dir: Path,
+        scene: object,
+        title: str,
+    ) -> Path:
+        # Overlay files must be complete before the scene graph references them.
+        _wait_all(overlays)
+        return self._render_scene_dispatch(run_dir, scene_dir, scene, title)
+
+    def _render_scene_dispatch(self, run_dir: Path, scene_dir: Path, scene: object, title: str) -> Path:
+        if getattr(scene, "scene_type", "content") == "opening":
+            return self._render_opening_scene(run_dir, scene_dir, scene, title)
+        return self._render_content_scene(run_dir, scene_dir, scene)
+
+    def _scene_graph(
+        self,
+        run_dir: Path,
+        scene: object,
+        title: str,
+        *,
+        input_offset: int = 0,
+        label_prefix: str = "",
+    ) -> "_SceneGraph":
+        if getattr(scene, "scene_type", "content") == "opening":
+            return self._opening_scene_graph(
+                run_dir, scene, title, input_offset=input_offset, label_prefix=label_prefix
+            )
+        return self._content_scene_graph(run_dir, scene, input_offset=input_offset, label_prefix=label_prefix)
+
+    def _render_single_pass(
+        self,
+        run_dir: Path,
+        scene_list: Sequence[object],
+        title: str,
+        output: Path,
+        total_duration: float,
+    ) -> Path:
+        """Render all scenes through one filter_complex and a single encode.
+
+        Each scene graph is embedded with shifted input indices and a per-scene label
+        prefix; video is trimmed and audio padded/trimmed to the scene duration so the
+        concat filter sees aligned pairs.
+        """
+        cfg = self.render_cfg
+        sr = str(cfg.audio_sample_rate)
+        inputs: List[str] = []
+        chains: List[str] = []
+        pairs: List[str] = []
+        offset = 0
+        for k, scene in enumerate(scene_list):
+            graph = self._scene_graph(run_dir, scene, title, input_offset=offset, label_prefix=f"s{k}_")
+            inputs += graph.inputs
+            chains.append(graph.filter_graph)
+            chains.append(
+                f"{graph.video_label}trim=duration={graph.duration:.3f},setpts=PTS-STARTPTS,setsar=1[s{k}v]"
+            )
+            chains.append(
+                f"[{graph.audio_input}:a]aformat=sample_fmts=fltp:sample_rates={sr}:channel_layouts=stereo,"
+                f"apad,atrim=0:{graph.duration:.3f},asetpts=PTS-STARTPTS[s{k}a]"
+            )
+            pairs.append(f"[s{k}v][s{k}a]")
+            offset += graph.input_count
+        chains.append(f"{''.join(pairs)}concat=n={len(pairs)}:v=1:a=1[vout][aout]")
+
+        logger.info("FFmpeg: single-pass render of %d scene(s) from %d input(s)", len(pairs), offset)
+        # One process owns the whole machine here, so it gets the combined thread budget.
+        threads = cfg.workers * cfg.threads_per_worker
+        args: List[str] = ["-filter_complex_threads", str(threads)] + inputs
+        args += ["-filter_complex", ";".join(chains), "-map", "[vout]", "-map", "[aout]"]
+        args += _encode_args(cfg, threads=threads)
+        args += ["-y", str(output)]
+        run_ffmpeg_stream(args, expected_duration_sec=total_duration, label="Scenes")
+        return output
+
+    def _encode_scene(self, graph: "_SceneGraph", out: Path, bar=None, offset_seconds: float = 0.0) -> Path:
+        # Without this the filter graph spawns cpu_count threads in every parallel worker.
+        args: List[str] = ["-filter_complex_threads", str(self.render_cfg.threads_per_worker)] + graph.inputs + [
+            "-filter_complex",
+            graph.filter_graph,
+            "-map",
+            graph.video_label,
+            "-map",
+            f"{graph.audio_input}:a:0",
+        ]
+        args += _encode_args(self.render_cfg)
+        args += ["-shortest", "-y", str(out)]
+        if bar is None:
+            run_ffmpeg(args)
+        else:
+            run_ffmpeg_stream(
+                args,
+                expected_duration_sec=graph.duration,
+                label=graph.label,
+                external_bar=bar,
+                offset_seconds=offset_seconds,
+            )
+        return out
+
     def _render_opening_scene(
         self,
         run_dir: Path,
@@ -213,18 +502,28 @@ class FFmpegVideoGenerator:
         bar=None,
         offset_seconds: float = 0.0,
     ) -> Path:
+        scene_id = str(getattr(scene, "scene_id", "OPENING"))
+        graph = self._opening_scene_graph(run_dir, scene, title)
+        return self._encode_scene(graph, scene_dir / f"{scene_id}.mp4", bar, offset_seconds)
+
+    def _opening_scene_graph(
+        self,
+        run_dir: Path,
+        scene: object,
+        title: str,
+        *,
+        input_offset: int = 0,
+        label_prefix: str = "",
+    ) -> "_SceneGraph":
         duration = max(0.01, float(getattr(scene, "duration", 3.0)))
         scene_id = str(getattr(scene, "scene_id", "OPENING"))
-        out = scene_dir / f"{scene_id}.mp4"
 
         cfg = self.render_cfg
-        segs = list(getattr(scene, "text_segments", []))
-        lines = [ln for ln in (list(getattr(segs[0], "lines", [])) if segs else [title]) if str(ln).strip()]
+        lines = _opening_lines(scene, title)
 
         # Typing mode: render black base + ASS karaoke (no PNG text)
         if getattr(self, "overlay_mode", "static") == "typing":
-            ass_dir = run_dir / "ass"
-            ass_dir.mkdir(parents=True, exist_ok=True)
+            ass_dir = self._ensure_dir(run_dir / "ass")
             ass_path = ass_dir / f"{scene_id}.ass"
 
             try:
@@ -278,21 +577,21 @@ class FFmpegVideoGenerator:
                 ass_path = None
 
             # Build inputs: black base + narration audio
-            args: List[str] = []
             narration_path = Path(getattr(scene, "narration_path"))
-            args += [
-                "-t",
-                f"{duration:.3f}",
-                "-f",
-                "lavfi",
-                "-r",
-                str(cfg.fps),
-                "-i",
-                f"color=c=black:size={cfg.width}x{cfg.height}",
-                "-i",
-                str(narration_path),
-                "-filter_complex",
-                _build_content_filter(
+            return _SceneGraph(
+                inputs=[
+                    "-t",
+                    f"{duration:.3f}",
+                    "-f",
+                    "lavfi",
+                    "-r",
+                    str(cfg.fps),
+                    "-i",
+                    f"color=c=black:size={cfg.width}x{cfg.height}",
+                    "-i",
+                    str(narration_path),
+                ],
+                filter_graph=_build_content_filter(
                     has_base_image=False,
                     w=cfg.width,
                     h=cfg.height,
@@ -312,69 +611,42 @@ class FFmpegVideoGenerator:
                     overlays=[],
                     ass_subtitles_path=ass_path,
                     ass_force_style=self.ass_force_style if ass_path is not None else None,
+                    input_offset=input_offset,
+                    label_prefix=label_prefix,
                 ),
-                "-map",
-                "[vout]",
-                "-map",
-                "1:a:0",
-            ]
-            args += _encode_args(cfg)
-            args += ["-shortest", "-y", str(out)]
-            if bar is None:
-                run_ffmpeg(args)
-            else:
-                run_ffmpeg_stream(
-                    args,
-                    expected_duration_sec=duration,
-                    label="Opening",
-                    external_bar=bar,
-                    offset_seconds=offset_seconds,
-                )
-            return out
+                input_count=2,
+                video_label=f"[{label_prefix}vout]",
+                audio_input=input_offset + 1,
+                duration=duration,
+                label="Opening",
+            )
 
         # Static mode (default): render centered PNG text on black
         overlay = self._create_center_text_image(run_dir, scene_id, lines)
-        args: List[str] = []
         narration_path = Path(getattr(scene, "narration_path"))
-        args += [
-            "-t",
-            f"{duration:.3f}",
-            "-f",
-            "lavfi",
-            "-r",
-            str(cfg.fps),
-            "-i",
-            f"color=c=black:size={cfg.width}x{cfg.height}",
-            "-loop",
-            "1",
-            "-framerate",
-            str(cfg.fps),
-            "-t",
-            f"{duration:.3f}",
-            "-i",
-            str(overlay),
-            "-i",
-            str(narration_path),
-            "-filter_complex",
-            _overlay_center_filter(cfg.width, cfg.height, cfg.fps),
-            "-map",
-            "[vout]",
-            "-map",
-            "2:a:0",
-        ]
-        args += _encode_args(cfg)
-        args += ["-shortest", "-y", str(out)]
-        if bar is None:
-            run_ffmpeg(args)
-        else:
-            run_ffmpeg_stream(
-                args,
-                expected_duration_sec=duration,
-                label="Opening",
-                external_bar=bar,
-                offset_seconds=offset_seconds,
-            )
-        return out
+        return _SceneGraph(
+            inputs=[
+                "-t",
+                f"{duration:.3f}",
+                "-f",
+                "lavfi",
+                "-r",
+                str(cfg.fps),
+                "-i",
+                f"color=c=black:size={cfg.width}x{cfg.height}",
+                *self._still_input_args(overlay, duration),
+                "-i",
+                str(narration_path),
+            ],
+            filter_graph=_overlay_center_filter(
+                cfg.width, cfg.height, cfg.fps, input_offset=input_offset, label_prefix=label_prefix
+            ),
+            input_count=3,
+            video_label=f"[{label_prefix}vout]",
+            audio_input=input_offset + 2,
+            duration=duration,
+            label="Opening",
+        )
 
     def _render_content_scene(
         self,
@@ -384,10 +656,21 @@ class FFmpegVideoGenerator:
         bar=None,
         offset_seconds: float = 0.0,
     ) -> Path:
+        scene_id = str(getattr(scene, "scene_id", "SXXX"))
+        graph = self._content_scene_graph(run_dir, scene)
+        return self._encode_scene(graph, scene_dir / f"{scene_id}.mp4", bar, offset_seconds)
+
+    def _content_scene_graph(
+        self,
+        run_dir: Path,
+        scene: object,
+        *,
+        input_offset: int = 0,
+        label_prefix: str = "",
+    ) -> "_SceneGraph":
         cfg = self.render_cfg
         duration = max(0.01, float(getattr(scene, "duration", 1.0)))
         scene_id = str(getattr(scene, "scene_id", "SXXX"))
-        out = scene_dir / f"{scene_id}.mp4"
 
         image_path: Optional[Path] = getattr(scene, "image_path", None)
         if image_path is not None:
@@ -395,19 +678,11 @@ class FFmpegVideoGenerator:
 
         # Build inputs: base image (or color), overlays for each segment, narration audio
         inputs: List[str] = []
-        if image_path and image_path.exists():
-            # Use single-frame image input.
-            if self.render_cfg.ken_burns_mode == "pan_only":
-                # For pan_only, we need a timed stream so crop expressions can use t.
-                inputs += [
-                    "-loop", "1",
-                    "-framerate", str(cfg.fps),
-                    "-t", f"{duration:.3f}",
-                    "-i", str(image_path),
-                ]
-            else:
-                # zoompan path can synthesize frames
-                inputs += ["-i", str(image_path)]
+        has_base_image = bool(image_path and image_path.exists())
+        if has_base_image:
+            # Single-frame image input: zoompan synthesizes frames itself and pan_only
+            # repeats the pre-scaled frame with the loop filter.
+            inputs += ["-i", str(image_path)]
         else:
             # Fallback: provide a single-frame color input, zoompan will expand
             one_frame = 1.0 / max(cfg.fps, 1)
@@ -446,17 +721,11 @@ class FFmpegVideoGenerator:
                 pos_y = int(self.render_cfg.height - geom["band_height"] + geom["text_top_y"])
                 fixedpos_segments.append((start, dur, lines, pos_x, pos_y))
 
-        for overlay, _, _ in overlay_specs:
-            inputs += [
-                "-loop",
-                "1",
-                "-framerate",
-                str(cfg.fps),
-                "-t",
-                f"{duration:.3f}",
-                "-i",
-                str(overlay),
-            ]
+        # Each caption input only spans its own window: shifted to its start and cut
+        # to its length, so ffmpeg neither reads nor blends it outside that window.
+        min_dur = 1.0 / max(cfg.fps, 1)
+        for overlay, start, dur in overlay_specs:
+            inputs += self._still_input_args(overlay, max(dur, min_dur), start=start)
 
         narration_path = Path(getattr(scene, "narration_path"))
         inputs += ["-i", str(narration_path)]
@@ -464,8 +733,7 @@ class FFmpegVideoGenerator:
         # Build filter graph for base Ken Burns + overlays; add subtitles after overlays so text stays above the band
         ass_path = None
         if self.overlay_mode == "typing":
-            ass_dir = run_dir / "ass"
-            ass_dir.mkdir(parents=True, exist_ok=True)
+            ass_dir = self._ensure_dir(run_dir / "ass")
             ass_path = ass_dir / f"{scene_id}.ass"
             try:
                 from long_form.ass_timeline import build_ass_karaoke_centered, KaraokeLineSpec
@@ -507,7 +775,7 @@ class FFmpegVideoGenerator:
                 ass_path = None
 
         filter_graph = _build_content_filter(
-            has_base_image=bool(image_path and image_path.exists()),
+            has_base_image=has_base_image,
             w=cfg.width,
             h=cfg.height,
             fps=cfg.fps,
@@ -524,38 +792,29 @@ class FFmpegVideoGenerator:
             ken_intro_seconds=self.render_cfg.ken_burns_intro_seconds,
             ken_vector=getattr(scene, "ken_burns_vector", (-1.0, -1.0)),
             overlays=overlay_specs,
+            overlay_offsets=[self._overlay_offsets.get(overlay, (0, 0)) for overlay, _, _ in overlay_specs],
             ass_subtitles_path=ass_path,
             ass_force_style=self.ass_force_style if ass_path is not None else None,
+            input_offset=input_offset,
+            label_prefix=label_prefix,
         )
 
-        args: List[str] = inputs + [
-            "-filter_complex",
-            filter_graph,
-            "-map",
-            "[vout]",
-            "-map",
-            f"{len(overlay_specs)+1}:a:0",  # last input is narration audio
-        ]
-        args += _encode_args(cfg)
-        args += ["-shortest", "-y", str(out)]
-        if bar is None:
-            run_ffmpeg(args)
-        else:
-            run_ffmpeg_stream(
-                args,
-                expected_duration_sec=duration,
-                label=str(scene_id),
-                external_bar=bar,
-                offset_seconds=offset_seconds,
-            )
-        return out
+        return _SceneGraph(
+            inputs=inputs,
+            filter_graph=filter_graph,
+            input_count=len(overlay_specs) + 2,
+            video_label=f"[{label_prefix}vout]",
+            audio_input=input_offset + len(overlay_specs) + 1,  # last input is narration audio
+            duration=duration,
+            label=scene_id,
+        )
 
     def _mix_bgm(self, input_video: Path, output_path: Path, *, total_duration: float) -> Path:
         cfg = self.render_cfg
         bgm_path = self._resolve_bgm_path()
         if bgm_path is None or not bgm_path.exists():
             # Fast path: just move/copy streams with faststart
-            args = ["-i", str(input_video), "-c", "copy", "-movflags", "+faststart", "-y", str(output_path)]
+            args = [*_video_source_args(input_video), "-c", "copy", "-movflags", "+faststart", "-y", str(output_path)]
             # Show a single bar for the final write (MoviePy-like)
             run_ffmpeg_stream(args, expected_duration_sec=total_duration, label="Render")
             return output_path
@@ -571,27 +830,38 @@ class FFmpegVideoGenerator:
             0.24,
             "on",
         )
+        if self._bgm_loudnorm:
+            final_norm = "loudnorm=I=-14:LRA=7:TP=-1.5"
+        else:
+            # Frame-wise gain leveling: no integrated-LUFS target, but several times
+            # cheaper than single-pass loudnorm on a long program.
+            final_norm = "dynaudnorm=f=500:g=31:p=0.95"
+        bed = self._prepared_bgm(bgm_path, total_duration)
+        if bed is not None:
+            # Already normalized, attenuated and long enough: only trim and fade here.
+            bgm_input = ["-i", str(bed)]
+            bgm_prep = ""
+        else:
+            bgm_input = ["-stream_loop", "-1", "-i", str(bgm_path)]
+            # EBU R128 normalize first, then reduce level
+            bgm_prep = "loudnorm=I=-30:LRA=7:TP=-2,volume=0.24,"
         filter_complex = (
-            # Prepare BGM: EBU R128 normalize first, then reduce level, fade, and format
+            # Prepare BGM: normalize (unless pre-rendered), fade, and format
             f"[1:a]atrim=0:duration={total_duration:.3f},asetpts=PTS-STARTPTS,"
-            f"loudnorm=I=-30:LRA=7:TP=-2,"
-            f"volume=0.24,afade=t=in:st=0:d=0.5,afade=t=out:st={fade_out_st:.3f}:d=1.0,"
+            f"{bgm_prep}"
+            f"afade=t=in:st=0:d=0.5,afade=t=out:st={fade_out_st:.3f}:d=1.0,"
             f"aformat=sample_fmts=fltp:sample_rates={sr}:channel_layouts=stereo[bgm];"
             # Prepare narration: force stereo @ sample rate
             f"[0:a]aformat=sample_fmts=fltp:sample_rates={sr}:channel_layouts=stereo[narr];"
             # Mix 2 inputs, duration=first keeps final length tied to video/narration
             f"[narr][bgm]amix=inputs=2:duration=first:dropout_transition=2[a];"
             # Final loudness normalization for the whole program
-            f"[a]loudnorm=I=-14:LRA=7:TP=-1.5,"
+            f"[a]{final_norm},"
             f"aformat=sample_fmts=fltp:sample_rates={sr}:channel_layouts=stereo[aout]"
         )
         args: List[str] = [
-            "-i",
-            str(input_video),
-            "-stream_loop",
-            "-1",
-            "-i",
-            str(bgm_path),
+            *_video_source_args(input_video),
+            *bgm_input,
             "-filter_complex",
             filter_complex,
             "-map",
@@ -614,6 +884,61 @@ class FFmpegVideoGenerator:
         run_ffmpeg_stream(args, expected_duration_sec=total_duration, label="Render")
         return output_path
 
+    def _prepared_bgm(self, bgm_path: Path, total_duration: float) -> Optional[Path]:
+        """Return a looped, loudness-normalized BGM bed at least `total_duration` long.
+
+        Beds come in fixed length buckets and are cached per source file, so the
+        costly loudnorm pass runs once per track and bucket instead of every render.
+        Returns None when caching is disabled or the bed cannot be built.
+        """
+        root = self._bgm_cache_root
+        if root is None:
+            return None
+        bucket = next((b for b in _BGM_BUCKETS if b >= total_duration), None)
+        if bucket is None:
+            bucket = int(math.ceil(total_duration / _BGM_BUCKETS[-1])) * _BGM_BUCKETS[-1]
+        cfg = self.render_cfg
+        try:
+            stat = bgm_path.stat()
+        except OSError:
+            return None
+        source_key = f"{bgm_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        tag = hashlib.sha256(source_key.encode("utf-8")).hexdigest()[:12]
+        bed = root / f"{bgm_path.stem}_{bucket}s_{cfg.audio_sample_rate}_{tag}.m4a"
+        if bed.exists():
+            return bed
+
+        sr = str(cfg.audio_sample_rate)
+        tmp = bed.with_name(f".{bed.stem}.{os.getpid()}.{threading.get_ident()}.m4a")
+        logger.info("Preparing BGM bed %s (%ds)", bed.name, bucket)
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+            run_ffmpeg(
+                [
+                    "-stream_loop",
+                    "-1",
+                    "-i",
+                    str(bgm_path),
+                    "-af",
+                    f"atrim=0:duration={bucket},asetpts=PTS-STARTPTS,"
+                    f"loudnorm=I=-30:LRA=7:TP=-2,volume=0.24,"
+                    f"aformat=sample_fmts=fltp:sample_rates={sr}:channel_layouts=stereo",
+                    "-vn",
+                    "-c:a",
+                    "aac",
+                    "-b:a",
+                    "256k",
+                    "-y",
+                    str(tmp),
+                ]
+            )
+            os.replace(tmp, bed)
+        except (OSError, RuntimeError) as exc:
+            logger.warning("BGM bed preparation failed; normalizing inline: %s", exc)
+            tmp.unlink(missing_ok=True)
+            return None
+        return bed
+
     def _resolve_bgm_path(self) -> Optional[Path]:
         if not getattr(self, "_bgm_selected", None):
             return None
@@ -638,41 +963,257 @@ class FFmpegVideoGenerator:
         return None
 
     # Overlay image helpers ---------------------------------------------
-    def _get_font(self, size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-        key = (size, bold)
-        if key in self._font_cache:
-            return self._font_cache[key]
+    def _save_overlay(
+        self,
+        image: Image.Image,
+        output_path: Path,
+        digest: Optional[str] = None,
+        meta: Optional[dict] = None,
+    ) -> None:
+        raw_path = output_path.with_suffix(".raw")
+        self._forget_overlay_path(output_path)
+        # Run files may be hard links into the shared cache; never write through them.
+        output_path.unlink(missing_ok=True)
+        raw_path.unlink(missing_ok=True)
+        # Overlays are consumed right away by a local ffmpeg; fast deflate beats small files.
+        image.save(output_path, format="PNG", compress_level=1, optimize=False)
+        if self.render_cfg.raw_overlays:
+            # Uncompressed RGBA copy so ffmpeg skips PNG decoding for every scene.
+            raw_path.write_bytes(image.tobytes())
+            self._overlay_sizes[output_path] = image.size
+        if digest is None:
+            return
+        meta = {**(meta or {}), "size": list(image.size)}
+        self._overlays_by_digest[digest] = (output_path, meta)
+        if self._overlay_cache_root is not None:
+            try:
+                self._store_cached_overlay(digest, output_path, meta)
+            except OSError as exc:
+                logger.debug("Overlay cache store failed for %s: %s", output_path, exc)
 
-        font_path = self.render_cfg.font_path
+    def _overlay_digest(self, kind: str, lines: Sequence[str]) -> str:
+        """Content hash of everything that affects an overlay's pixels."""
+        cfg = self.render_cfg
+        key = [
+            _OVERLAY_CACHE_VERSION,
+            kind,
+            list(lines),
+            cfg.width,
+            cfg.height,
+            self._font_files[False],
+            self._font_files[True],
+            cfg.body_font_size,
+            cfg.opening_title_font_size,
+            list(cfg.body_color),
+            list(cfg.band_color),
+            PIL.__version__,
+        ]
+        return hashlib.sha256(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def _restore_cached_overlay(self, digest: str, output_path: Path) -> Optional[dict]:
+        """Link/copy a cached overlay into the run dir; return its metadata or None on a miss.
+
+        Overlays drawn earlier in this process are checked first, so identical captions
+        in different scenes are drawn once even with the disk cache disabled.
+        """
+        local = self._overlays_by_digest.get(digest)
+        root = self._overlay_cache_root
+        if local is not None:
+            src_png, meta = local
+        elif root is not None:
+            src_png, meta = root / f"{digest}.png", None
+        else:
+            return None
+        raw_overlays = self.render_cfg.raw_overlays
         try:
-            if font_path and Path(font_path).exists():
-                font = ImageFont.truetype(str(font_path), size=size)
-            else:
-                fallback_name = "NotoSansJP-ExtraBold.ttf" if bold else "NotoSansJP-Bold.ttf"
-                fallback_path = Path("fonts") / fallback_name
-                if fallback_path.exists():
-                    font = ImageFont.truetype(str(fallback_path), size=size)
-                else:
-                    system_fallback = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
-                    font = ImageFont.truetype(system_fallback, size=size)
-        except OSError:
-            font = ImageFont.load_default()
-        self._font_cache[key] = font
-        return font
+            if meta is None:
+                meta = json.loads((root / f"{digest}.json").read_text(encoding="utf-8"))
+            if src_png != output_path:
+                self._forget_overlay_path(output_path)
+                _link_or_copy(src_png, output_path)
+            if raw_overlays and local is not None:
+                src_raw = src_png.with_suffix(".raw")
+                if src_raw != output_path.with_suffix(".raw"):
+                    _link_or_copy(src_raw, output_path.with_suffix(".raw"))
+            elif raw_overlays:
+                # The shared cache keeps only the PNG; decoding it once is still
+                # far cheaper than drawing the text again.
+                raw_path = output_path.with_suffix(".raw")
+                raw_path.unlink(missing_ok=True)
+                with Image.open(output_path) as image:
+                    raw_path.write_bytes(image.convert("RGBA").tobytes())
+            if local is None:
+                # Mark the entry as recently used so pruning drops stale overlays first.
+                os.utime(src_png)
+        except (OSError, ValueError):
+            return None
+        # Track the newest copy; older ones may be overwritten by later scenes.
+        self._overlays_by_digest[digest] = (output_path, meta)
+        if self.render_cfg.raw_overlays:
+            width, height = meta["size"]
+            self._overlay_sizes[output_path] = (int(width), int(height))
+        return meta
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """mkdir -p once per directory instead of once per overlay/scene."""
+        if path not in self._made_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(path)
+        return path
+
+    def _forget_overlay_path(self, output_path: Path) -> None:
+        # The file is about to hold different content; drop digests that point at it.
+        for digest, (path, _) in list(self._overlays_by_digest.items()):
+            if path == output_path:
+                self._overlays_by_digest.pop(digest, None)
+
+    def _store_cached_overlay(self, digest: str, output_path: Path, meta: dict) -> None:
+        root = self._overlay_cache_root
+        assert root is not None
+        self._ensure_dir(root)
+        # Only the PNG is shared; the .raw copy is rebuilt from it on restore.
+        png = root / f"{digest}.png"
+        _link_or_copy(output_path, png)
+        # Metadata goes last and atomically: its presence marks a complete entry.
+        tmp = root / f".{digest}.{os.getpid()}.{threading.get_ident()}.json"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, root / f"{digest}.json")
+        self._prune_overlay_cache(png.stat().st_size)
+
+    def _prune_overlay_cache(self, added: int) -> None:
+        """Drop least recently used overlays once the shared cache exceeds its cap.
+
+        The directory is scanned on the first store and whenever the running total
+        passes the cap, not on every overlay.
+        """
+        root = self._overlay_cache_root
+        assert root is not None
+        with self._overlay_cache_lock:
+            if self._overlay_cache_bytes is not None:
+                self._overlay_cache_bytes += added
+                if self._overlay_cache_bytes <= self._overlay_cache_max_bytes:
+                    return
+            # Shared .raw copies from older versions are never read again.
+            for legacy in root.glob("*.raw"):
+                legacy.unlink(missing_ok=True)
+            entries = []
+            for png in root.glob("*.png"):
+                try:
+                    stat = png.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, png))
+            total = sum(size for _, size, _ in entries)
+            # Prune down to 80% so the next few stores do not trigger another scan.
+            target = self._overlay_cache_max_bytes * 4 // 5 if total > self._overlay_cache_max_bytes else total
+            for _, size, png in sorted(entries, key=lambda entry: entry[0]):
+                if total <= target:
+                    break
+                # Sidecar first: without it the entry is treated as a miss.
+                png.with_suffix(".json").unlink(missing_ok=True)
+                png.unlink(missing_ok=True)
+                total -= size
+            self._overlay_cache_bytes = total
+
+    def _still_input_args(self, overlay: Path, duration: float, *, start: float = 0.0) -> List[str]:
+        """ffmpeg input options that repeat a still overlay for ``duration`` seconds.
+
+        A positive ``start`` shifts the input's timestamps so it begins at that time.
+        """
+        cfg = self.render_cfg
+        size = self._overlay_sizes.get(overlay)
+        offset = ["-itsoffset", f"{start:.3f}"] if start > 0 else []
+        if size is None:
+            return offset + [
+                "-loop",
+                "1",
+                "-framerate",
+                str(cfg.fps),
+                "-t",
+                f"{duration:.3f}",
+                "-i",
+                str(overlay),
+            ]
+        # "-loop" is an image2 option; rawvideo repeats its single frame via -stream_loop.
+        return offset + [
+            "-stream_loop",
+            "-1",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-video_size",
+            f"{size[0]}x{size[1]}",
+            "-framerate",
+            str(cfg.fps),
+            "-t",
+            f"{duration:.3f}",
+            "-i",
+            str(overlay.with_suffix(".raw")),
+        ]
+
+    def _resolve_font(self, bold: bool) -> str:
+        """Pick the font file for `bold` once: configured font, bundled Noto, then DejaVu."""
+        font_path = self.render_cfg.font_path
+        if font_path and Path(font_path).exists():
+            return str(font_path)
+        fallback_name = "NotoSansJP-ExtraBold.ttf" if bold else "NotoSansJP-Bold.ttf"
+        fallback_path = Path("fonts") / fallback_name
+        if fallback_path.exists():
+            return str(fallback_path)
+        # Bare name: Pillow searches the system font directories.
+        return "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+
+    def _get_font(self, size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+        return _load_font(self._font_files[bold], size)
 
+    @_overlay_locked
     def _measure_text(self, font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int]:
+        # Fonts come from _load_font and live as long as the process, so id() is a
+        # stable key. getbbox runs a full raqm layout, and the same lines are measured
+        # again by the band, overlay and ASS layout passes.
+        key = (id(font), text)
+        cached = self._measure_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             bbox = font.getbbox(text)
-            return bbox[2] - bbox[0], bbox[3] - bbox[1]
+            size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
         except AttributeError:
-            return font.getsize(text)
+            size = font.getsize(text)
+        if len(self._measure_cache) >= _MEASURE_CACHE_SIZE:
+            self._measure_cache.clear()
+        self._measure_cache[key] = size
+        return size
 
     def _create_text_overlay(self, run_dir: Path, scene_id: str, segment: object) -> Path:
         lines: List[str] = [str(s) for s in getattr(segment, "lines", [])]
         cache_key = (scene_id, int(getattr(segment, "segment_index", 0)), tuple(lines))
-        if cache_key in self._overlay_cache:
-            return self._overlay_cache[cache_key]
+        cached = self._overlay_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        overlay_dir = self._ensure_dir(run_dir / "overlays")
+        seg_index = int(getattr(segment, "segment_index", 0))
+        output_path = overlay_dir / f"{scene_id}_seg{seg_index:02d}.png"
+        digest = self._overlay_digest("text", lines)
+        meta = self._restore_cached_overlay(digest, output_path)
+        if meta is None:
+            image, offset = self._draw_text_overlay(lines)
+            meta = {"offset": list(offset)}
+            self._save_overlay(image, output_path, digest, meta)
+        x, bottom = meta["offset"]
+        self._overlay_offsets[output_path] = (int(x), int(bottom))
+        self._overlay_cache[cache_key] = output_path
+        return output_path
 
+    @_overlay_locked
+    def _draw_text_overlay(self, lines: List[str]) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Draw a caption band and return it cropped to its visible pixels.
+
+        The second value is (x, bottom): the crop's left edge and its gap to the
+        bottom of the frame, so ffmpeg only blends the band itself.
+        """
         font = self._get_font(self.render_cfg.body_font_size)
         multi_line = len(lines) > 1
         line_spacing = int(font.size * (0.42 if multi_line else 0.25))
@@ -694,18 +1235,12 @@ class FFmpegVideoGenerator:
             + outer_margin_top
             + outer_margin_bottom
         )
-        image = Image.new("RGBA", (self.render_cfg.width, band_height), (0, 0, 0, 0))
+        image = self._band_surface(band_height, font.size)
         draw = ImageDraw.Draw(image, "RGBA")
 
         horizontal_margin = max(int(self.render_cfg.width * 0.018), 18)
-        radius = max(int(font.size * 0.42), 18)
         rect_top = outer_margin_top
         rect_bottom = band_height - outer_margin_bottom
-        rect = [
-            (horizontal_margin, rect_top),
-            (self.render_cfg.width - horizontal_margin, rect_bottom),
-        ]
-        draw.rounded_rectangle(rect, radius=radius, fill=self.render_cfg.band_color)
 
         inner_top = rect_top + inner_padding_top
         inner_bottom = rect_bottom - inner_padding_bottom
@@ -719,14 +1254,11 @@ class FFmpegVideoGenerator:
             y += text_height
             if idx < len(lines) - 1:
                 y += line_spacing
-
-        overlay_dir = run_dir / "overlays"
-        overlay_dir.mkdir(parents=True, exist_ok=True)
-        seg_index = int(getattr(segment, "segment_index", 0))
-        output_path = overlay_dir / f"{scene_id}_seg{seg_index:02d}.png"
-        image.save(output_path, format="PNG")
-        self._overlay_cache[cache_key] = output_path
-        return output_path
+        # The crop is a fresh image, so the scratch surface can be reused right away.
+        bbox = image.getbbox()
+        if bbox is None:
+            return image.copy(), (0, 0)
+        return image.crop(bbox), (bbox[0], band_height - bbox[3])
 
     def _create_band_overlay(self, run_dir: Path, scene_id: str, segment: object) -> Tuple[Path, dict]:
         """Create a band-only PNG (no text) matching static style and return geometry.
@@ -739,7 +1271,67 @@ class FFmpegVideoGenerator:
         """
         lines: List[str] = [str(s) for s in getattr(segment, "lines", [])]
         seg_index = int(getattr(segment, "segment_index", 0))
+        cache_key = (scene_id, seg_index, tuple(lines))
+        cached = self._band_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        overlay_dir = self._ensure_dir(run_dir / "overlays")
+        output_path = overlay_dir / f"{scene_id}_seg{seg_index:02d}_band.png"
+        digest = self._overlay_digest("band", lines)
+        meta = self._restore_cached_overlay(digest, output_path)
+        if meta is None:
+            image, geom, offset = self._draw_band_overlay(lines)
+            meta = {"geom": geom, "offset": list(offset)}
+            self._save_overlay(image, output_path, digest, meta)
+        geom = meta["geom"]
+        x, bottom = meta["offset"]
+        self._overlay_offsets[output_path] = (int(x), int(bottom))
+        self._band_cache[cache_key] = (output_path, geom)
+        return output_path, geom
+
+    @_overlay_locked
+    def _band_template(self, band_height: int, font_size: int) -> Image.Image:
+        """Transparent strip with the rounded caption band; callers copy before drawing."""
+        key = (band_height, font_size)
+        template = self._band_templates.get(key)
+        if template is not None:
+            return template
+        cfg = self.render_cfg
+        template = Image.new("RGBA", (cfg.width, band_height), (0, 0, 0, 0))
+        horizontal_margin = max(int(cfg.width * 0.018), 18)
+        rect = [
+            (horizontal_margin, max(int(font_size * 0.12), 6)),
+            (cfg.width - horizontal_margin, band_height - max(int(font_size * 0.35), 18)),
+        ]
+        ImageDraw.Draw(template, "RGBA").rounded_rectangle(
+            rect, radius=max(int(font_size * 0.42), 18), fill=cfg.band_color
+        )
+        self._band_templates[key] = template
+        return template
+
+    @_overlay_locked
+    def _band_surface(self, band_height: int, font_size: int) -> Image.Image:
+        """Scratch strip reset to the band template, reused across captions of this height.
 
+        Only valid while the overlay lock is held; callers must copy or crop it out.
+        """
+        key = (band_height, font_size)
+        template = self._band_template(band_height, font_size)
+        surface = self._band_scratch.get(key)
+        if surface is None:
+            surface = self._band_scratch[key] = template.copy()
+        else:
+            surface.paste(template)
+        return surface
+
+    @_overlay_locked
+    def _draw_band_overlay(self, lines: List[str]) -> Tuple[Image.Image, dict, Tuple[int, int]]:
+        """Draw the band for typing mode, cropped to the rounded rectangle.
+
+        `geom` stays in full-strip coordinates (the ASS layout is built from it);
+        the offset places the crop exactly where the strip would have put it.
+        """
         font = self._get_font(self.render_cfg.body_font_size)
         multi_line = len(lines) > 1
         line_spacing = int(font.size * (0.42 if multi_line else 0.25))
@@ -761,73 +1353,194 @@ class FFmpegVideoGenerator:
             + outer_margin_top
             + outer_margin_bottom
         )
-        image = Image.new("RGBA", (self.render_cfg.width, band_height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image, "RGBA")
+        # Band-only overlay: cropping the shared template gives a fresh image.
+        image = self._band_template(band_height, font.size)
+        offset = (0, 0)
+        bbox = image.getbbox()
+        if bbox is not None:
+            image = image.crop(bbox)
+            offset = (bbox[0], band_height - bbox[3])
 
         horizontal_margin = max(int(self.render_cfg.width * 0.018), 18)
-        radius = max(int(font.size * 0.42), 18)
         rect_top = outer_margin_top
         rect_bottom = band_height - outer_margin_bottom
-        rect = [
-            (horizontal_margin, rect_top),
-            (self.render_cfg.width - horizontal_margin, rect_bottom),
-        ]
-        draw.rounded_rectangle(rect, radius=radius, fill=self.render_cfg.band_color)
 
         inner_top = rect_top + inner_padding_top
         inner_bottom = rect_bottom - inner_padding_bottom
         available_inner = max(inner_bottom - inner_top, 0)
         text_top_y = inner_top + max((available_inner - text_block_height) // 2, 0)
 
-        overlay_dir = run_dir / "overlays"
-        overlay_dir.mkdir(parents=True, exist_ok=True)
-        output_path = overlay_dir / f"{scene_id}_seg{seg_index:02d}_band.png"
-        image.save(output_path, format="PNG")
-
         geom = {
             "band_height": band_height,
             "horizontal_margin": horizontal_margin,
             "text_top_y": int(text_top_y),
             "text_block_height": int(text_block_height),
         }
-        return output_path, geom
+        return image, geom, offset
 
     def _create_center_text_image(self, run_dir: Path, scene_id: str, lines: List[str]) -> Path:
         cache_key = (scene_id, tuple(lines))
-        if cache_key in self._opening_cache:
-            return self._opening_cache[cache_key]
+        cached = self._opening_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+        overlay_dir = self._ensure_dir(run_dir / "overlays")
+        output_path = overlay_dir / f"{scene_id}_opening.png"
+        digest = self._overlay_digest("center", lines)
+        if self._restore_cached_overlay(digest, output_path) is None:
+            self._save_overlay(self._draw_center_text_image(lines), output_path, digest)
+        self._opening_cache[cache_key] = output_path
+        return output_path
+
+    @_overlay_locked
+    def _draw_center_text_image(self, lines: List[str]) -> Image.Image:
         image = Image.new("RGBA", (self.render_cfg.width, self.render_cfg.height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(image)
         font = self._get_font(self.render_cfg.opening_title_font_size, bold=True)
 
-        total_height = 0
-        for line in lines:
-            text_width, text_height = self._measure_text(font, line)
-            total_height += text_height
-        total_height += int(font.size * 0.6) * max(len(lines) - 1, 0)
+        # One layout pass per line: sizes feed both the block height and placement.
+        sizes = [self._measure_text(font, line) for line in lines]
+        spacing = int(font.size * 0.6)
+        total_height = sum(text_height for _, text_height in sizes) + spacing * max(len(lines) - 1, 0)
 
         current_y = (self.render_cfg.height - total_height) / 2
-        for line in lines:
-            text_width, text_height = self._measure_text(font, line)
+        for line, (text_width, text_height) in zip(lines, sizes):
             draw.text(
                 ((self.render_cfg.width - text_width) / 2, current_y),
                 line,
                 font=font,
                 fill=(255, 255, 255),
             )
-            current_y += text_height + int(font.size * 0.6)
-
-        overlay_dir = run_dir / "overlays"
-        overlay_dir.mkdir(parents=True, exist_ok=True)
-        output_path = overlay_dir / f"{scene_id}_opening.png"
-        image.save(output_path, format="PNG")
-        self._opening_cache[cache_key] = output_path
-        return output_path
+            current_y += text_height + spacing
+        return image
 
 
 # ------------------------------ helpers --------------------------------
-def _encode_args(cfg: RenderConfig) -> List[str]:
+def _read_ps_name_sfnt(path: str) -> Optional[str]:
+    """Read nameID 6 straight from the SFNT ``name`` table (first face of a TTC)."""
+    with open(path, "rb") as fh:
+        tag = fh.read(4)
+        base = 0
+        if tag == b"ttcf":
+            fh.seek(12)
+            (base,) = struct.unpack(">I", fh.read(4))
+            fh.seek(base)
+            tag = fh.read(4)
+        if tag not in (b"\x00\x01\x00\x00", b"OTTO", b"true"):
+            return None
+        (num_tables,) = struct.unpack(">H", fh.read(2))
+        fh.seek(base + 12)
+        directory = fh.read(16 * num_tables)
+        for i in range(num_tables):
+            table_tag, _checksum, offset, _length = struct.unpack_from(">4sIII", directory, 16 * i)
+            if table_tag == b"name":
+                break
+        else:
+            return None
+        fh.seek(offset)
+        _fmt, count, string_offset = struct.unpack(">HHH", fh.read(6))
+        records = fh.read(12 * count)
+        candidates = {}
+        for i in range(count):
+            platform_id, encoding_id, _lang, name_id, length, str_offset = struct.unpack_from(">6H", records, 12 * i)
+            if name_id == 6 and platform_id in (0, 1, 3) and platform_id not in candidates:
+                candidates[platform_id] = (encoding_id, length, str_offset)
+        # Windows and Unicode records are UTF-16BE; Mac Roman only as a last resort.
+        for platform_id, codec in ((3, "utf-16-be"), (0, "utf-16-be"), (1, "mac_roman")):
+            if platform_id in candidates:
+                _enc, length, str_offset = candidates[platform_id]
+                fh.seek(offset + string_offset + str_offset)
+                return fh.read(length).decode(codec).strip() or None
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(font_file: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load `font_file` at `size` once per process and share it between generators.
+
+    Unbounded on purpose: _measure_cache keys on id(font), so fonts must never be evicted.
+    """
+    with _PILLOW_LOCK:
+        try:
+            return ImageFont.truetype(font_file, size=size)
+        except OSError:
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=16)
+def _ps_name_from_font(path: str, mtime_ns: int) -> str | None:
+    """PostScript name (nameID 6) of a font file, falling back to the file stem.
+
+    Parsing a large CJK font takes a noticeable moment, so results are cached per
+    path and modification time for the life of the process.
+    """
+    if not path:
+        return None
+    try:
+        name = _read_ps_name_sfnt(path)
+    except (OSError, struct.error, UnicodeDecodeError):
+        name = None
+    if name:
+        return name
+    try:
+        from fontTools.ttLib import TTFont  # type: ignore
+    except Exception:
+        # Fallback to filename stem
+        return Path(path).stem or None
+    try:
+        # lazy=True parses only the tables we touch (just "name"), not glyph data.
+        with TTFont(path, lazy=True) as font:
+            name_records = font["name"].names if "name" in font else []
+            for rec in name_records:
+                if rec.nameID == 6:  # PostScript name
+                    try:
+                        return rec.toStr()
+                    except Exception:
+                        try:
+                            return rec.string.decode(rec.getEncoding(), errors="ignore")
+                        except Exception:
+                            continue
+    except Exception:
+        pass
+    # Last resort: filename stem
+    return Path(path).stem or None
+
+
+def _wait_all(futures: Iterable["Future[object]"]) -> None:
+    """Block until every future is done, re-raising the first failure."""
+    for future in futures:
+        future.result()
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache root for rendering artifacts (honours XDG_CACHE_HOME)."""
+    cache_root = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_root) / "longvideoai"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link `src` to `dst` (replacing it), copying when linking is not possible."""
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}")
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _video_source_args(path: Path) -> List[str]:
+    """Input args for the program video; ffconcat lists go through the concat demuxer."""
+    if path.suffix == ".ffconcat":
+        return ["-safe", "0", "-f", "concat", "-i", str(path)]
+    return ["-i", str(path)]
+
+
+def _opening_lines(scene: object, title: str) -> List[str]:
+    segs = list(getattr(scene, "text_segments", []))
+    return [ln for ln in (list(getattr(segs[0], "lines", [])) if segs else [title]) if str(ln).strip()]
+
+
+def _encode_args(cfg: RenderConfig, *, threads: Optional[int] = None) -> List[str]:
     args: List[str] = [
         "-r",
         str(cfg.fps),
@@ -835,10 +1548,10 @@ def _encode_args(cfg: RenderConfig) -> List[str]:
         cfg.codec,
         "-pix_fmt",
         "yuv420p",
-        "-profile:v",
-        "high",
-        "-level:v",
-        "4.1",
+    ]
+    if cfg.codec in ("libx264", "libx265"):
+        args += ["-profile:v", "high", "-level:v", "4.1"]
+    args += [
         "-color_primaries",
         "bt709",
         "-color_trc",
@@ -851,23 +1564,50 @@ def _encode_args(cfg: RenderConfig) -> List[str]:
         cfg.audio_codec,
         "-ar",
         str(cfg.audio_sample_rate),
+        "-threads",
+        str(threads or cfg.threads_per_worker),
     ]
-    if cfg.crf is not None:
-        args += ["-crf", str(cfg.crf)]
-    if cfg.bitrate:
-        args += ["-b:v", str(cfg.bitrate)]
-    if cfg.preset:
-        args += ["-preset", str(cfg.preset)]
+    hw_quality = 23 if cfg.crf is None else cfg.crf + _HW_CQ_OFFSET
+    if cfg.codec.endswith("_nvenc"):
+        # VBR capped by quality; x264 presets do not apply. -b:v 0 lifts the
+        # bitrate ceiling unless video.bitrate asks for one.
+        args += ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", str(hw_quality)]
+        args += ["-b:v", str(cfg.bitrate) if cfg.bitrate else "0"]
+    elif cfg.codec.endswith("_videotoolbox"):
+        if cfg.bitrate:
+            args += ["-b:v", str(cfg.bitrate)]
+        else:
+            # -q:v runs 1-100, higher is better.
+            args += ["-q:v", str(max(1, min(100, 96 - 2 * hw_quality)))]
+        args += ["-allow_sw", "1"]
+    elif cfg.codec.endswith("_qsv"):
+        if cfg.bitrate:
+            args += ["-b:v", str(cfg.bitrate)]
+        else:
+            args += ["-global_quality", str(hw_quality)]
+        args += ["-preset", "veryfast"]
+    else:
+        if cfg.crf is not None:
+            args += ["-crf", str(cfg.crf)]
+        if cfg.bitrate:
+            args += ["-b:v", str(cfg.bitrate)]
+        if cfg.preset:
+            # "auto" is resolved per program in render(); standalone encodes stay fast.
+            args += ["-preset", "ultrafast" if cfg.preset == "auto" else str(cfg.preset)]
     if cfg.audio_bitrate:
         args += ["-b:a", str(cfg.audio_bitrate)]
     return args
 
 
-def _overlay_center_filter(w: int, h: int, fps: int) -> str:
-    # No shortest=1; base stream duration (-t) governs output length
+@functools.lru_cache(maxsize=32)
+def _overlay_center_filter(w: int, h: int, fps: int, *, input_offset: int = 0, label_prefix: str = "") -> str:
+    # No shortest=1; base stream duration (-t) governs output length.
+    # The black lavfi base negotiates straight to yuv420p (the encoder's -pix_fmt),
+    # so no trailing format filter is needed.
+    overlay = f"overlay=x=({w}-w)/2:y=({h}-h)/2:eval=init:format=auto"
     return (
-        f"[0:v][1:v]overlay=x=(W-w)/2:y=(H-h)/2:eval=init:format=auto,"
-        f"fps={fps},format=yuv420p[vout]".replace("W", str(w)).replace("H", str(h))
+        f"[{input_offset}:v][{input_offset + 1}:v]{overlay},"
+        f"fps={fps}[{label_prefix}vout]"
     )
 
 
@@ -890,14 +1630,21 @@ def _build_content_filter(
     ken_intro_seconds: float,
     ken_vector: Tuple[float, float],
     overlays: List[Tuple[Path, float, float]],
+    overlay_offsets: Optional[List[Tuple[int, int]]] = None,
     ass_subtitles_path: Path | None = None,
     ass_force_style: str | None = None,
+    input_offset: int = 0,
+    label_prefix: str = "",
 ) -> str:
     """Return a filter_complex string for base Ken Burns and timed overlays.
 
     - If `has_base_image` is True, apply zoompan to the image; otherwise assume a
       color source already sized w x h is provided.
-    - Overlays are placed at bottom with enable between(t,start,end).
+    - Overlays are placed at bottom, shifted by `overlay_offsets` (x, gap to the
+      bottom edge) when they were cropped; their inputs are expected to be
+      time-windowed (-itsoffset start, -t duration), so no enable expression is needed.
+    - `input_offset`/`label_prefix` shift input indices and namespace labels so the
+      graph can be embedded in a larger multi-scene filter_complex.
     """
     chains: List[str] = []
 
@@ -916,8 +1663,15 @@ def _build_content_filter(
         offset = min(offset_raw * motion, 1.0)
 
         base_cover = f"max({w}/iw\\,{h}/ih)"
-        source_label = "[base_in]"
+        source_label = f"[{label_prefix}base_in]"
+        nframes = max(int(round(duration * fps)), 1)
+        # pan_only gets one decoded frame; loop it into a timed stream so crop can use t.
+        # fps first: it moves that single frame onto a 1/fps timebase, so setpts yields
+        # exact frame times and nothing downstream needs another fps filter.
+        repeat = f"fps={fps},loop=loop={nframes - 1}:size=1:start=0,setpts=N/{fps}/TB"
         # Intro relief: start with smaller effective margin then ramp up over intro_seconds
+        # Start of the constant-scale part when the intro is rendered separately.
+        hold_start: Optional[float] = None
         relief = max(0.0, min(1.0, float(ken_intro_relief))) if isinstance(ken_intro_relief, (int, float)) else 0.2
         intro_frames = int(round(max(0.0, float(ken_intro_seconds)) * fps)) if isinstance(ken_intro_seconds, (int, float)) else 0
         if intro_frames >= 1 and str(ken_mode).lower() == "pan_only":
@@ -925,12 +1679,31 @@ def _build_content_filter(
             ease = f"(1-pow(1-({p_expr}),3))"  # ease-out cubic
             margin_eff = f"({margin:.6f}*({relief:.6f} + (1-{relief:.6f})*{ease}))"
             scale_expr = f"({base_cover})*(1+{margin_eff})"
-            chains.append(
-                f"[0:v]scale=iw*{scale_expr}:ih*{scale_expr}:eval=frame{source_label}"
-            )
+            if intro_frames < nframes:
+                # Only the intro needs a per-frame scale; afterwards the margin is at its
+                # full value, so the rest is scaled once and looped like plain pan_only.
+                hold_scale = f"({base_cover})*{(1.0 + margin):.6f}"
+                chains.append(f"[{input_offset}:v]fps={fps},split[{label_prefix}intro_src][{label_prefix}hold_src]")
+                chains.append(
+                    f"[{label_prefix}intro_src]loop=loop={intro_frames - 1}:size=1:start=0,setpts=N/{fps}/TB,"
+                    f"scale=iw*{scale_expr}:ih*{scale_expr}:eval=frame[{label_prefix}intro_in]"
+                )
+                chains.append(
+                    f"[{label_prefix}hold_src]scale=iw*{hold_scale}:ih*{hold_scale},"
+                    f"loop=loop={nframes - intro_frames - 1}:size=1:start=0,setpts=N/{fps}/TB[{label_prefix}hold_in]"
+                )
+                hold_start = intro_frames / fps
+            else:
+                chains.append(
+                    f"[{input_offset}:v]{repeat},scale=iw*{scale_expr}:ih*{scale_expr}:eval=frame{source_label}"
+                )
+        elif str(ken_mode).lower() == "pan_only":
+            # Scale the still once, then repeat the scaled frame; only the crop runs per frame.
+            scale_expr = f"({base_cover})*{(1.0 + margin):.6f}"
+            chains.append(f"[{input_offset}:v]scale=iw*{scale_expr}:ih*{scale_expr},{repeat}{source_label}")
         else:
             scale_expr = f"({base_cover})*{(1.0 + margin):.6f}"
-            chains.append(f"[0:v]scale=iw*{scale_expr}:ih*{scale_expr}{source_label}")
+            chains.append(f"[{input_offset}:v]scale=iw*{scale_expr}:ih*{scale_expr}{source_label}")
 
         if str(ken_mode).lower() == "pan_only":
             # Zoom-independent pan using crop with animated x/y.
@@ -943,32 +1716,41 @@ def _build_content_filter(
             dir_x = dir_x if isinstance(dir_x, (int, float)) else -1.0
             dir_y = dir_y if isinstance(dir_y, (int, float)) else -1.0
 
-            prog = f"min(max(t/{duration:.6f},0),1)"
             span_x = f"((iw-{w})*{extent:.6f}/2)"
             span_y = f"((ih-{h})*{extent:.6f}/2)"
             cx = f"(iw-{w})/2"
             cy = f"(ih-{h})/2"
 
-            if dir_x > 0:
-                x_expr = f"({cx})-({span_x}) + (2*{span_x})*({prog})"
-            elif dir_x < 0:
-                x_expr = f"({cx})+({span_x}) - (2*{span_x})*({prog})"
-            else:
-                x_expr = f"{cx}"
-            if dir_y > 0:
-                y_expr = f"({cy})-({span_y}) + (2*{span_y})*({prog})"
-            elif dir_y < 0:
-                y_expr = f"({cy})+({span_y}) - (2*{span_y})*({prog})"
+            def pan_crop(time: str) -> str:
+                prog = f"min(max({time}/{duration:.6f},0),1)"
+                if dir_x > 0:
+                    x_expr = f"({cx})-({span_x}) + (2*{span_x})*({prog})"
+                elif dir_x < 0:
+                    x_expr = f"({cx})+({span_x}) - (2*{span_x})*({prog})"
+                else:
+                    x_expr = f"{cx}"
+                if dir_y > 0:
+                    y_expr = f"({cy})-({span_y}) + (2*{span_y})*({prog})"
+                elif dir_y < 0:
+                    y_expr = f"({cy})+({span_y}) - (2*{span_y})*({prog})"
+                else:
+                    y_expr = f"{cy}"
+
+                x = f"min(max({x_expr},0), iw-{w})"
+                y = f"min(max({y_expr},0), ih-{h})"
+                return f"crop=w={w}:h={h}:x='{x}':y='{y}'"
+
+            if hold_start is not None:
+                # The held part restarts at t=0 so concat can append it; shift its pan clock.
+                chains.append(f"[{label_prefix}intro_in]{pan_crop('t')}[{label_prefix}intro_base]")
+                chains.append(f"[{label_prefix}hold_in]{pan_crop(f'(t+{hold_start:.6f})')}[{label_prefix}hold_base]")
+                chains.append(
+                    f"[{label_prefix}intro_base][{label_prefix}hold_base]concat=n=2:v=1:a=0[{label_prefix}base]"
+                )
             else:
-                y_expr = f"{cy}"
-
-            x = f"min(max({x_expr},0), iw-{w})"
-            y = f"min(max({y_expr},0), ih-{h})"
-            chains.append(
-                f"{source_label}crop=w={w}:h={h}:x='{x}':y='{y}',fps={fps},format=yuv420p[base]"
-            )
-            last = "[base]"
-            next_input_index = 1
+                chains.append(f"{source_label}{pan_crop('t')}[{label_prefix}base]")
+            last = f"[{label_prefix}base]"
+            next_input_index = input_offset + 1
         else:
             # Default zoompan branch (with epsilon clamp for zoom<=0)
             _eps = 0.015
@@ -984,7 +1766,6 @@ def _build_content_filter(
                     pass
 
             zmax = 1.0 + _eff_zoom
-            nframes = max(int(round(duration * fps)), 1)
             step = (zmax - 1.0) / nframes if nframes > 0 else 0.0
             zoom_expr = f"min(max(zoom,pzoom)+{step:.7f},{zmax:.6f})"
             progress = f"(on/{nframes})"
@@ -1004,26 +1785,25 @@ def _build_content_filter(
             x = f"iw/2-(iw/zoom/2) + ({dir_x:.6f})*{delta_x}"
             y = f"ih/2-(ih/zoom/2) + ({dir_y:.6f})*{delta_y}"
             chains.append(
-                f"{source_label}zoompan=z='{zoom_expr}':x='{x}':y='{y}':d={nframes}:s={w}x{h}:fps={fps}[base]"
+                f"{source_label}zoompan=z='{zoom_expr}':x='{x}':y='{y}':d={nframes}:s={w}x{h}:fps={fps}[{label_prefix}base]"
             )
-            last = "[base]"
-            next_input_index = 1
+            last = f"[{label_prefix}base]"
+            next_input_index = input_offset + 1
     else:
         # idx 0 is a color video already at w x h
-        last = "[0:v]"
-        next_input_index = 1
+        last = f"[{input_offset}:v]"
+        next_input_index = input_offset + 1
 
         # (moved) apply ASS after PNG overlays to ensure text sits on top
 
-    # Timed overlays
-    for i, (_overlay, start, dur) in enumerate(overlays, start=0):
-        end = start + max(dur, 0.0)
-        idx = next_input_index + i
-        label = f"[v{i}]"
-        enable = f"between(t,{start:.3f},{end:.3f})"
-        chains.append(
-            f"{last}[{idx}:v]overlay=x=0:y=H-h:enable='{enable}'{label}".replace("H", str(h))
-        )
+    # Timed overlays, bottom-aligned (output height baked in rather than H). The inputs
+    # are already windowed (-itsoffset/-t); before the first and after the last
+    # overlay frame the main video passes through untouched (eof_action=pass).
+    offsets = overlay_offsets or [(0, 0)] * len(overlays)
+    for i, (x, bottom) in enumerate(offsets):
+        label = f"[{label_prefix}v{i}]"
+        y = f"{h}-h-{bottom}" if bottom else f"{h}-h"
+        chains.append(f"{last}[{next_input_index + i}:v]overlay=x={x}:y={y}:eof_action=pass{label}")
         last = label
 
     # Apply ASS subtitles last so text draws above PNG band overlays
@@ -1036,25 +1816,29 @@ def _build_content_filter(
             force_clause = f":force_style='{fs}'"
         else:
             force_clause = ""
-        chains.append(f"{last}subtitles=filename='{p}'{fonts_clause}{force_clause}[vsub]")
-        last = "[vsub]"
+        chains.append(f"{last}subtitles=filename='{p}'{fonts_clause}{force_clause}[{label_prefix}vsub]")
+        last = f"[{label_prefix}vsub]"
 
-    chains.append(f"{last}format=yuv420p[vout]")
+    # Image bases (zoompan keeps the decoder's RGB/yuvj format) are pinned to yuv420p;
+    # the color source already negotiates to it, so a passthrough is enough there.
+    tail = "format=yuv420p" if has_base_image else "null"
+    chains.append(f"{last}{tail}[{label_prefix}vout]")
     return ";".join(chains)
 
 
 def _hex_to_rgb(value: str) -> Tuple[int, int, int]:
     v = value.lstrip("#")
     if len(v) == 6:
-        return tuple(int(v[i : i + 2], 16) for i in (0, 2, 4))  # type: ignore[return-value]
+        n = int(v, 16)
+        return ((n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF)
     raise ValueError(f"Invalid RGB hex value: {value}")
 
 
 def _hex_to_rgba(value: str) -> Tuple[int, int, int, int]:
     v = value.lstrip("#")
     if len(v) == 8:
-        return tuple(int(v[i : i + 2], 16) for i in (0, 2, 4, 6))  # type: ignore[return-value]
+        n = int(v, 16)
+        return ((n >> 24) & 0xFF, (n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF)
     if len(v) == 6:
-        rgb = tuple(int(v[i : i + 2], 16) for i in (0, 2, 4))
-        return (*rgb, 200)
+        return (*_hex_to_rgb(v), 200)
     raise ValueError(f"Invalid RGBA hex value: {value}")
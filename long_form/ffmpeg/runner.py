@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import functools
+import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, List, Sequence, Optional
 
@@ -16,8 +20,9 @@ def run_ffmpeg(args: Sequence[str], *, cwd: Path | None = None) -> None:
     """
     # Keep ffmpeg quiet: only errors; no stats; no banner
     cmd: List[str] = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostats"] + list(args)
-    pretty = " ".join(a if " " not in a else f"'{a}'" for a in cmd)
-    logger.debug("FFmpeg: %s", pretty)
+    if logger.isEnabledFor(logging.DEBUG):
+        pretty = " ".join(a if " " not in a else f"'{a}'" for a in cmd)
+        logger.debug("FFmpeg: %s", pretty)
     proc = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd else None,
@@ -32,6 +37,30 @@ def run_ffmpeg(args: Sequence[str], *, cwd: Path | None = None) -> None:
         raise RuntimeError(f"ffmpeg failed with exit code {proc.returncode}")
 
 
+def run_ffmpeg_parallel(jobs: Sequence[Sequence[str]], *, max_workers: Optional[int] = None) -> None:
+    """Run independent ffmpeg commands (via `run_ffmpeg`) a few at a time.
+
+    `max_workers` defaults to LONGVIDEO_FFMPEG_PARALLEL, else 2. The first failure,
+    in job order, cancels the jobs that have not started and is re-raised.
+    """
+    if max_workers is None:
+        env_parallel = os.getenv("LONGVIDEO_FFMPEG_PARALLEL", "").strip()
+        max_workers = int(env_parallel or 2)
+    workers = max(1, min(max_workers, len(jobs)))
+    if workers == 1:
+        for args in jobs:
+            run_ffmpeg(args)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_ffmpeg, args) for args in jobs]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
 def run_ffmpeg_stream(
     args: Sequence[str],
     *,
@@ -58,8 +87,9 @@ def run_ffmpeg_stream(
         "-progress",
         "pipe:1",
     ] + list(args)
-    pretty = " ".join(a if " " not in a else f"'{a}'" for a in full_args)
-    logger.debug("FFmpeg(stream): %s", pretty)
+    if logger.isEnabledFor(logging.DEBUG):
+        pretty = " ".join(a if " " not in a else f"'{a}'" for a in full_args)
+        logger.debug("FFmpeg(stream): %s", pretty)
 
     local_bar = None
     if external_bar is None:
@@ -77,14 +107,12 @@ def run_ffmpeg_stream(
             on_time=lambda t: (on_draw(t) if on_draw else None) or external_bar.update(max(0.0, offset_seconds + t))
         )
 
+    # Binary pipes: progress lines are matched as bytes, skipping the text decoder.
     proc = subprocess.Popen(
         full_args,
         cwd=str(cwd) if cwd else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
-        universal_newlines=True,
     )
     assert proc.stdout is not None
     try:
@@ -95,8 +123,70 @@ def run_ffmpeg_stream(
         if local_bar is not None:
             local_bar.finish()
     if proc.returncode != 0:
-        err = proc.stderr.read() if proc.stderr else ""
+        err = proc.stderr.read().decode("utf-8", "replace") if proc.stderr else ""
         tail = err.splitlines()[-50:]
         for line in tail:
             logger.error("ffmpeg: %s", line)
         raise RuntimeError(f"ffmpeg failed with exit code {proc.returncode}")
+
+
+# Encoder probes run while the renderer is constructed; a wedged GPU driver must
+# not hang startup, so they give up and report the encoder as unavailable.
+_PROBE_TIMEOUT_SEC = 10.0
+
+
+@functools.lru_cache(maxsize=None)
+def _listed_encoders() -> frozenset[str]:
+    try:
+        proc = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=_PROBE_TIMEOUT_SEC,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return frozenset()
+    if proc.returncode != 0:
+        return frozenset()
+    # Rows look like " V....D libx264  libx264 H.264 / AVC ..."
+    return frozenset(parts[1] for parts in (line.split() for line in proc.stdout.splitlines()) if len(parts) > 1)
+
+
+@functools.lru_cache(maxsize=None)
+def encoder_available(name: str) -> bool:
+    """Return True when ffmpeg lists encoder `name` and can open it.
+
+    Static ffmpeg builds often list hardware encoders (e.g. h264_nvenc) that fail
+    at runtime without the device, so a one-frame test encode confirms it.
+    Results are cached for the life of the process.
+    """
+    if name not in _listed_encoders():
+        return False
+    try:
+        probe = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=c=black:size=256x256:d=0.1",
+                "-frames:v",
+                "1",
+                "-c:v",
+                name,
+                "-f",
+                "null",
+                "-",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=_PROBE_TIMEOUT_SEC,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        logger.warning("Encoder probe for %s failed or timed out; not using it", name)
+        return False
+    return probe.returncode == 0
@@ -59,14 +59,15 @@ def _fmt_time(sec: float) -> str:
     return f"{h}:{m:02d}:{s:02d}.{cs:02d}"
 
 
+_ESC_TABLE = str.maketrans({"{": "｛", "}": "｝", "\\": "＼"})
+
+
 def _esc_text(s: str) -> str:
     """Escape text for ASS.
     ASS has no official escape for {} so replace with full-width braces.
     Also convert newlines to ASS line breaks.
     """
-    return (
-        s.replace("{", "｛").replace("}", "｝").replace("\\", "＼").replace("\n", r"\N")
-    )
+    return s.translate(_ESC_TABLE).replace("\n", r"\N")
 
 
 def _map_alignment(align: str, valign: str) -> int:
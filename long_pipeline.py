@@ -79,14 +79,15 @@ class LongFormPipeline:
         run_dir.mkdir(parents=True, exist_ok=True)
 
         timeline = self.builder.build(document)
-        asset_pipeline = AssetPipeline(run_dir=run_dir, config=self.config.raw)
-
         scene_assets: List[tuple[Scene, GeneratedAssets]] = []
-        for scene in timeline.scenes:
-            assets = asset_pipeline.prepare_scene_assets(scene)
-            scene_assets.append((scene, assets))
-
-        asset_pipeline.finalize_images([assets for _, assets in scene_assets])
+        with AssetPipeline(run_dir=run_dir, config=self.config.raw) as asset_pipeline:
+            asset_pipeline.warm_translation_cache(timeline.scenes)
+            asset_pipeline.prefetch_images(timeline.scenes)
+            for scene in timeline.scenes:
+                assets = asset_pipeline.prepare_scene_assets(scene)
+                scene_assets.append((scene, assets))
+
+            asset_pipeline.finalize_images([assets for _, assets in scene_assets])
 
         scenes_output: List[SceneOutput] = []
         current_start = 0.0
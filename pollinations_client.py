@@ -19,7 +19,8 @@ class PollinationsClient:
 
     BASE_URL = "https://image.pollinations.ai/prompt/"
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], *, session: Optional[requests.Session] = None) -> None:
+        self._http = session if session is not None else requests
         pollinations_cfg = config.get("apis", {}).get("pollinations", {})
         self.model = pollinations_cfg.get("model", "flux")
         self.width = pollinations_cfg.get("width", 1920)
@@ -72,7 +73,7 @@ class PollinationsClient:
             attempt += 1
             try:
                 start = time.monotonic()
-                response = requests.get(
+                response = self._http.get(
                     url,
                     timeout=(self.timeout_connect, self.timeout_read),
                     allow_redirects=True,
@@ -197,7 +197,8 @@ class PanelRenderer:
             )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        base.save(output_path)
+        # Panels are intermediates read back by the video renderer; favour encode speed.
+        base.save(output_path, compress_level=1)
         return output_path
 
     # ------------------------------------------------------------------
@@ -9,7 +9,7 @@ from PIL import Image
 
 from logging_utils import get_logger
 from long_form.ffmpeg.concat import concat_mp4_streamcopy
-from long_form.ffmpeg.runner import run_ffmpeg
+from long_form.ffmpeg.runner import run_ffmpeg, run_ffmpeg_parallel
 
 from .assets_pipeline import SceneAssets
 from .bgm import PresentationBgmMixer
@@ -78,12 +78,13 @@ class PresentationRenderer:
         scene_dir = run_dir / "scenes"
         scene_dir.mkdir(parents=True, exist_ok=True)
         rendered_paths: List[Path] = []
+        scene_jobs: List[List[str]] = []
 
         start_events: List[tuple[Path, float, float]] = []
 
         for idx, assets in enumerate(scene_assets, start=1):
             scene_output = scene_dir / f"{idx:03d}_{assets.scene.scene_id}.mp4"
-            logger.info("Rendering scene video: %s", scene_output.name)
+            logger.debug("Queueing scene video: %s", scene_output.name)
             if idx > 1 and self.start_sound_paths:
                 sfx_path = self._rng.choice(self.start_sound_paths)
                 start_events.append((sfx_path, assets.start_time, assets.pre_padding))
@@ -93,9 +94,13 @@ class PresentationRenderer:
                     assets.start_time,
                     assets.scene.scene_id,
                 )
-            self._render_scene(scene_output, assets, character)
+            scene_jobs.append(self._scene_args(scene_output, assets, character))
             rendered_paths.append(scene_output)
 
+        # Scenes are independent encodes; run a couple at once (LONGVIDEO_FFMPEG_PARALLEL).
+        logger.info("Rendering %d scene video(s)", len(scene_jobs))
+        run_ffmpeg_parallel(scene_jobs)
+
         concat_path = run_dir / "presentation_concat.mp4"
         concat_mp4_streamcopy(rendered_paths, concat_path)
 
@@ -124,12 +129,12 @@ class PresentationRenderer:
 
     # ------------------------------------------------------------------
 
-    def _render_scene(
+    def _scene_args(
         self,
         output_path: Path,
         assets: SceneAssets,
         character: Optional[CharacterPlacement],
-    ) -> None:
+    ) -> List[str]:
         cfg = self.cfg
         panel_width, panel_height = _read_image_size(assets.panel_image_path)
         panel_x, panel_y = cfg.panel_position
@@ -295,8 +300,7 @@ class PresentationRenderer:
             ]
             + codec_args
         )
-
-        run_ffmpeg(args)
+        return args
 
     @staticmethod
     def _escape_subtitle_path(path: Path) -> str:
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 import requests
 
 logger = logging.getLogger(__name__)
 
+_DEEPL_URL = "https://api-free.deepl.com/v2/translate"
+# DeepL accepts up to 50 ``text`` parameters per request.
+_DEEPL_BATCH_SIZE = 50
+
 
 class PromptTranslator:
     """Translate Japanese text to English for image prompts."""
@@ -31,7 +35,7 @@ class PromptTranslator:
         if normalized in self._cache:
             return self._cache[normalized]
 
-        url = "https://api-free.deepl.com/v2/translate"
+        url = _DEEPL_URL
         headers = {"Authorization": f"DeepL-Auth-Key {self.api_key}"}
         data = {"text": normalized, "target_lang": "EN"}
 
@@ -58,3 +62,49 @@ class PromptTranslator:
 
         self._cache[normalized] = text
         return text
+
+    def translate_many(self, texts: Sequence[str]) -> List[str]:
+        """Translate several texts with batched DeepL requests; order is preserved."""
+        normalized_texts = [text.strip() for text in texts]
+        if not self.api_key:
+            if any(normalized_texts):
+                logger.debug("DeepL API key not configured; using original prompts")
+            return list(texts)
+
+        pending: List[str] = []
+        for normalized in normalized_texts:
+            if normalized and normalized not in self._cache and normalized not in pending:
+                pending.append(normalized)
+
+        headers = {"Authorization": f"DeepL-Auth-Key {self.api_key}"}
+        for start in range(0, len(pending), _DEEPL_BATCH_SIZE):
+            batch = pending[start : start + _DEEPL_BATCH_SIZE]
+            data = [("text", item) for item in batch] + [("target_lang", "EN")]
+            try:
+                response = requests.post(_DEEPL_URL, headers=headers, data=data, timeout=30)
+                response.raise_for_status()
+                translations = response.json().get("translations") or []
+            except requests.RequestException as exc:
+                logger.error("DeepL batch request failed: %s", exc)
+                translations = []
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Unexpected DeepL error: %s", exc)
+                translations = []
+
+            if len(translations) != len(batch):
+                logger.warning(
+                    "DeepL batch returned %d/%d translations; using original text for the rest",
+                    len(translations),
+                    len(batch),
+                )
+            for index, item in enumerate(batch):
+                translated = ""
+                if index < len(translations):
+                    translated = str(translations[index].get("text", "")).strip()
+                self._cache[item] = translated or item
+            logger.debug("Translated %d prompt(s) in one DeepL request", len(batch))
+
+        return [
+            self._cache.get(normalized, text) if normalized else text
+            for text, normalized in zip(texts, normalized_texts)
+        ]
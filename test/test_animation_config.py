@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from animation_config import resolve_ken_burns_profile  # noqa: E402
+
+
+def test_mode_defaults_and_top_level_overrides() -> None:
+    profile = resolve_ken_burns_profile(
+        {
+            "mode": "zoompan",
+            "zoompan": {"ken_burns_offset": 0.1, "ken_burns_zoom": None},
+            "ken_burns_margin": "0.25",
+            "ken_burns_full_travel": "yes",
+        }
+    )
+
+    assert profile.mode == "zoompan"
+    assert profile.zoom == 0.04  # None in the nested block keeps the mode default
+    assert profile.offset == 0.1
+    assert profile.margin == 0.25
+    assert profile.full_travel is True
+    assert profile.padding_seconds == 0.35
+
+
+def test_identical_configs_share_cached_profile() -> None:
+    first = resolve_ken_burns_profile({"mode": "pan_only", "pan_only": {"ken_burns_offset": 0.3}})
+    second = resolve_ken_burns_profile({"mode": "pan_only", "pan_only": {"ken_burns_offset": 0.3}})
+
+    assert first is second
+    assert first.offset == 0.3
+
+
+def test_unknown_mode_and_unhashable_values_fall_back() -> None:
+    profile = resolve_ken_burns_profile({"mode": "spin", "ken_burns_zoom": {0.5}})
+
+    assert profile.mode == "pan_only"
+    assert profile.zoom == 0.0
+
+
+def test_deep_merge_recurses_without_touching_inputs() -> None:
+    from animation_config import _deep_merge
+
+    defaults = {"outer": {"keep": 1, "replace": 2}, "flat": 0.1}
+    override = {"outer": {"replace": 3, "skip": None}, "flat": None}
+    merged = dict(defaults)
+
+    _deep_merge(merged, override)
+
+    assert merged == {"outer": {"keep": 1, "replace": 3}, "flat": 0.1}
+    assert defaults == {"outer": {"keep": 1, "replace": 2}, "flat": 0.1}
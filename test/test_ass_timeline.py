@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from long_form.ass_timeline import (  # noqa: E402
+    LineTypingSpec,
+    Segment,
+    SegmentPos,
+    _esc_text,
+    _fmt_time,
+    _fmt_times,
+    build_ass_centered_lines_typing,
+    build_ass_for_content_scene_pos,
+    build_ass_for_scene,
+)
+
+
+def _events(ass_text: str) -> list[str]:
+    return [line for line in ass_text.splitlines() if line.startswith("Dialogue:")]
+
+
+def test_centered_lines_typing_reveals_one_character_per_event() -> None:
+    ass_text = build_ass_centered_lines_typing(
+        width=1920,
+        height=1080,
+        fontname="Noto Sans CJK JP",
+        fontsize=64,
+        lines=[LineTypingSpec(t0=1.0, seg_end=3.0, cps=2.0, text="abc", pos_x=10, pos_y=20)],
+    )
+
+    assert _events(ass_text) == [
+        "Dialogue: 0,0:00:01.00,0:00:01.50,Typing,,0,0,0,,{\\pos(10,20)}a",
+        "Dialogue: 0,0:00:01.50,0:00:02.00,Typing,,0,0,0,,{\\pos(10,20)}ab",
+        "Dialogue: 0,0:00:02.00,0:00:03.00,Typing,,0,0,0,,{\\pos(10,20)}abc",
+    ]
+    assert ass_text.endswith("abc\n")
+
+
+def test_content_scene_pos_static_emits_single_event() -> None:
+    ass_text = build_ass_for_content_scene_pos(
+        width=1920,
+        height=1080,
+        fontname="Noto Sans CJK JP",
+        fontsize=64,
+        effect="static",
+        segments=[SegmentPos(start=0.0, duration=2.5, lines=["a{b}", "c"], pos_x=5, pos_y=6)],
+    )
+
+    assert _events(ass_text) == [
+        "Dialogue: 0,0:00:00.00,0:00:02.50,Typing,,0,0,0,,{\\pos(5,6)}a｛b｝\\Nc",
+    ]
+
+
+def test_fmt_times_matches_scalar_formatter() -> None:
+    secs = [-1.0, 0.0, 0.004, 0.005, 0.015, 59.999, 61.25, 3599.995, 3725.5]
+    assert _fmt_times(np.array(secs)) == [_fmt_time(sec) for sec in secs]
+
+
+def test_esc_text_escapes_ass_control_characters() -> None:
+    assert _esc_text("{a}\\b\tc\r\nd") == "｛a｝＼b    c\\Nd"
+
+
+def test_scene_typing_emits_single_karaoke_event_per_segment() -> None:
+    ass_text = build_ass_for_scene(
+        width=1920,
+        height=1080,
+        fontname="Noto Sans CJK JP",
+        fontsize=64,
+        effect="typing",
+        segments=[Segment(start=0.0, duration=2.0, lines=["ab", "c"])],
+    )
+
+    # The \N break shares a syllable with "c", so 2s is spread over three syllables.
+    # \ko (not \kf) keeps the border of pending characters hidden as well as the fill.
+    assert _events(ass_text) == [
+        "Dialogue: 0,0:00:00.00,0:00:02.00,Typing,,0,0,0,,"
+        "{\\2a&HFF&}{\\ko67}a{\\ko67}b{\\ko66}\\Nc",
+    ]
+
+
+def test_content_scene_pos_typing_hides_pending_outlines() -> None:
+    kwargs = dict(
+        width=1920,
+        height=1080,
+        fontname="Noto Sans CJK JP",
+        fontsize=64,
+        effect="typing",
+        segments=[SegmentPos(start=1.0, duration=2.0, lines=["abc"], pos_x=5, pos_y=6)],
+    )
+
+    (event,) = _events(build_ass_for_content_scene_pos(**kwargs))
+    assert event.endswith(",,{\\pos(5,6)\\2a&HFF&}{\\ko67}a{\\ko67}b{\\ko66}c")
+    assert "\\kf" not in event
+
+    # With a shadow the characters are revealed one event at a time instead.
+    assert _events(build_ass_for_content_scene_pos(shadow=2, **kwargs)) == [
+        "Dialogue: 0,0:00:01.00,0:00:01.67,Typing,,0,0,0,,{\\pos(5,6)}a",
+        "Dialogue: 0,0:00:01.67,0:00:02.33,Typing,,0,0,0,,{\\pos(5,6)}ab",
+        "Dialogue: 0,0:00:02.33,0:00:03.00,Typing,,0,0,0,,{\\pos(5,6)}abc",
+    ]
@@ -1,13 +1,37 @@
 from __future__ import annotations
 
+import gc
 import sys
+import wave
 from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from PIL import Image
 
-from asset_pipeline import AssetPipeline, GeneratedAssets
+from asset_pipeline import AssetPipeline, GeneratedAssets, _concat_wav_files
+from timeline_builder import Scene, SceneChunk, SceneType
+
+
+_PipelineFactory = Callable[..., AssetPipeline]
+
+
+@pytest.fixture
+def make_pipeline() -> Iterator[_PipelineFactory]:
+    # Every pipeline owns a metadata writer thread; close them all after the test.
+    pipelines: list[AssetPipeline] = []
+
+    def factory(**kwargs: object) -> AssetPipeline:
+        pipeline = AssetPipeline(**kwargs)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield factory
+    for pipeline in pipelines:
+        pipeline.close()
 
 
 def _make_generated_assets(
@@ -34,14 +58,14 @@ def _make_generated_assets(
     )
 
 
-def test_finalize_images_duplicates_from_success(tmp_path: Path) -> None:
+def test_finalize_images_duplicates_from_success(tmp_path: Path, make_pipeline: _PipelineFactory) -> None:
     project_root = tmp_path / "project"
     run_dir = project_root / "output" / "run"
     config = {
         "output_dir": str(project_root / "output"),
         "apis": {"pollinations": {"width": 320, "height": 180}},
     }
-    pipeline = AssetPipeline(run_dir=run_dir, config=config)
+    pipeline = make_pipeline(run_dir=run_dir, config=config)
 
     success_path = pipeline.image_dir / "scene_success.jpg"
     success_path.parent.mkdir(parents=True, exist_ok=True)
@@ -66,7 +90,7 @@ def test_finalize_images_duplicates_from_success(tmp_path: Path) -> None:
     assert failure_target.read_bytes() == success_path.read_bytes()
 
 
-def test_finalize_images_uses_default_when_no_pool(tmp_path: Path) -> None:
+def test_finalize_images_uses_default_when_no_pool(tmp_path: Path, make_pipeline: _PipelineFactory) -> None:
     project_root = tmp_path / "project"
     default_dir = project_root / "default_img"
     default_dir.mkdir(parents=True, exist_ok=True)
@@ -78,7 +102,7 @@ def test_finalize_images_uses_default_when_no_pool(tmp_path: Path) -> None:
         "output_dir": str(project_root / "output"),
         "apis": {"pollinations": {"width": 200, "height": 112}},
     }
-    pipeline = AssetPipeline(run_dir=run_dir, config=config)
+    pipeline = make_pipeline(run_dir=run_dir, config=config)
 
     target_path = pipeline.image_dir / "scene_missing.jpg"
     pipeline._failed_image_targets = {"scene_missing": target_path}
@@ -92,3 +116,227 @@ def test_finalize_images_uses_default_when_no_pool(tmp_path: Path) -> None:
     assert assets[0].image_path == target_path
     assert target_path.exists()
     assert pipeline._failed_image_targets == {}
+
+
+class _SilentVoiceClient:
+    """Stand-in for VoicevoxClient that writes short silent WAVs."""
+
+    def __init__(self, durations: dict[str, float]) -> None:
+        self._durations = durations
+
+    def synthesize(self, text: str, output_path: Path) -> tuple[Path, float]:
+        duration = self._durations[text]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        frame_count = int(8000 * duration)
+        with wave.open(str(output_path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(8000)
+            wav_file.writeframes(b"\x00\x00" * frame_count)
+        return output_path, duration
+
+
+def test_synthesize_scene_audio_keeps_chunk_order(tmp_path: Path, make_pipeline: _PipelineFactory) -> None:
+    run_dir = tmp_path / "project" / "output" / "run"
+    config = {"apis": {"voicevox": {"concurrency": 3}}}
+    pipeline = make_pipeline(run_dir=run_dir, config=config)
+    pipeline.voice_client = _SilentVoiceClient({"first": 0.5, "second": 0.25, "third": 1.0})
+
+    chunks = [
+        SceneChunk(section_index=0, lines=[text], raw_text=text, word_count=1, estimated_duration=1.0)
+        for text in ("first", "second", "third")
+    ]
+    scene = Scene(
+        scene_id="scene_audio",
+        scene_type=SceneType.OPENING,
+        start_time=0.0,
+        duration=0.0,
+        chunks=chunks,
+        image_prompt=None,
+        bgm_track_id=None,
+    )
+
+    output_path = pipeline.audio_dir / "scene_audio.wav"
+    segments = pipeline._synthesize_scene_audio(scene, output_path)
+
+    assert [segment.lines for segment in segments] == [["first"], ["second"], ["third"]]
+    assert [segment.start_offset for segment in segments] == [0.0, 0.5, 0.75]
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getnframes() == int(8000 * 1.75)
+
+
+def _write_wav(path: Path, payload: bytes, *, framerate: int = 8000) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(framerate)
+        wav_file.writeframes(payload)
+
+
+def test_concat_wav_files_splices_pcm_payloads(tmp_path: Path) -> None:
+    payloads = [bytes(range(16)) * 3, b"\x01\x02" * 10, b"\xff\x7f" * 7]
+    chunk_files = []
+    for idx, payload in enumerate(payloads):
+        chunk_path = tmp_path / f"chunk_{idx}.wav"
+        _write_wav(chunk_path, payload)
+        chunk_files.append(chunk_path)
+
+    output_path = tmp_path / "joined.wav"
+    _concat_wav_files(chunk_files, output_path)
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getframerate() == 8000
+        assert wav_file.getnframes() == sum(len(payload) for payload in payloads) // 2
+        assert wav_file.readframes(wav_file.getnframes()) == b"".join(payloads)
+
+
+def test_concat_wav_files_falls_back_on_mismatched_format(tmp_path: Path) -> None:
+    first = tmp_path / "first.wav"
+    second = tmp_path / "second.wav"
+    _write_wav(first, b"\x01\x00" * 4, framerate=8000)
+    _write_wav(second, b"\x02\x00" * 4, framerate=16000)
+
+    output_path = tmp_path / "joined.wav"
+    _concat_wav_files([first, second], output_path)
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getframerate() == 8000
+        assert wav_file.readframes(wav_file.getnframes()) == b"\x01\x00" * 4 + b"\x02\x00" * 4
+
+
+class _CountingImageClient:
+    width = 64
+    height = 36
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def fetch(self, prompt: str, output_path: Path) -> Path:
+        self.prompts.append(prompt)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(prompt.encode("utf-8"))
+        return output_path
+
+
+def test_image_cache_index_survives_restart(tmp_path: Path, make_pipeline: _PipelineFactory) -> None:
+    run_dir = tmp_path / "project" / "output" / "run"
+    first = make_pipeline(run_dir=run_dir, config={})
+    first.image_client = _CountingImageClient()
+    first._get_or_create_image("scene_a", "a lighthouse at dawn")
+
+    restarted = make_pipeline(run_dir=run_dir, config={})
+    client = _CountingImageClient()
+    restarted.image_client = client
+
+    cached = restarted._get_or_create_image("scene_a", "a lighthouse at dawn")
+    assert cached == restarted.image_dir / "scene_a.jpg"
+    assert client.prompts == []
+
+    refreshed = restarted._get_or_create_image("scene_a", "a lighthouse at dusk")
+    assert client.prompts == ["a lighthouse at dusk"]
+    assert refreshed is not None and refreshed.read_bytes() == b"a lighthouse at dusk"
+
+
+def test_adopted_image_is_refetched_after_prompt_change(tmp_path: Path, make_pipeline: _PipelineFactory) -> None:
+    run_dir = tmp_path / "project" / "output" / "run"
+    untracked = run_dir / "images" / "scene_a.jpg"
+    untracked.parent.mkdir(parents=True)
+    untracked.write_bytes(b"left over from an older run")
+
+    first = make_pipeline(run_dir=run_dir, config={})
+    first.image_client = _CountingImageClient()
+    assert first._get_or_create_image("scene_a", "a lighthouse at dawn") == untracked
+    assert first.image_client.prompts == []
+
+    restarted = make_pipeline(run_dir=run_dir, config={})
+    client = _CountingImageClient()
+    restarted.image_client = client
+    refreshed = restarted._get_or_create_image("scene_a", "a lighthouse at dusk")
+
+    assert client.prompts == ["a lighthouse at dusk"]
+    assert refreshed is not None and refreshed.read_bytes() == b"a lighthouse at dusk"
+
+
+def test_prepare_scene_assets_content_scene(tmp_path: Path, make_pipeline: _PipelineFactory) -> None:
+    run_dir = tmp_path / "project" / "output" / "run"
+    pipeline = make_pipeline(run_dir=run_dir, config={})
+    pipeline.voice_client = _SilentVoiceClient({"narration": 0.5})
+    image_client = _CountingImageClient()
+    pipeline.image_client = image_client
+
+    scene = Scene(
+        scene_id="scene_content",
+        scene_type=SceneType.CONTENT,
+        start_time=0.0,
+        duration=0.0,
+        chunks=[
+            SceneChunk(
+                section_index=0,
+                lines=["narration"],
+                raw_text="narration",
+                word_count=1,
+                estimated_duration=0.5,
+            )
+        ],
+        image_prompt="harbor",
+        bgm_track_id=None,
+    )
+
+    assets = pipeline.prepare_scene_assets(scene)
+    pipeline.close()
+
+    assert assets.narration_duration == 0.5
+    assert assets.image_path == pipeline.image_dir / "scene_content.jpg"
+    assert assets.image_prompt_text == image_client.prompts[0]
+    assert "harbor" in assets.image_prompt_text
+    assert assets.image_prompt_path is not None and assets.image_prompt_path.exists()
+    assert assets.narration_metadata_path.exists()
+
+
+def test_metadata_is_flushed_without_explicit_close(tmp_path: Path) -> None:
+    with AssetPipeline(run_dir=tmp_path / "run_a", config={}) as pipeline:
+        pipeline._queue_json(pipeline.audio_dir / "a.json", {"scene_id": "a"})
+    assert (tmp_path / "run_a" / "audio" / "a.json").exists()
+
+    dropped = AssetPipeline(run_dir=tmp_path / "run_b", config={})
+    writer = dropped._meta_thread
+    dropped._queue_json(dropped.audio_dir / "b.json", {"scene_id": "b"})
+    del dropped
+    gc.collect()
+    assert not writer.is_alive()
+    assert (tmp_path / "run_b" / "audio" / "b.json").exists()
+
+
+class _RecordingTranslator:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def translate_many(self, texts: list[str]) -> list[str]:
+        self.batches.append(list(texts))
+        return [f"en:{text}" for text in texts]
+
+
+def test_warm_translation_cache_batches_unique_subjects_in_order(
+    tmp_path: Path, make_pipeline: _PipelineFactory
+) -> None:
+    pipeline = make_pipeline(run_dir=tmp_path / "run", config={})
+    translator = _RecordingTranslator()
+    pipeline.translator = translator
+    pipeline._translation_cache["known"] = "en:known"
+    scenes = [
+        Scene(
+            scene_id=f"s{idx}",
+            scene_type=SceneType.CONTENT,
+            start_time=0.0,
+            duration=0.0,
+            chunks=[],
+            image_prompt=prompt,
+            bgm_track_id=None,
+        )
+        for idx, prompt in enumerate(["harbor", "known", "forest ", "harbor", "forest"])
+    ]
+
+    pipeline.warm_translation_cache(scenes)
+
+    assert translator.batches == [["harbor", "forest"]]
+    assert pipeline._translation_cache["forest"] == "en:forest"
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import base64
+import json
 import sys
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -13,11 +15,20 @@ import deepinfra_client  # noqa: E402
 from deepinfra_client import DeepInfraClient  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 class DummyResponse:
     def __init__(self, payload: dict[str, Any]) -> None:
         self._payload = payload
         self.status_code = 200
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
     def json(self) -> dict[str, Any]:
         return self._payload
 
@@ -37,8 +48,6 @@ def test_fetch_strips_data_uri_prefix(tmp_path: Path, monkeypatch: pytest.Monkey
     def fake_post(*args: Any, **kwargs: Any) -> DummyResponse:
         return DummyResponse(response_payload)
 
-    monkeypatch.setattr(deepinfra_client.requests, "post", fake_post)
-
     client = DeepInfraClient(
         {
             "apis": {
@@ -48,6 +57,7 @@ def test_fetch_strips_data_uri_prefix(tmp_path: Path, monkeypatch: pytest.Monkey
             }
         }
     )
+    monkeypatch.setattr(client._session, "post", fake_post)
 
     output_path = tmp_path / "image.jpg"
 
@@ -127,3 +137,150 @@ def test_profile_default_fallback_is_used_when_no_override() -> None:
     assert client.width == 1024
     assert client.height == 1024
     assert client.active_profile == "default"
+
+
+def test_fetch_many_preserves_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = DeepInfraClient({"apis": {"deepinfra": {"api_token": "token", "max_workers": 4}}})
+
+    def fake_post(url: str, *, json: dict[str, Any], **kwargs: Any) -> DummyResponse:
+        encoded = base64.b64encode(json["prompt"].encode("utf-8")).decode("ascii")
+        return DummyResponse({"images": [encoded]})
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    prompts = [f"prompt {idx}" for idx in range(6)]
+    items = [(prompt, tmp_path / f"{idx}.jpg") for idx, prompt in enumerate(prompts)]
+    results = client.fetch_many(items)
+
+    assert results == [path for _, path in items]
+    assert [path.read_bytes().decode("utf-8") for _, path in items] == prompts
+
+
+def test_fetch_reuses_prompt_cache_for_new_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = DeepInfraClient({"apis": {"deepinfra": {"api_token": "token"}}})
+    calls: list[str] = []
+
+    def fake_post(url: str, *, json: dict[str, Any], **kwargs: Any) -> DummyResponse:
+        calls.append(json["prompt"])
+        return DummyResponse({"images": [base64.b64encode(b"jpeg-bytes").decode("ascii")]})
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+
+    first = client.fetch("same prompt", tmp_path / "scene_1.jpg")
+    second = client.fetch("same prompt", tmp_path / "scene_2.jpg")
+
+    assert calls == ["same prompt"]
+    assert first is not None and second is not None
+    assert second.read_bytes() == b"jpeg-bytes"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"request_id": "r", "images": ["aGVsbG8/Pz8="], "seed": 1}',
+        b'{"images": [ {"b64_json": "aGVsbG8/Pz8=", "seed": 1} ]}',
+        b'{"images": ["data:image/jpeg;base64,aGVsbG8\\/Pz8="]}',
+        b'{"images": ["aGVsbG8_Pz8"]}',
+    ],
+)
+def test_extract_and_decode_image_payload(body: bytes) -> None:
+    encoded = DeepInfraClient._extract_image_payload(body)
+
+    assert encoded is not None
+    assert DeepInfraClient._decode_image_payload(encoded) == b"hello???"
+
+
+class DummyStreamResponse:
+    def __init__(self, data: bytes) -> None:
+        import io
+
+        self.raw = io.BytesIO(data)
+
+    def __enter__(self) -> "DummyStreamResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def test_fetch_downloads_url_payload(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = DeepInfraClient({"apis": {"deepinfra": {"api_token": "token", "use_urls": True}}})
+    posted: list[dict[str, Any]] = []
+
+    def fake_post(url: str, *, json: dict[str, Any], **kwargs: Any) -> DummyResponse:
+        posted.append(json)
+        return DummyResponse({"images": ["https://cdn.example/image.jpg"]})
+
+    def fake_get(url: str, **kwargs: Any) -> DummyStreamResponse:
+        assert url == "https://cdn.example/image.jpg"
+        return DummyStreamResponse(b"streamed-jpeg")
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+    monkeypatch.setattr(client._session, "get", fake_get)
+
+    output_path = tmp_path / "image.jpg"
+    assert client.fetch("prompt", output_path) == output_path
+    assert output_path.read_bytes() == b"streamed-jpeg"
+    assert posted[0]["return_urls"] is True
+
+
+def test_fetch_honors_retry_after_on_429(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = DeepInfraClient({"apis": {"deepinfra": {"api_token": "token", "retries": 1}}})
+    limited = DummyResponse({})
+    limited.status_code = 429
+    limited.headers = {"Retry-After": "7"}
+    ok = DummyResponse({"images": [base64.b64encode(b"img").decode("ascii")]})
+    responses = iter([limited, ok])
+    sleeps: list[float] = []
+
+    monkeypatch.setattr(client._session, "post", lambda *args, **kwargs: next(responses))
+    monkeypatch.setattr(deepinfra_client.time, "sleep", sleeps.append)
+
+    output_path = tmp_path / "image.jpg"
+    assert client.fetch("prompt", output_path) == output_path
+    assert output_path.read_bytes() == b"img"
+    assert sleeps == [7.0]
+
+
+def test_parse_retry_after_caps_and_rejects_garbage() -> None:
+    assert DeepInfraClient._parse_retry_after("3.5") == 3.5
+    assert DeepInfraClient._parse_retry_after("3600") == 60.0
+    assert DeepInfraClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert DeepInfraClient._parse_retry_after("soon") is None
+    assert DeepInfraClient._parse_retry_after(None) is None
+
+
+def test_fetch_many_with_repeated_prompt_keeps_each_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_dir = tmp_path / "prompt_cache"
+    client = DeepInfraClient({"apis": {"deepinfra": {"api_token": "token", "max_workers": 2, "cache_dir": str(cache_dir)}}})
+    counter = iter(range(2))
+    lock = threading.Lock()
+
+    def fake_post(url: str, *, json: dict[str, Any], **kwargs: Any) -> DummyResponse:
+        with lock:
+            body = f"image-{next(counter)}".encode("ascii")
+        return DummyResponse({"images": [base64.b64encode(body).decode("ascii")]})
+
+    # Hold both cache stores between link and rename so they overlap.
+    both_storing = threading.Barrier(2, timeout=5)
+    replace = deepinfra_client.os.replace
+
+    def synced_replace(src: Any, dst: Any) -> None:
+        if Path(dst).parent == cache_dir:
+            both_storing.wait()
+        replace(src, dst)
+
+    monkeypatch.setattr(client._session, "post", fake_post)
+    monkeypatch.setattr(deepinfra_client.os, "replace", synced_replace)
+    items = [("same prompt", tmp_path / "scene_1.jpg"), ("same prompt", tmp_path / "scene_2.jpg")]
+    results = client.fetch_many(items)
+
+    assert results == [path for _, path in items]
+    outputs = sorted(path.read_bytes() for _, path in items)
+    assert outputs == [b"image-0", b"image-1"]
+    cached = list(cache_dir.glob("*.jpg"))
+    assert len(cached) == 1 and cached[0].read_bytes() in outputs
+    assert not [p for p in tmp_path.rglob(".*") if p.is_file()]
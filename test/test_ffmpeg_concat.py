@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from long_form.ffmpeg import concat  # noqa: E402
+
+
+def test_concat_rejects_missing_and_empty_segments(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    good = tmp_path / "a.mp4"
+    good.write_bytes(b"data")
+    empty = tmp_path / "b.mp4"
+    empty.write_bytes(b"")
+    missing = tmp_path / "c.mp4"
+
+    def fail_run(args: list[str]) -> None:
+        raise AssertionError("ffmpeg must not run for invalid inputs")
+
+    monkeypatch.setattr(concat, "run_ffmpeg", fail_run)
+
+    with pytest.raises(RuntimeError, match="missing or empty"):
+        concat.concat_mp4_streamcopy([good, empty, missing], tmp_path / "out.mp4")
+
+
+def test_concat_writes_ffconcat_list(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    segments = []
+    for name in ("a.mp4", "b.mp4"):
+        segment = tmp_path / name
+        segment.write_bytes(b"data")
+        segments.append(segment)
+    calls: list[list[str]] = []
+    monkeypatch.setattr(concat, "run_ffmpeg", calls.append)
+
+    output = tmp_path / "out.mp4"
+    assert concat.concat_mp4_streamcopy(segments, output) == output
+
+    list_file = output.with_suffix(".concat.txt")
+    assert list_file.read_text(encoding="utf-8") == (
+        "ffconcat version 1.0\n" + "".join(f"file '{p.resolve()}'\n" for p in segments)
+    )
+    assert calls and str(list_file) in calls[0]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from long_form.ffmpeg.progress import ConsoleBar, ProgressParser  # noqa: E402
+
+
+def test_console_bar_draws_partial_and_finished_bar() -> None:
+    stream = io.StringIO()
+    bar = ConsoleBar(total_seconds=90.0, label="Render", width=4, stream=stream)
+    bar.last_render = 0.0
+    bar.update(45.0)
+    bar.finish()
+
+    frames = stream.getvalue().split("\r")[1:]
+    assert frames[0].startswith("[····]   0% | 00:00 / 01:30 | ETA 00:00 | Render")
+    assert frames[1].startswith("[██··]  50% | ")
+    assert frames[-1].startswith("[████] 100% | ")
+    assert frames[-1].endswith("| Render\n")
+
+
+def test_progress_parser_reports_out_time_from_bytes_and_str() -> None:
+    seen: list[float] = []
+    parser = ProgressParser(on_time=seen.append)
+
+    for line in (b"frame=10\n", b"out_time_ms=1500000\n", b"out_time_ms=N/A\n", "out_time_ms=250000\n", "fps=30"):
+        parser.feed_line(line)
+
+    assert seen == [1.5, 0.25]
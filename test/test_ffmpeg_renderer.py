@@ -0,0 +1,551 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from long_form.ffmpeg import renderer  # noqa: E402
+from long_form.ffmpeg.renderer import FFmpegVideoGenerator  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_overlay_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # The cross-run overlay cache defaults to the user cache dir; keep tests off the real one.
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+
+def test_render_runs_scenes_in_parallel_and_keeps_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"workers": 3, "threads_per_worker": 1}})
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_content(run_dir: Path, scene_dir: Path, scene: object) -> Path:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05 if scene.scene_id == "S1" else 0.01)
+        with lock:
+            active -= 1
+        return scene_dir / f"{scene.scene_id}.mp4"
+
+    concatenated: list[list[Path]] = []
+    monkeypatch.setattr(generator, "_render_content_scene", fake_content)
+    monkeypatch.setattr(renderer, "write_concat_list", lambda inputs, out: concatenated.append(list(inputs)) or out)
+    monkeypatch.setattr(generator, "_mix_bgm", lambda *args, **kwargs: None)
+
+    scenes = [SimpleNamespace(scene_id=f"S{i}", scene_type="content", duration=1.0) for i in range(1, 5)]
+    generator.render(run_dir=tmp_path, scenes=scenes, output_path=tmp_path / "out.mp4", thumbnail_title="t")
+
+    scene_dir = tmp_path / "ffmpeg_scenes"
+    assert concatenated == [[scene_dir / f"S{i}.mp4" for i in range(1, 5)]]
+    assert peak > 1
+    assert "-threads" in renderer._encode_args(generator.render_cfg)
+
+
+def test_single_pass_builds_one_graph_with_shifted_inputs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"single_pass": True}})
+    streamed: list[list[str]] = []
+    monkeypatch.setattr(renderer, "run_ffmpeg_stream", lambda args, **kwargs: streamed.append(list(args)))
+    monkeypatch.setattr(renderer, "run_ffmpeg", lambda args: pytest.fail("per-scene encode in single-pass mode"))
+    monkeypatch.setattr(generator, "_mix_bgm", lambda *args, **kwargs: None)
+
+    segment = SimpleNamespace(segment_index=0, start_offset=0.0, duration=1.0, lines=["hello"])
+    scenes = [
+        SimpleNamespace(
+            scene_id=f"S{i}",
+            scene_type="content",
+            duration=2.0,
+            narration_path=tmp_path / f"n{i}.wav",
+            image_path=None,
+            text_segments=[segment],
+        )
+        for i in range(2)
+    ]
+    generator.render(run_dir=tmp_path, scenes=scenes, output_path=tmp_path / "out.mp4", thumbnail_title="t")
+
+    assert len(streamed) == 1
+    args = streamed[0]
+    graph = args[args.index("-filter_complex") + 1]
+    # Scene 0 uses inputs 0-2 (base, overlay, narration); scene 1 uses 3-5.
+    assert "[0:v][1:v]overlay" in graph and "[3:v][4:v]overlay" in graph
+    assert "[2:a]aformat" in graph and "[5:a]aformat" in graph
+    assert graph.endswith("[s0v][s0a][s1v][s1a]concat=n=2:v=1:a=1[vout][aout]")
+    assert args.count("-i") == 6
+    cfg = generator.render_cfg
+    budget = str(cfg.workers * cfg.threads_per_worker)
+    assert args[:2] == ["-filter_complex_threads", budget]
+    assert args[args.index("-threads") + 1] == budget
+
+
+def test_measure_text_is_memoized_per_font() -> None:
+    generator = FFmpegVideoGenerator({})
+    font = generator._get_font(generator.render_cfg.body_font_size)
+    calls: list[str] = []
+
+    class CountingFont:
+        size = font.size
+
+        def getbbox(self, text: str) -> tuple[int, int, int, int]:
+            calls.append(text)
+            return font.getbbox(text)
+
+    counting = CountingFont()
+    first = generator._measure_text(counting, "hello")
+    assert generator._measure_text(counting, "hello") == first
+    assert calls == ["hello"]
+
+
+def test_overlays_are_fed_as_raw_rgba(tmp_path: Path) -> None:
+    generator = FFmpegVideoGenerator({})
+    overlay = generator._create_center_text_image(tmp_path, "OP", ["hello"])
+
+    raw = overlay.with_suffix(".raw")
+    cfg = generator.render_cfg
+    assert raw.stat().st_size == cfg.width * cfg.height * 4
+    args = generator._still_input_args(overlay, 2.0)
+    assert args[args.index("-f") + 1] == "rawvideo"
+    assert args[args.index("-video_size") + 1] == f"{cfg.width}x{cfg.height}"
+    assert args[-1] == str(raw)
+
+    png_only = FFmpegVideoGenerator({"ffmpeg": {"raw_overlays": False}})
+    overlay = png_only._create_center_text_image(tmp_path / "png", "OP", ["hello"])
+    assert png_only._still_input_args(overlay, 2.0)[:2] == ["-loop", "1"]
+
+
+def test_auto_codec_prefers_working_hardware_encoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(renderer, "encoder_available", lambda name: name == "h264_videotoolbox")
+    generator = FFmpegVideoGenerator({})
+    args = renderer._encode_args(generator.render_cfg)
+
+    assert args[args.index("-c:v") + 1] == "h264_videotoolbox"
+    assert "-profile:v" not in args and "-crf" not in args
+    assert args[args.index("-q:v") + 1] == "50"
+
+    monkeypatch.setattr(renderer, "encoder_available", lambda name: False)
+    fallback = renderer._encode_args(FFmpegVideoGenerator({}).render_cfg)
+    assert fallback[fallback.index("-c:v") + 1] == "libx264"
+    assert "-profile:v" in fallback and "-crf" in fallback
+
+    monkeypatch.setattr(renderer, "encoder_available", lambda name: name == "h264_nvenc")
+    tuned = renderer._encode_args(FFmpegVideoGenerator({"video": {"crf": 28, "bitrate": "4M"}}).render_cfg)
+    assert tuned[tuned.index("-c:v") + 1] == "h264_nvenc"
+    assert tuned[tuned.index("-cq") + 1] == "31"
+    assert tuned[tuned.index("-b:v") + 1] == "4M"
+
+    monkeypatch.setattr(renderer, "encoder_available", lambda name: pytest.fail("probed with hwaccel off"))
+    assert FFmpegVideoGenerator({"video": {"hwaccel": False}}).render_cfg.codec == "libx264"
+
+
+def test_mix_bgm_uses_dynaudnorm_unless_loudnorm_requested(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bgm = tmp_path / "bgm.mp3"
+    bgm.write_bytes(b"")
+    streamed: list[list[str]] = []
+    monkeypatch.setattr(renderer, "run_ffmpeg_stream", lambda args, **kwargs: streamed.append(list(args)))
+
+    for loudnorm in (False, True):
+        generator = FFmpegVideoGenerator({"bgm": {"selected": str(bgm), "loudnorm": loudnorm}})
+        generator._mix_bgm(tmp_path / "in.mp4", tmp_path / "out.mp4", total_duration=10.0)
+
+    default_graph, strict_graph = (args[args.index("-filter_complex") + 1] for args in streamed)
+    assert "[a]dynaudnorm=f=500:g=31:p=0.95," in default_graph
+    assert "[a]loudnorm=I=-14" in strict_graph
+
+
+def test_overlays_are_prepared_before_scenes_render(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"workers": 2}})
+    segment = SimpleNamespace(segment_index=0, start_offset=0.0, duration=1.0, lines=["hello"])
+    scenes = [
+        SimpleNamespace(scene_id="OP", scene_type="opening", duration=1.0, text_segments=[segment]),
+        SimpleNamespace(scene_id="S1", scene_type="content", duration=1.0, text_segments=[segment]),
+    ]
+    generator._prepare_overlays(tmp_path, scenes, "title")
+
+    drawn: list[str] = []
+    monkeypatch.setattr(generator, "_draw_text_overlay", lambda lines: drawn.append("text"))
+    monkeypatch.setattr(generator, "_draw_center_text_image", lambda lines: drawn.append("center"))
+    assert generator._create_text_overlay(tmp_path, "S1", segment).exists()
+    assert generator._create_center_text_image(tmp_path, "OP", ["hello"]).exists()
+    assert drawn == []
+
+
+def test_caption_band_is_drawn_once_per_height(tmp_path: Path) -> None:
+    generator = FFmpegVideoGenerator({})
+    segments = [SimpleNamespace(segment_index=i, lines=[text]) for i, text in enumerate(["hello", "world"])]
+    for seg in segments:
+        generator._create_text_overlay(tmp_path, "S1", seg)
+        generator._create_band_overlay(tmp_path, "S1", seg)
+
+    assert len(generator._band_templates) == 1
+
+
+def test_pan_only_scales_the_still_once(tmp_path: Path) -> None:
+    image_path = tmp_path / "img.png"
+    Image.new("RGB", (64, 64)).save(image_path)
+    generator = FFmpegVideoGenerator({"animation": {"mode": "pan_only"}, "video": {"fps": 30}})
+    scene = SimpleNamespace(
+        scene_id="S1",
+        duration=2.0,
+        narration_path=tmp_path / "n.wav",
+        image_path=image_path,
+        text_segments=[],
+        ken_burns_vector=(1.0, 0.0),
+    )
+    graph = generator._content_scene_graph(tmp_path, scene)
+
+    assert graph.inputs[:2] == ["-i", str(image_path)]
+    base = graph.filter_graph.split(";")[0]
+    assert base.index("scale=") < base.index("fps=30,loop=loop=59:size=1")
+    # The single frame is retimed once, before looping; no trailing fps filter.
+    assert graph.filter_graph.count("fps=") == 1
+
+
+def test_auto_preset_follows_program_length(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert renderer._pick_preset(60.0, has_kb=True) == "ultrafast"
+    assert renderer._pick_preset(3600.0, has_kb=False) == "veryfast"
+    assert renderer._pick_preset(3600.0, has_kb=True) == "superfast"
+
+    monkeypatch.setattr(renderer, "encoder_available", lambda name: False)
+    generator = FFmpegVideoGenerator({"animation": {"mode": "pan_only"}})
+    monkeypatch.setattr(generator, "_render_scene_dispatch", lambda *args: tmp_path / "s.mp4")
+    monkeypatch.setattr(renderer, "write_concat_list", lambda inputs, out: out)
+    monkeypatch.setattr(generator, "_mix_bgm", lambda *args, **kwargs: None)
+    scenes = [SimpleNamespace(scene_id="S1", scene_type="content", duration=1800.0, text_segments=[])]
+    generator.render(run_dir=tmp_path, scenes=scenes, output_path=tmp_path / "out.mp4", thumbnail_title="t")
+
+    args = renderer._encode_args(generator.render_cfg)
+    assert args[args.index("-preset") + 1] == "superfast"
+
+
+def test_static_opening_reads_overlay_as_rawvideo(tmp_path: Path) -> None:
+    generator = FFmpegVideoGenerator({})
+    scene = SimpleNamespace(scene_id="OP", duration=2.0, narration_path=tmp_path / "n.wav", text_segments=[])
+    graph = generator._opening_scene_graph(tmp_path, scene, "Title")
+
+    cfg = generator.render_cfg
+    overlay_args = graph.inputs[graph.inputs.index("-stream_loop") :]
+    assert overlay_args[overlay_args.index("-f") + 1] == "rawvideo"
+    assert overlay_args[overlay_args.index("-video_size") + 1] == f"{cfg.width}x{cfg.height}"
+    assert overlay_args[overlay_args.index("-i") + 1] == str(tmp_path / "overlays" / "OP_opening.raw")
+
+
+def test_overlays_are_reused_across_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config = {"ffmpeg": {"overlay_cache_dir": str(tmp_path / "cache")}}
+    segment = SimpleNamespace(segment_index=0, lines=["hello"])
+    first = FFmpegVideoGenerator(config)
+    band_path, geom = first._create_band_overlay(tmp_path / "run1", "S1", segment)
+    text_path = first._create_text_overlay(tmp_path / "run1", "S1", segment)
+
+    second = FFmpegVideoGenerator(config)
+    monkeypatch.setattr(second, "_draw_text_overlay", lambda lines: pytest.fail("redrawn"))
+    monkeypatch.setattr(second, "_draw_band_overlay", lambda lines: pytest.fail("redrawn"))
+    reused = second._create_text_overlay(tmp_path / "run2", "S1", segment)
+    reused_band, reused_geom = second._create_band_overlay(tmp_path / "run2", "S1", segment)
+
+    assert reused.read_bytes() == text_path.read_bytes()
+    assert reused.with_suffix(".raw").read_bytes() == text_path.with_suffix(".raw").read_bytes()
+    assert reused_geom == geom and reused_band.exists()
+    assert second._still_input_args(reused, 1.0) == first._still_input_args(text_path, 1.0)[:-1] + [
+        str(reused.with_suffix(".raw"))
+    ]
+
+
+def test_overlay_cache_shares_png_only_and_prunes_oldest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache = tmp_path / "xdg" / "longvideoai" / "overlays"
+    cache.mkdir(parents=True)
+    stale = cache / "stale.png"
+    stale.write_bytes(b"x" * 16000)
+    stale.with_suffix(".json").write_text("{}", encoding="utf-8")
+    os.utime(stale, (1, 1))
+    recent = cache / "recent.png"
+    recent.write_bytes(b"x" * 1000)
+    (cache / "legacy.raw").write_bytes(b"raw")
+
+    generator = FFmpegVideoGenerator({"ffmpeg": {"overlay_cache_max_mb": 0.02}})
+    assert generator._overlay_cache_root == cache
+    overlay = generator._create_text_overlay(tmp_path / "run", "S1", SimpleNamespace(segment_index=0, lines=["one"]))
+
+    assert overlay.with_suffix(".raw").exists()
+    assert not list(cache.glob("*.raw"))
+    assert not stale.exists() and not stale.with_suffix(".json").exists()
+    assert recent.exists() and len(list(cache.glob("*.png"))) == 2
+
+
+def test_mix_bgm_reuses_prepared_bgm_bed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bgm = tmp_path / "track.mp3"
+    bgm.write_bytes(b"mp3")
+    prepared: list[list[str]] = []
+    streamed: list[list[str]] = []
+
+    def fake_run(args: list[str]) -> None:
+        prepared.append(list(args))
+        Path(args[-1]).write_bytes(b"bed")
+
+    monkeypatch.setattr(renderer, "run_ffmpeg", fake_run)
+    monkeypatch.setattr(renderer, "run_ffmpeg_stream", lambda args, **kwargs: streamed.append(list(args)))
+    generator = FFmpegVideoGenerator({"bgm": {"selected": str(bgm)}, "ffmpeg": {"bgm_cache_dir": str(tmp_path / "bgm")}})
+    for duration in (200.0, 250.0):
+        generator._mix_bgm(tmp_path / "in.mp4", tmp_path / "out.mp4", total_duration=duration)
+
+    assert len(prepared) == 1
+    assert "atrim=0:duration=300," in prepared[0][prepared[0].index("-af") + 1]
+    for args in streamed:
+        bed = Path(args[args.index("-i", 2) + 1])
+        assert bed.parent == tmp_path / "bgm" and bed.name.startswith("track_300s_")
+        assert "-stream_loop" not in args
+        graph = args[args.index("-filter_complex") + 1]
+        assert "loudnorm=I=-30" not in graph
+
+
+def test_scene_waits_only_for_its_own_overlays(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"workers": 2}})
+    slow_done = threading.Event()
+    order: list[str] = []
+
+    def fake_text_overlay(run_dir: Path, scene_id: str, segment: object) -> Path:
+        if scene_id == "S2":
+            time.sleep(0.1)
+            slow_done.set()
+        return run_dir / f"{scene_id}.png"
+
+    def fake_dispatch(run_dir: Path, scene_dir: Path, scene: object, title: str) -> Path:
+        order.append(f"{scene.scene_id}:{'after' if slow_done.is_set() else 'before'}")
+        return scene_dir / f"{scene.scene_id}.mp4"
+
+    monkeypatch.setattr(generator, "_create_text_overlay", fake_text_overlay)
+    monkeypatch.setattr(generator, "_render_scene_dispatch", fake_dispatch)
+    monkeypatch.setattr(renderer, "write_concat_list", lambda inputs, out: out)
+    monkeypatch.setattr(generator, "_mix_bgm", lambda *args, **kwargs: None)
+    segment = SimpleNamespace(segment_index=0, lines=["hello"])
+    scenes = [
+        SimpleNamespace(scene_id=f"S{i}", scene_type="content", duration=1.0, text_segments=[segment]) for i in (1, 2)
+    ]
+    generator.render(run_dir=tmp_path, scenes=scenes, output_path=tmp_path / "out.mp4", thumbnail_title="t")
+
+    assert "S1:before" in order and "S2:after" in order
+
+
+def test_failed_scene_cancels_queued_scenes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"workers": 1}})
+    started: list[str] = []
+
+    def fake_dispatch(run_dir: Path, scene_dir: Path, scene: object, title: str) -> Path:
+        started.append(scene.scene_id)
+        raise RuntimeError("ffmpeg failed")
+
+    monkeypatch.setattr(generator, "_render_scene_dispatch", fake_dispatch)
+    scenes = [SimpleNamespace(scene_id=f"S{i}", scene_type="content", duration=1.0) for i in range(1, 5)]
+    with pytest.raises(RuntimeError):
+        generator.render(run_dir=tmp_path, scenes=scenes, output_path=tmp_path / "out.mp4", thumbnail_title="t")
+
+    assert started == ["S1"]
+
+
+def test_overlay_cache_key_tracks_layout_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({})
+    before = generator._overlay_digest("text", ["hello"])
+    monkeypatch.setattr(renderer, "_OVERLAY_CACHE_VERSION", renderer._OVERLAY_CACHE_VERSION + 1)
+
+    assert generator._overlay_digest("text", ["hello"]) != before
+    assert generator._overlay_digest("band", ["hello"]) != generator._overlay_digest("text", ["hello"])
+
+
+def test_font_postscript_name_is_looked_up_once() -> None:
+    renderer._ps_name_from_font.cache_clear()
+    config = {"text": {"font_path": "fonts/NotoSansJP-Bold.ttf"}}
+    first = FFmpegVideoGenerator(config)
+    second = FFmpegVideoGenerator(config)
+
+    assert first.ass_font_psname == second.ass_font_psname
+    info = renderer._ps_name_from_font.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_thread_budget_env_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LONGVIDEO_FFMPEG_THREADS", "3")
+    generator = FFmpegVideoGenerator({"ffmpeg": {"threads_per_worker": 1}})
+    args = renderer._encode_args(generator.render_cfg)
+
+    assert args[args.index("-threads") + 1] == "3"
+
+
+def test_identical_captions_are_drawn_once_per_process(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"overlay_cache_dir": ""}})
+    draw = generator._draw_text_overlay
+    calls: list[list[str]] = []
+
+    def counting_draw(lines: list[str]):
+        calls.append(lines)
+        return draw(lines)
+
+    monkeypatch.setattr(generator, "_draw_text_overlay", counting_draw)
+    segment = SimpleNamespace(segment_index=0, lines=["same"])
+    first = generator._create_text_overlay(tmp_path, "S1", segment)
+    second = generator._create_text_overlay(tmp_path, "S2", segment)
+    # Reusing S1's file name for new text must not leave a stale digest behind.
+    generator._create_text_overlay(tmp_path, "S1", SimpleNamespace(segment_index=0, lines=["other"]))
+    third = generator._create_text_overlay(tmp_path, "S3", segment)
+
+    assert calls == [["same"], ["other"]]
+    assert first != second and second.read_bytes() == third.read_bytes()
+    assert third.with_suffix(".raw").exists()
+
+
+def test_postscript_name_is_read_from_sfnt_name_table(tmp_path: Path) -> None:
+    font = Path(__file__).resolve().parents[1] / "fonts" / "NotoSansJP-Bold.ttf"
+    assert renderer._read_ps_name_sfnt(str(font)) == "NotoSansJP-Bold"
+
+    bogus = tmp_path / "not-a-font.ttf"
+    bogus.write_bytes(b"hello world")
+    assert renderer._read_ps_name_sfnt(str(bogus)) is None
+
+
+def test_caption_inputs_are_windowed_to_their_segment(tmp_path: Path) -> None:
+    generator = FFmpegVideoGenerator({})
+    segment = SimpleNamespace(segment_index=0, start_offset=1.25, duration=2.0, lines=["hello"])
+    scene = SimpleNamespace(
+        scene_id="S1", duration=6.0, narration_path=tmp_path / "n.wav", image_path=None, text_segments=[segment]
+    )
+    graph = generator._content_scene_graph(tmp_path, scene)
+
+    caption = graph.inputs[graph.inputs.index("-itsoffset") :]
+    assert caption[1] == "1.250"
+    assert caption[caption.index("-t") + 1] == "2.000"
+    assert "[1:v]overlay=" in graph.filter_graph and ":eof_action=pass[v0]" in graph.filter_graph
+    assert "enable=" not in graph.filter_graph
+
+
+def test_final_mux_reads_scenes_through_concat_demuxer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({})
+    streamed: list[list[str]] = []
+
+    def fake_dispatch(run_dir: Path, scene_dir: Path, scene: object, title: str) -> Path:
+        path = scene_dir / f"{scene.scene_id}.mp4"
+        path.write_bytes(b"mp4")
+        return path
+
+    monkeypatch.setattr(generator, "_render_scene_dispatch", fake_dispatch)
+    monkeypatch.setattr(generator, "_resolve_bgm_path", lambda: None)
+    monkeypatch.setattr(renderer, "run_ffmpeg", lambda args: pytest.fail("separate concat pass"))
+    monkeypatch.setattr(renderer, "run_ffmpeg_stream", lambda args, **kwargs: streamed.append(list(args)))
+    scenes = [SimpleNamespace(scene_id=f"S{i}", scene_type="content", duration=1.0, text_segments=[]) for i in (1, 2)]
+    generator.render(run_dir=tmp_path, scenes=scenes, output_path=tmp_path / "out.mp4", thumbnail_title="t")
+
+    (args,) = streamed
+    list_file = Path(args[args.index("-i") + 1])
+    assert args[: args.index("-i")] == ["-safe", "0", "-f", "concat"]
+    assert list_file.read_text(encoding="utf-8").count("file '") == 2
+    assert not (tmp_path / "temp_concat.mp4").exists()
+
+
+def test_caption_overlay_is_cropped_to_its_band(tmp_path: Path) -> None:
+    generator = FFmpegVideoGenerator({})
+    segment = SimpleNamespace(segment_index=0, start_offset=0.0, duration=1.0, lines=["hello"])
+    path = generator._create_text_overlay(tmp_path, "S1", segment)
+    x, bottom = generator._overlay_offsets[path]
+
+    with Image.open(path) as image:
+        assert image.width < generator.render_cfg.width
+        assert image.getbbox() == (0, 0, image.width, image.height)
+    assert x > 0 and bottom > 0
+
+    scene = SimpleNamespace(
+        scene_id="S1", duration=1.0, narration_path=tmp_path / "n.wav", image_path=None, text_segments=[segment]
+    )
+    graph = generator._content_scene_graph(tmp_path, scene)
+    assert f"[1:v]overlay=x={x}:y=720-h-{bottom}:eof_action=pass[v0]" in graph.filter_graph
+
+
+def test_fonts_are_loaded_once_per_process() -> None:
+    first = FFmpegVideoGenerator({})
+    second = FFmpegVideoGenerator({})
+
+    assert first._get_font(36) is second._get_font(36)
+    assert first._get_font(36, bold=True) is not first._get_font(36)
+    assert first._overlay_lock is second._overlay_lock
+
+
+def test_caption_scratch_surface_is_reset_between_draws() -> None:
+    generator = FFmpegVideoGenerator({})
+    generator._draw_text_overlay(["hello"])
+    reused, offset = generator._draw_text_overlay(["world"])
+    fresh, fresh_offset = FFmpegVideoGenerator({})._draw_text_overlay(["world"])
+
+    assert len(generator._band_scratch) == 1
+    assert offset == fresh_offset and reused.tobytes() == fresh.tobytes()
+
+
+def test_overlay_dir_is_created_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = FFmpegVideoGenerator({"ffmpeg": {"overlay_cache_dir": ""}})
+    made: list[Path] = []
+    mkdir = Path.mkdir
+
+    def counting_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        made.append(self)
+        mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    for i in range(3):
+        generator._create_text_overlay(tmp_path, "S1", SimpleNamespace(segment_index=i, lines=[f"line {i}"]))
+
+    assert made == [tmp_path / "overlays"]
+
+
+def test_typing_band_is_cropped_but_keeps_strip_geometry(tmp_path: Path) -> None:
+    generator = FFmpegVideoGenerator({"overlay": {"type": "typing"}})
+    segment = SimpleNamespace(segment_index=0, start_offset=0.0, duration=1.0, lines=["hello"])
+    path, geom = generator._create_band_overlay(tmp_path, "S1", segment)
+    x, bottom = generator._overlay_offsets[path]
+
+    with Image.open(path) as image:
+        # rounded_rectangle includes its right edge pixel.
+        assert image.width == generator.render_cfg.width - 2 * geom["horizontal_margin"] + 1
+        assert image.height + bottom < geom["band_height"]
+    assert x == geom["horizontal_margin"]
+
+    scene = SimpleNamespace(
+        scene_id="S1", duration=1.0, narration_path=tmp_path / "n.wav", image_path=None, text_segments=[segment]
+    )
+    graph = generator._content_scene_graph(tmp_path, scene)
+    assert f"[1:v]overlay=x={x}:y=720-h-{bottom}:eof_action=pass[v0]" in graph.filter_graph
+
+
+def test_intro_relief_scales_per_frame_only_during_the_intro() -> None:
+    graph = renderer._build_content_filter(
+        has_base_image=True,
+        w=1280,
+        h=720,
+        fps=30,
+        duration=4.0,
+        ken_zoom=0.1,
+        ken_offset=0.1,
+        ken_margin=0.1,
+        ken_motion=1.0,
+        ken_full_travel=False,
+        ken_max_margin=1.0,
+        ken_mode="pan_only",
+        ken_pan_extent=1.0,
+        ken_intro_relief=0.2,
+        ken_intro_seconds=1.0,
+        ken_vector=(1.0, 0.0),
+        overlays=[],
+    )
+    chains = graph.split(";")
+
+    intro = next(c for c in chains if c.startswith("[intro_src]"))
+    hold = next(c for c in chains if c.startswith("[hold_src]"))
+    assert "loop=loop=29:" in intro and "eval=frame" in intro
+    assert "loop=loop=89:" in hold and "eval=frame" not in hold
+    assert "(t+1.000000)/4.000000" in next(c for c in chains if c.startswith("[hold_in]"))
+    assert "[intro_base][hold_base]concat=n=2:v=1:a=0[base]" in chains
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from long_form.ffmpeg import runner  # noqa: E402
+
+
+def test_run_ffmpeg_parallel_overlaps_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    lock = threading.Lock()
+    active = peak = 0
+    ran: list[str] = []
+
+    def fake_run(args: list[str]) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+            ran.append(args[-1])
+
+    monkeypatch.setattr(runner, "run_ffmpeg", fake_run)
+    monkeypatch.setenv("LONGVIDEO_FFMPEG_PARALLEL", "3")
+    runner.run_ffmpeg_parallel([["-y", f"out{i}.mp4"] for i in range(6)])
+
+    assert sorted(ran) == [f"out{i}.mp4" for i in range(6)]
+    assert 1 < peak <= 3
+
+
+def test_run_ffmpeg_parallel_raises_first_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_run(args: list[str]) -> None:
+        if args[-1] == "bad.mp4":
+            raise RuntimeError("ffmpeg failed with exit code 1")
+
+    monkeypatch.setattr(runner, "run_ffmpeg", fake_run)
+    with pytest.raises(RuntimeError, match="exit code 1"):
+        runner.run_ffmpeg_parallel([["ok.mp4"], ["bad.mp4"], ["ok2.mp4"]], max_workers=2)
+
+
+def test_encoder_probe_timeout_reports_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    timeouts: list[float] = []
+
+    def hanging_run(cmd: list[str], **kwargs: object) -> None:
+        timeouts.append(kwargs["timeout"])
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    runner._listed_encoders.cache_clear()
+    runner.encoder_available.cache_clear()
+    monkeypatch.setattr(runner.subprocess, "run", hanging_run)
+    try:
+        assert runner._listed_encoders() == frozenset()
+        monkeypatch.setattr(runner, "_listed_encoders", lambda: frozenset({"h264_nvenc"}))
+        assert runner.encoder_available("h264_nvenc") is False
+    finally:
+        monkeypatch.undo()
+        runner._listed_encoders.cache_clear()
+        runner.encoder_available.cache_clear()
+    assert timeouts == [runner._PROBE_TIMEOUT_SEC] * 2
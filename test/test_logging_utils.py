@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import logging_utils  # noqa: E402
+from logging_utils import configure_logging  # noqa: E402
+
+
+def test_configure_logging_is_idempotent_and_writes_file(tmp_path: Path) -> None:
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    log_file = tmp_path / "logs" / "run.log"
+    try:
+        configure_logging("INFO", log_file)
+        handlers = list(root.handlers)
+        configure_logging("info", log_file)
+        assert root.handlers == handlers
+
+        logging.getLogger("lvai.test").info("hello from test")
+        logging_utils._stop_listener()  # flush queued records
+        assert "hello from test" in log_file.read_text(encoding="utf-8")
+    finally:
+        logging_utils._stop_listener()
+        logging_utils._configured = None
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import prompt_translator  # noqa: E402
+from prompt_translator import PromptTranslator  # noqa: E402
+
+
+class DummyResponse:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def test_translate_many_batches_unique_texts(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[tuple[str, str]]] = []
+
+    def fake_post(url: str, *, headers: dict[str, str], data: list[tuple[str, str]], timeout: float) -> DummyResponse:
+        calls.append(data)
+        texts = [value for key, value in data if key == "text"]
+        return DummyResponse({"translations": [{"text": f"EN:{text}"} for text in texts]})
+
+    monkeypatch.setattr(prompt_translator.requests, "post", fake_post)
+    translator = PromptTranslator({"apis": {"deepl": {"api_key": "key"}}})
+
+    result = translator.translate_many(["港", " 灯台 ", "", "港"])
+
+    assert result == ["EN:港", "EN:灯台", "", "EN:港"]
+    assert len(calls) == 1
+    assert [value for key, value in calls[0] if key == "text"] == ["港", "灯台"]
+    assert translator.translate("灯台") == "EN:灯台"
+    assert len(calls) == 1
@@ -458,7 +458,8 @@ class VideoGenerator:
         overlay_dir = run_dir / "overlays"
         overlay_dir.mkdir(parents=True, exist_ok=True)
         output_path = overlay_dir / f"{scene_id}_seg{segment.segment_index:02d}.png"
-        image.save(output_path, format="PNG")
+        # Intermediate overlay read back straight away; fast deflate beats small files.
+        image.save(output_path, format="PNG", compress_level=1, optimize=False)
         self._overlay_cache[cache_key] = output_path
         return output_path
 
@@ -496,7 +497,7 @@ class VideoGenerator:
         overlay_dir = run_dir / "overlays"
         overlay_dir.mkdir(parents=True, exist_ok=True)
         output_path = overlay_dir / f"{scene_id}_opening.png"
-        image.save(output_path, format="PNG")
+        image.save(output_path, format="PNG", compress_level=1, optimize=False)
         self._opening_cache[cache_key] = output_path
         return output_path
 
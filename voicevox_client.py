@@ -6,7 +6,7 @@ import logging
 import wave
 from array import array
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
@@ -20,8 +20,10 @@ class VoicevoxError(RuntimeError):
 class VoicevoxClient:
     """Thin wrapper around a locally running VOICEVOX engine."""
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], *, session: Optional[requests.Session] = None) -> None:
         voice_cfg = config.get("apis", {}).get("voicevox", {})
+        # A shared Session keeps connections alive across chunks; fall back to module-level calls.
+        self._http = session if session is not None else requests
         self.host = voice_cfg.get("host", "127.0.0.1")
         self.port = voice_cfg.get("port", 50021)
         self.speaker_id = voice_cfg.get("speaker_id", 3)
@@ -65,7 +67,7 @@ class VoicevoxClient:
         if self._connection_verified:
             return
         try:
-            response = requests.get(f"{self.base_url}/version", timeout=5)
+            response = self._http.get(f"{self.base_url}/version", timeout=5)
             response.raise_for_status()
             version = response.json()
             logger.info("VOICEVOX connected: %s", version)
@@ -116,7 +118,7 @@ class VoicevoxClient:
     def _create_audio_query(self, text: str) -> Dict[str, Any]:
         url = f"{self.base_url}/audio_query"
         params = {"text": text, "speaker": self.speaker_id}
-        response = requests.post(url, params=params, timeout=30)
+        response = self._http.post(url, params=params, timeout=30)
         response.raise_for_status()
         audio_query: Dict[str, Any] = response.json()
 
@@ -146,7 +148,7 @@ class VoicevoxClient:
         url = f"{self.base_url}/synthesis"
         params = {"speaker": self.speaker_id}
         headers = {"Content-Type": "application/json"}
-        response = requests.post(
+        response = self._http.post(
             url,
             params=params,
             data=json.dumps(audio_query),
@@ -173,7 +173,7 @@ class VideoRenderer:
             cache_dir = Path("temp") / "yukkuri_mode"
             cache_dir.mkdir(parents=True, exist_ok=True)
             sprite_path = cache_dir / f"placeholder_{spec.key}.png"
-            image.save(sprite_path, "PNG")
+            image.save(sprite_path, "PNG", compress_level=1)
             clip = ImageClip(str(sprite_path)).set_duration(duration)
 
         target_height = int(layout.height * spec.scale)
@@ -193,7 +193,7 @@ class VideoRenderer:
         image_path = cache_dir / f"band_{plan.index:03d}.png"
         if not image_path.exists():
             image = self._render_band_image(plan, image_path)
-            image.save(image_path, "PNG")
+            image.save(image_path, "PNG", compress_level=1)
         with Image.open(image_path) as loaded:
             band_height = loaded.height
         return (